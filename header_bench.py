@@ -0,0 +1,181 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from dataclasses import dataclass, asdict
+import statistics
+import subprocess
+import argparse
+import tempfile
+import shutil
+import json
+import time
+import os
+
+###################################################################################################
+# CONFIGURATION
+###################################################################################################
+
+# Generated header variants to benchmark (label -> path)
+HEADER_PATHS: dict[str, str] = {
+    "output.h": "output.h",
+    "output2.h": "output2.h",
+}
+
+# Host C compiler command (overridden by the CC environment variable)
+CC: str = os.environ.get("CC", "cc")
+
+# Flags passed to every preprocess/compile invocation
+CFLAGS: list[str] = ["-std=c11", "-O2"]
+
+# Number of timed runs per measurement (the minimum is reported)
+REPEAT: int = 5
+
+# Directory with extra probe translation units (*.c), None to use only the built-in probes
+PROBE_DIR: str | None = None
+
+# Built-in probe translation units, each is compiled with the header force-included
+PROBE_SOURCES: dict[str, str] = {
+    "empty": "int probe(void) { return 0; }\n",
+    "funcs": "".join(f"int probe_{i}(int x) {{ return x * {i} + 1; }}\n" for i in range(32)),
+}
+
+# Path of JSON results file (None to skip)
+JSON_PATH: str | None = None
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+@dataclass
+class bench_result_t:
+    header: str
+    probe: str
+    ok: bool
+    error: str
+    pp_time: float
+    pp_time_median: float
+    pp_bytes: int
+    pp_lines: int
+    cc_time: float
+    cc_time_median: float
+    obj_bytes: int
+
+# Run a command and return (elapsed seconds, completed process)
+def timed_run(cmd: list[str]) -> tuple[float, subprocess.CompletedProcess]:
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, stdout = subprocess.DEVNULL, stderr = subprocess.PIPE, text = True)
+    return time.perf_counter() - start, proc
+
+# Collect probe sources from the built-in list and the probe directory
+def load_probes(probe_dir: str | None) -> dict[str, str]:
+    probes: dict[str, str] = dict(PROBE_SOURCES)
+    if probe_dir:
+        for name in sorted(os.listdir(probe_dir)):
+            if name.endswith(".c"):
+                with open(os.path.join(probe_dir, name)) as file:
+                    probes[name[:-2]] = file.read()
+    return probes
+
+# Benchmark a single probe against a single header (None for the no-header baseline)
+def bench_probe(header: str | None, probe_name: str, probe_path: str, work_dir: str,
+                cc: str, cflags: list[str], repeat: int) -> bench_result_t:
+    inc_flags: list[str] = []
+    if header is not None:
+        inc_flags = ["-include", os.path.abspath(header)]
+    pp_path = os.path.join(work_dir, f'{probe_name}.i')
+    obj_path = os.path.join(work_dir, f'{probe_name}.o')
+    result = bench_result_t(header = header or "(none)", probe = probe_name, ok = True, error = "",
+                            pp_time = 0.0, pp_time_median = 0.0, pp_bytes = 0, pp_lines = 0,
+                            cc_time = 0.0, cc_time_median = 0.0, obj_bytes = 0)
+
+    # Time the preprocessor alone
+    pp_times: list[float] = []
+    for _ in range(repeat):
+        elapsed, proc = timed_run([cc, *cflags, *inc_flags, "-E", probe_path, "-o", pp_path])
+        if proc.returncode != 0:
+            result.ok = False
+            result.error = proc.stderr.strip().splitlines()[0] if proc.stderr.strip() else "preprocess failed"
+            return result
+        pp_times.append(elapsed)
+    result.pp_time = min(pp_times)
+    result.pp_time_median = statistics.median(pp_times)
+    result.pp_bytes = os.path.getsize(pp_path)
+    with open(pp_path, "rb") as file:
+        result.pp_lines = sum(1 for _ in file)
+
+    # Time the full compile to an object file
+    cc_times: list[float] = []
+    for _ in range(repeat):
+        elapsed, proc = timed_run([cc, *cflags, *inc_flags, "-c", probe_path, "-o", obj_path])
+        if proc.returncode != 0:
+            result.ok = False
+            errors = [x for x in proc.stderr.splitlines() if "error" in x]
+            result.error = errors[0].strip() if errors else "compile failed"
+            return result
+        cc_times.append(elapsed)
+    result.cc_time = min(cc_times)
+    result.cc_time_median = statistics.median(cc_times)
+    result.obj_bytes = os.path.getsize(obj_path)
+    return result
+
+# Benchmark every probe against every header, plus a no-header baseline
+def run_bench(headers: dict[str, str], probe_dir: str | None = None, cc: str = CC,
+              cflags: list[str] | None = None, repeat: int = REPEAT) -> list[bench_result_t]:
+    if shutil.which(cc) is None:
+        raise Exception(f'C compiler "{cc}" not found.')
+    cflags = CFLAGS if cflags is None else cflags
+    probes = load_probes(probe_dir)
+    results: list[bench_result_t] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        probe_paths: dict[str, str] = {}
+        for probe_name, probe_src in probes.items():
+            probe_paths[probe_name] = os.path.join(work_dir, f'{probe_name}.c')
+            with open(probe_paths[probe_name], "w") as file:
+                file.write(probe_src)
+        for label, header in [("(none)", None), *headers.items()]:
+            for probe_name, probe_path in probe_paths.items():
+                result = bench_probe(header, probe_name, probe_path, work_dir, cc, cflags, repeat)
+                result.header = label
+                results.append(result)
+    return results
+
+# Format benchmark results as an aligned text table
+def fmt_results(results: list[bench_result_t]) -> str:
+    rows: list[list[str]] = [["header", "probe", "pp ms", "pp lines", "pp KiB", "cc ms", "obj B"]]
+    for r in results:
+        if r.ok:
+            rows.append([r.header, r.probe, f'{r.pp_time * 1000:.1f}', str(r.pp_lines),
+                         f'{r.pp_bytes / 1024:.1f}', f'{r.cc_time * 1000:.1f}', str(r.obj_bytes)])
+        else:
+            rows.append([r.header, r.probe, f'FAILED: {r.error}'])
+    widths: list[int] = [max(len(row[i]) for row in rows if len(row) > 3 or i < 2) for i in range(len(rows[0]))]
+    text = ""
+    for row in rows:
+        text += "   ".join(f'{x:<{w}}' if i < 2 or len(row) < 4 else f'{x:>{w}}'
+                           for i, (x, w) in enumerate(zip(row, widths))).rstrip()
+        text += "\n"
+    return text
+
+###################################################################################################
+# IMPLEMENTATION
+###################################################################################################
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description = "Benchmark downstream compile cost of generated headers.")
+    arg_parser.add_argument("headers", nargs = "*", help = "header paths (defaults to HEADER_PATHS)")
+    arg_parser.add_argument("--cc", default = CC, help = "host C compiler")
+    arg_parser.add_argument("--repeat", type = int, default = REPEAT, help = "timed runs per measurement")
+    arg_parser.add_argument("--probe-dir", default = PROBE_DIR, help = "directory of extra probe *.c files")
+    arg_parser.add_argument("--json", default = JSON_PATH, help = "write results as JSON to this path")
+    args = arg_parser.parse_args()
+
+    # Headers are labeled by their given paths, so headers sharing a file name (old/output.h and
+    # new/output.h) are all benchmarked
+    headers = {x: x for x in args.headers} if args.headers else HEADER_PATHS
+    results = run_bench(headers, probe_dir = args.probe_dir, cc = args.cc, repeat = args.repeat)
+    print(fmt_results(results), end = "")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(x) for x in results], file, indent = 2)
@@ -0,0 +1,52 @@
+###################################################################################################
+# PACKAGE API
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+
+# Standard libraries
+import importlib
+
+# Public names and the modules defining them, imported on first access so the CLI starts fast
+API: dict[str, str] = {
+    "config_t": "config", "load_config": "config",
+    "SVDError": "common", "fmt_desc": "common", "write_output": "common",
+    "find_svd_path": "load", "find_svd_paths": "load", "load_svd_file": "load",
+    "load_device": "load", "load_devices": "load",
+    "merge_devices": "merge",
+    "patch_t": "patch", "load_patches": "patch", "apply_patches": "patch",
+    "enum_device_t": "transform", "fill_defaults": "transform", "share_layouts": "transform",
+    "normalize_device": "transform", "de_enum_device": "transform", "irq_entry_t": "transform",
+    "index_irqs": "transform", "flatten_arrays": "transform",
+    "emit_macro_header": "emit_macro",
+    "emit_enum_header": "emit_enum",
+    "emit_array_header": "emit_array",
+    "STYLES": "pipeline", "generate": "pipeline",
+    "stage_cache_t": "stages", "generate_staged": "stages",
+    "family_headers_t": "family", "load_family": "family", "generate_family": "family",
+    "doc_entry_t": "sidecar", "split_descriptions": "sidecar", "write_sidecar": "sidecar",
+    "open_svd": "archive",
+    "lookup_result_t": "lookup", "address_index_t": "lookup",
+    "reg_layout_t": "decode", "decoder_t": "decode",
+    "export_sqlite": "export_sqlite",
+    "change_t": "diff", "diff_devices": "diff", "format_diff_report": "diff", "format_diff_json": "diff",
+    "query_service_t": "server",
+    "index_entry_t": "index", "svd_index_t": "index", "load_index": "index",
+    "device_layout_t": "backends", "device_layout": "backends", "prepared_t": "backends", "backend_t": "backends",
+    "register_backend": "backends", "emit_backends": "backends", "file_sink_t": "backends", "write_sinks": "backends",
+    "table_t": "footprint", "footprint_t": "footprint", "header_footprint": "footprint", "write_footprint": "footprint",
+}
+
+# Resolve public names and submodules on first access
+def __getattr__(name: str):
+    if name not in API:
+        try:
+            return importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'.{API[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(API))
@@ -0,0 +1,9 @@
+###################################################################################################
+# COMMAND LINE ENTRY POINT -> python -m tal_svd
+###################################################################################################
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
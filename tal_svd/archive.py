@@ -0,0 +1,116 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries only, used on the CLI fast path
+from contextlib import contextmanager
+import xml.etree.ElementTree as ET
+import zipfile
+import gzip
+import lzma
+import os
+
+# Package modules
+from .common import SVDError
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Separator between a pack archive path and the device name or member path of an SVD inside it
+# (e.g. "Keil.STM32F4xx_DFP.2.17.1.pack!STM32F429x")
+PACK_SEPARATOR: str = "!"
+
+# File name suffixes of CMSIS-Pack archives (zip files)
+PACK_SUFFIXES: tuple[str, ...] = (".pack", ".zip")
+
+# File name suffixes of compressed SVD files and their stream openers
+COMPRESSED_SUFFIXES: dict[str, object] = {".gz": gzip.open, ".xz": lzma.open}
+
+###################################################################################################
+# PACK ARCHIVES
+###################################################################################################
+
+# Check whether a path names a pack archive
+def is_pack_path(path: str) -> bool:
+    return path.lower().endswith(PACK_SUFFIXES)
+
+# Split an SVD path into the file on disk and the device name or member inside a pack (or None)
+def split_pack_path(path: str) -> tuple[str, str | None]:
+    if PACK_SEPARATOR in path:
+        archive_path, member = path.rsplit(PACK_SEPARATOR, 1)
+        if is_pack_path(archive_path):
+            return archive_path, member
+    return path, None
+
+# Strip the namespace of an XML tag
+def local_tag(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+# Map device and variant names to SVD members using the pack description (.pdsc) file, SVD paths of
+# debug elements are inherited from the enclosing family and sub-family
+def read_pdsc_svds(pack: zipfile.ZipFile) -> dict[str, str]:
+    svds: dict[str, str] = {}
+    for member in pack.namelist():
+        if not member.lower().endswith(".pdsc"):
+            continue
+        with pack.open(member) as file:
+            root = ET.parse(file).getroot()
+
+        def visit(elem: ET.Element, svd_path: str | None) -> None:
+            for child in elem:
+                tag = local_tag(child.tag)
+                if tag not in ("devices", "family", "subFamily", "device", "variant"):
+                    continue
+                child_svd = next((x.get("svd") for x in child if local_tag(x.tag) == "debug" and x.get("svd")), svd_path)
+                name = child.get("Dvariant") if tag == "variant" else child.get("Dname")
+                if name and child_svd:
+                    svds.setdefault(name.lower(), child_svd.replace("\\", "/"))
+                visit(child, child_svd)
+
+        visit(root, None)
+    return svds
+
+# Pick the SVD member of a pack archive by member path, file name or device name
+def find_pack_member(pack: zipfile.ZipFile, name: str | None) -> str:
+    svd_members = [x for x in pack.namelist() if x.lower().endswith(".svd")]
+    if name is None:
+        if len(svd_members) == 1:
+            return svd_members[0]
+        raise SVDError(f'Pack {pack.filename} holds {len(svd_members)} SVD files, select one by device name.')
+    key = name.lower()
+    for member in svd_members:
+        if member.lower() == key:
+            return member
+    for member in svd_members:
+        if os.path.basename(member).lower() in (key, key + ".svd"):
+            return member
+    svd_path = read_pdsc_svds(pack).get(key)
+    if svd_path is not None:
+        for member in svd_members:
+            if member.lower().endswith(svd_path.lower()):
+                return member
+    raise SVDError(f'No SVD file for {name} in pack {pack.filename}.')
+
+# List the SVD members of a pack archive with their (uncompressed) sizes
+def pack_members(path: str) -> dict[str, int]:
+    with zipfile.ZipFile(path) as pack:
+        return {x.filename: x.file_size for x in pack.infolist() if x.filename.lower().endswith(".svd")}
+
+###################################################################################################
+# SVD STREAMS
+###################################################################################################
+
+# Open an SVD file, a compressed SVD file (.gz/.xz) or an SVD inside a pack archive as a binary
+# stream, decompressing on the fly without temporary files
+@contextmanager
+def open_svd(path: str):
+    file_path, member = split_pack_path(path)
+    if is_pack_path(file_path):
+        with zipfile.ZipFile(file_path) as pack:
+            with pack.open(find_pack_member(pack, member)) as file:
+                yield file
+        return
+    opener = COMPRESSED_SUFFIXES.get(os.path.splitext(file_path)[1].lower(), open)
+    with opener(file_path, "rb") as file:
+        yield file
@@ -0,0 +1,251 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass, field, asdict
+from typing import Callable
+import logging
+import json
+import os
+
+# Package modules
+from .config import config_t
+from .common import SVDError, write_output
+from .merge import merge_devices
+from .transform import (enum_device_t, irq_entry_t, fill_defaults, share_layouts, normalize_device, de_enum_device,
+                        index_irqs, irq_description)
+from .emit_macro import emit_macro_header
+from .emit_enum import emit_enum_header
+from .emit_array import emit_array_header
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# SHARED LAYOUT
+###################################################################################################
+
+# Layout of a field within its register
+@dataclass
+class field_layout_t:
+    name: str
+    bit_offset: int
+    bit_width: int
+    mask: int
+    description: str
+
+# Layout of a register (absolute address, size in bits)
+@dataclass
+class register_layout_t:
+    name: str
+    address: int
+    size: int
+    access: str | None
+    reset_value: int | None
+    description: str
+    dim_name: str | None = None
+    dim_index: int | None = None
+    fields: list[field_layout_t] = field(default_factory = list)
+
+# Layout of a peripheral (size of its address blocks in bytes)
+@dataclass
+class periph_layout_t:
+    name: str
+    base_address: int
+    size: int | None
+    derived_from: str | None
+    description: str
+    dim_name: str | None = None
+    dim_index: int | None = None
+    registers: list[register_layout_t] = field(default_factory = list)
+
+# Layout of a normalized device (SVD arrays flattened into elements keeping their array metadata)
+# and its IRQ index, computed in one traversal. Only data backends (JSON) emit from it: the header
+# emitters render from their own prepared SVD device forms (see prepared_t), which are what a run
+# shares between header styles
+@dataclass
+class device_layout_t:
+    name: str
+    peripherals: list[periph_layout_t]
+    irq_index: dict[int, list[irq_entry_t]]
+
+# Compute the layout of a normalized device
+def device_layout(device: svd.parser.SVDDevice) -> device_layout_t:
+    peripherals: list[periph_layout_t] = []
+    for periph in device.peripherals:
+        blocks = periph.address_blocks or []
+        periph_layout = periph_layout_t(name = periph.name, base_address = periph.base_address,
+                                        size = max((x.offset + x.size for x in blocks), default = None),
+                                        derived_from = periph.derived_from, description = periph.description,
+                                        dim_name = periph.dim_name, dim_index = periph.dim_index)
+        for reg in periph.registers or []:
+            size = reg.size or device.width or 32
+            reg_layout = register_layout_t(name = reg.name, address = periph.base_address + reg.address_offset,
+                                           size = size, access = reg.access.value if reg.access is not None else None,
+                                           reset_value = reg.reset_value, description = reg.description,
+                                           dim_name = reg.dim_name, dim_index = reg.dim_index)
+            for fld in reg.fields or []:
+                reg_layout.fields.append(field_layout_t(name = fld.name, bit_offset = fld.bit_offset,
+                                                        bit_width = fld.bit_width,
+                                                        mask = ((1 << fld.bit_width) - 1) << fld.bit_offset,
+                                                        description = fld.description))
+            periph_layout.registers.append(reg_layout)
+        peripherals.append(periph_layout)
+    return device_layout_t(name = device.name, peripherals = peripherals, irq_index = index_irqs(device))
+
+###################################################################################################
+# PREPARED DEVICES
+###################################################################################################
+
+# Source of each device form ("devices" are the loaded core devices)
+FORM_SOURCES: dict[str, str] = {"macro": "devices", "normalized": "devices", "enum": "normalized", "layout": "normalized"}
+
+# Emission rank of the backends using each form: backends using forms that consume their source (when
+# nothing else still needs it) come after the backends using the source
+FORM_RANKS: dict[str, int] = {"macro": 0, "normalized": 1, "layout": 1, "enum": 2}
+
+# Loaded core devices and the forms backends emit from (the macro, normalized and de-enumerated SVD
+# devices of the header styles, the layout of data backends), each computed once on first use and
+# shared by every backend of a run (backends must not modify them), a form is computed in place from
+# its source when no pending backend needs the source anymore
+class prepared_t:
+
+    def __init__(self, devices: list[svd.parser.SVDDevice], config: config_t, in_place: bool = False):
+        self.devices = devices
+        self.config = config
+        self.in_place = in_place
+        self.forms: dict[str, object] = {}
+        self.pending: list[tuple[str, ...]] = []
+
+    # Check whether a pending backend still needs the source of a form once the form is computed
+    def source_needed(self, name: str) -> bool:
+        source = FORM_SOURCES[name]
+        for forms in self.pending:
+            for x in forms:
+                while x not in (name, source, "devices") and x not in self.forms:
+                    x = FORM_SOURCES[x]
+                if x == source:
+                    return True
+        return False
+
+    # Compute a form once, compute(in_place) may modify the source of the form when in_place is set
+    def form(self, name: str, compute: Callable[[bool], object]) -> object:
+        if name not in self.forms:
+            in_place = not self.source_needed(name) and (FORM_SOURCES[name] != "devices" or self.in_place)
+            log.debug(f'Preparing {name} device{" in place" if in_place else ""}...')
+            self.forms[name] = compute(in_place)
+        return self.forms[name]
+
+    # Merged device with default descriptions and access types (macro style)
+    def macro_device(self) -> svd.parser.SVDDevice:
+        def compute(in_place: bool):
+            device = self.devices[0]
+            if len(self.devices) > 1:
+                device = merge_devices(self.devices[0], self.devices[1], self.config, in_place = in_place)
+                in_place = True
+            device = fill_defaults(device, self.config, in_place = in_place)
+            if self.config.share_periph_layouts:
+                device = share_layouts(device, self.config, in_place = True)
+            return device
+        return self.form("macro", compute)
+
+    # Normalized core 1 device (array style)
+    def normalized_device(self) -> svd.parser.SVDDevice:
+        return self.form("normalized", lambda x: normalize_device(self.devices[0], self.config, in_place = x))
+
+    # De-enumerated core 1 device (enum style)
+    def enum_device(self) -> enum_device_t:
+        return self.form("enum", lambda x: de_enum_device(self.normalized_device(), self.config, in_place = x))
+
+    # Layout of the normalized core 1 device
+    def layout(self) -> device_layout_t:
+        return self.form("layout", lambda x: device_layout(self.normalized_device()))
+
+###################################################################################################
+# BACKENDS
+###################################################################################################
+
+# JSON document of the shared layout: peripherals, registers and fields, and interrupts listing the
+# peripherals sharing them
+def emit_json(prepared: prepared_t, config: config_t) -> str:
+    layout = prepared.layout()
+    interrupts = [{"value": x, "name": y[0].name, "description": irq_description(y, y[0].name),
+                   "peripherals": list(dict.fromkeys(z.periph for z in y))} for x, y in sorted(layout.irq_index.items())]
+    return json.dumps({"device": layout.name, "peripherals": [asdict(x) for x in layout.peripherals],
+                       "interrupts": interrupts}, indent = 2) + "\n"
+
+# Emitter backend: renders its output from the prepared device forms it uses
+@dataclass
+class backend_t:
+    emit: Callable[[prepared_t, config_t], str]
+    forms: tuple[str, ...]
+
+# Emitter backends by name
+BACKENDS: dict[str, backend_t] = {
+    "macro": backend_t(emit = lambda prepared, config: emit_macro_header(prepared.macro_device(), config),
+                       forms = ("macro",)),
+    "enum": backend_t(emit = lambda prepared, config: emit_enum_header(prepared.enum_device(), config),
+                      forms = ("enum",)),
+    "array": backend_t(emit = lambda prepared, config: emit_array_header(prepared.normalized_device(), config),
+                       forms = ("normalized",)),
+    "json": backend_t(emit = emit_json, forms = ("layout",))
+}
+
+# Register an emitter backend using the given device forms (replacing any backend of the same name)
+def register_backend(name: str, emit: Callable[[prepared_t, config_t], str], forms: tuple[str, ...]) -> None:
+    unknown = [x for x in forms if x not in FORM_SOURCES]
+    if unknown:
+        raise SVDError(f'Unknown device form "{unknown[0]}" (available: {", ".join(FORM_SOURCES)}).')
+    BACKENDS[name] = backend_t(emit = emit, forms = forms)
+
+###################################################################################################
+# SINKS
+###################################################################################################
+
+# Sink writing a backend's output to a file, leaving the file untouched when unchanged
+class file_sink_t:
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, text: str) -> None:
+        old_text: str | None = None
+        if os.path.isfile(self.path):
+            with open(self.path) as file:
+                old_text = file.read()
+        if text != old_text:
+            write_output(text, self.path)
+            log.info(f'Wrote {self.path}.')
+
+# Hand emitted outputs to the sinks of their backends (once every output passed its checks)
+def write_sinks(texts: dict[str, str], sinks: dict[str, Callable[[str], None]]) -> None:
+    for name, sink in sinks.items():
+        sink(texts[name])
+
+###################################################################################################
+# MULTI-BACKEND EMISSION
+###################################################################################################
+
+# Emit the outputs of several backends from devices prepared once, handing each output to the sink
+# of its backend (if any) and returning the outputs by backend name (the loaded devices may be
+# modified when in_place is set)
+def emit_backends(devices: list[svd.parser.SVDDevice], config: config_t, backends: list[str],
+                  sinks: dict[str, Callable[[str], None]] | None = None, in_place: bool = False) -> dict[str, str]:
+    sinks = sinks or {}
+    names = list(dict.fromkeys(list(backends) + list(sinks)))
+    unknown = [x for x in names if x not in BACKENDS]
+    if unknown:
+        raise SVDError(f'Unknown output backend "{unknown[0]}" (available: {", ".join(BACKENDS)}).')
+    names.sort(key = lambda x: max((FORM_RANKS[y] for y in BACKENDS[x].forms), default = 0))
+    prepared = prepared_t(devices, config, in_place = in_place)
+    prepared.pending = [BACKENDS[x].forms for x in names]
+    texts: dict[str, str] = {}
+    for name in names:
+        texts[name] = BACKENDS[name].emit(prepared, config)
+        prepared.pending.pop(0)
+        if name in sinks:
+            sinks[name](texts[name])
+    return texts
@@ -0,0 +1,345 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries only, package modules needing cmsis_svd are imported when a command needs them
+import argparse
+import logging
+import time
+import sys
+import os
+
+# Package modules
+from .fingerprint import (read_config_values, input_paths, output_paths, fingerprint, is_up_to_date, write_stamp,
+                          touch_outputs, write_depfile)
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# COMMANDS
+###################################################################################################
+
+# Generate the output of a config file, skipping SVD parsing when the output is up to date
+def generate_config(config_path: str, force: bool = False, depfile_path: str | None = None) -> None:
+    start = time.perf_counter()
+    values = read_config_values(config_path)
+    output_path = values.get("output_path")
+    depfile_path = depfile_path or values.get("depfile_path")
+    paths = input_paths(config_path, values)
+    outputs = output_paths(values)
+    if depfile_path is not None and output_path is not None:
+        write_depfile(depfile_path, outputs, paths)
+    fp = fingerprint(config_path, values)
+    if output_path is not None and not force and is_up_to_date(outputs, fp):
+        if depfile_path is not None:
+            touch_outputs(outputs, paths)
+            write_stamp(outputs, fp)
+        log.info(f'{output_path} is up to date.')
+        return
+    from .config import load_config
+    from .common import write_output
+    from .footprint import wants_footprint, footprint_backends, write_footprint
+    config = load_config(config_path)
+    if config.family_svd_names:
+        from .family import load_family, generate_family, write_device_headers
+        headers = generate_family(load_family(config), config, in_place = True)
+        write_device_headers(headers)
+        text = headers.shared
+    elif config.extra_outputs or wants_footprint(config):
+        from .load import load_devices
+        from .backends import emit_backends, file_sink_t, write_sinks
+        backends = [config.style, *footprint_backends(config), *config.extra_outputs]
+        texts = emit_backends(load_devices(config), config, backends, in_place = True)
+        write_footprint(texts, config)
+        write_sinks(texts, {x: file_sink_t(y) for x, y in config.extra_outputs.items()})
+        text = texts[config.style]
+    elif config.stage_cache:
+        from .stages import STAGE_CACHE_DIR, stage_cache_t, generate_staged
+        text = generate_staged(config, stage_cache_t(STAGE_CACHE_DIR))
+    else:
+        from .load import load_devices
+        from .pipeline import generate
+        text = generate(load_devices(config), config, in_place = True)
+    from .sidecar import write_sidecar
+    text = write_sidecar(text, config)
+    if output_path is None:
+        sys.stdout.write(text)
+        return
+    old_text: str | None = None
+    if os.path.isfile(output_path):
+        with open(output_path) as file:
+            old_text = file.read()
+    if text != old_text:
+        write_output(text, output_path)
+    if depfile_path is not None:
+        touch_outputs(outputs, paths)
+    write_stamp(outputs, fp)
+    log.info(f'Wrote {output_path} in {(time.perf_counter() - start) * 1000:.0f} ms.')
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    if args.depfile is not None and len(args.configs) > 1:
+        log.error("--depfile requires a single config file.")
+        return 2
+    status = 0
+    for config_path in args.configs:
+        try:
+            generate_config(config_path, force = args.force, depfile_path = args.depfile)
+        except Exception as e:
+            log.error(f'Generation failed for {config_path}: {e}')
+            status = 1
+    return status
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    from .watch import watcher_t
+    try:
+        watcher_t(args.configs).run(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def cmd_index(args: argparse.Namespace) -> int:
+    from .index import load_index
+    index = load_index(args.svd_pkg_path, args.index)
+    log.info(f'{len(index.entries)} SVD files indexed in {index.index_path}.')
+    return 0
+
+def cmd_devices(args: argparse.Namespace) -> int:
+    from .common import SVDError
+    from .index import load_index
+    index = load_index(args.svd_pkg_path, args.index, refresh = not args.no_refresh)
+    status = 0
+    if args.names:
+        entries = []
+        for name in args.names:
+            try:
+                entries.append(index.find(name, vendor = args.vendor))
+            except SVDError as e:
+                log.error(e)
+                status = 1
+    elif args.search is not None:
+        entries = index.search(args.search, vendor = args.vendor)
+    else:
+        entries = index.select(vendor = args.vendor, pattern = args.match, cpu = args.cpu)
+    for entry in entries:
+        if args.paths:
+            print(index.full_path(entry))
+        else:
+            print(f'{entry.vendor:<20} {entry.device:<24} {entry.cpu or "-":<8} {entry.path}')
+    return status
+
+# Load the SVD device of one core of a config file
+def load_core_device(config_path: str, core: int):
+    from .common import SVDError
+    from .config import load_config
+    from .load import load_device
+    config = load_config(config_path)
+    svd_names = [config.core1_svd_name, config.core2_svd_name]
+    if core not in (1, 2) or svd_names[core - 1] is None:
+        raise SVDError(f'Core {core} is not configured in {config_path}.')
+    return load_device(config, svd_names[core - 1])
+
+def cmd_lookup(args: argparse.Namespace) -> int:
+    from .common import SVDError
+    from .lookup import address_index_t
+    try:
+        index = address_index_t(load_core_device(args.config, args.core))
+        addresses = read_values(args.addresses, args.file, args.binary)
+    except (SVDError, OSError) as e:
+        log.error(e)
+        return 1
+    periph_index, reg_index, lane = index.lookup_many(addresses)
+    lines = []
+    for address, p, r, b in zip(addresses.tolist(), periph_index.tolist(), reg_index.tolist(), lane.tolist()):
+        if p < 0:
+            lines.append(f'0x{address:08X}  -')
+        elif r < 0:
+            lines.append(f'0x{address:08X}  {index.periph_names[p]}')
+        else:
+            lines.append(f'0x{address:08X}  {index.periph_names[p]} {index.reg_names[r]} +{b}')
+    sys.stdout.write("\n".join(lines) + "\n" if lines else "")
+    return 0 if (periph_index >= 0).all() else 1
+
+# Integer value of an argument, checked to fit the 64-bit unsigned lookup and decode tables
+def parse_value(value: str) -> int:
+    from .common import SVDError
+    try:
+        number = int(value, 0)
+    except ValueError:
+        raise SVDError(f'Invalid value "{value}".')
+    if not 0 <= number < 2 ** 64:
+        raise SVDError(f'Value {value} is out of range (0 to 2**64-1).')
+    return number
+
+# Read integer values from arguments, a whitespace separated text file or a binary file of
+# little-endian 32-bit words
+def read_values(values: list[str], path: str | None, binary: bool):
+    import numpy as np
+    if path is not None and binary:
+        return np.fromfile(path, dtype = "<u4").astype(np.uint64)
+    if path is not None:
+        with open(path) as file:
+            values = file.read().split()
+    return np.asarray([parse_value(x) for x in values], dtype = np.uint64)
+
+def cmd_decode(args: argparse.Namespace) -> int:
+    import numpy as np
+    from .common import SVDError
+    from .decode import decoder_t
+    try:
+        layout = decoder_t(load_core_device(args.config, args.core)).layout(args.register)
+        values = read_values(args.values, args.file, args.binary)
+    except (SVDError, OSError) as e:
+        log.error(e)
+        return 1
+    decoded = layout.decode(values)
+    names = layout.field_names
+    if args.changed:
+        keep = layout.diff_reset(values).any(axis = 0)
+        decoded = decoded[:, keep]
+        names = [x for x, k in zip(names, keep.tolist()) if k]
+    np.savetxt(sys.stdout, np.column_stack([values, decoded]), fmt = "%d", delimiter = ",",
+               header = ",".join(["value"] + names), comments = "")
+    return 0
+
+def cmd_dump(args: argparse.Namespace) -> int:
+    from .common import SVDError
+    from .decode import decoder_t
+    try:
+        decoder = decoder_t(load_core_device(args.config, args.core))
+        with open(args.dump, "rb") as file:
+            dump = file.read()
+        base_address = int(args.base, 0) if args.base is not None else decoder.base_address(args.peripheral)
+        rows = decoder.decode_dump(args.peripheral, dump, base_address)
+    except (SVDError, OSError, ValueError) as e:
+        log.error(e)
+        return 1
+    for reg, name, value, reset, is_changed in rows:
+        if is_changed or not args.changed:
+            print(f'{"*" if is_changed else " "} {reg}.{name} = 0x{value:X} (reset 0x{reset:X})')
+    return 0
+
+def cmd_sqlite(args: argparse.Namespace) -> int:
+    from .config import load_config
+    from .load import load_devices
+    from .export_sqlite import export_sqlite
+    start = time.perf_counter()
+    config = load_config(args.config)
+    export_sqlite(load_devices(config), args.output, [config.core1_prefix, config.core2_prefix])
+    log.info(f'Wrote {args.output} in {(time.perf_counter() - start) * 1000:.0f} ms.')
+    return 0
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    from .config import config_t, load_config
+    from .common import write_output
+    from .load import load_svd_files, patch_devices
+    from .diff import diff_devices, format_diff_report, format_diff_json
+    if args.config is not None:
+        config = load_config(args.config)
+    else:
+        config = config_t(svd_pkg_path = os.path.dirname(args.old), vendor_name = "", core1_svd_name = os.path.basename(args.old))
+    old, new = patch_devices(config, load_svd_files(config, [args.old, args.new]))
+    changes = diff_devices(old, new)
+    if args.json:
+        text = format_diff_json(changes, args.old, args.new)
+    else:
+        text = format_diff_report(changes, args.old, args.new)
+    if args.output is not None:
+        write_output(text, args.output)
+    else:
+        sys.stdout.write(text)
+    return 1 if changes else 0
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from .server import query_service_t, serve
+    try:
+        serve(query_service_t(args.configs, cache_size = args.cache_size), port = args.port, socket_path = args.socket)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+###################################################################################################
+# IMPLEMENTATION
+###################################################################################################
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(prog = "tal_svd", description = "Generate C headers from CMSIS-SVD files.")
+    commands = arg_parser.add_subparsers(dest = "command", required = True)
+
+    generate_parser = commands.add_parser("generate", help = "generate outputs that are out of date")
+    generate_parser.add_argument("configs", nargs = "+", help = "TOML config files")
+    generate_parser.add_argument("--force", action = "store_true", help = "regenerate even if up to date")
+    generate_parser.add_argument("--depfile", help = "write a Makefile-style depfile (overrides depfile_path)")
+    generate_parser.set_defaults(func = cmd_generate)
+
+    watch_parser = commands.add_parser("watch", help = "regenerate outputs when SVD or config files change")
+    watch_parser.add_argument("configs", nargs = "+", help = "TOML config files")
+    watch_parser.add_argument("--interval", type = float, default = 0.25, help = "poll interval in seconds")
+    watch_parser.set_defaults(func = cmd_watch)
+
+    index_parser = commands.add_parser("index", help = "build or refresh the device index of an SVD data directory")
+    index_parser.add_argument("svd_pkg_path", help = "SVD data directory")
+    index_parser.add_argument("--index", help = "index file path (default: inside the SVD data directory)")
+    index_parser.set_defaults(func = cmd_index)
+
+    devices_parser = commands.add_parser("devices", help = "look up, search or select indexed devices")
+    devices_parser.add_argument("svd_pkg_path", help = "SVD data directory")
+    devices_parser.add_argument("names", nargs = "*", help = "exact device or file names to look up")
+    devices_parser.add_argument("--search", help = "fuzzy device name search")
+    devices_parser.add_argument("--match", help = "device name glob pattern")
+    devices_parser.add_argument("--vendor", help = "vendor folder name")
+    devices_parser.add_argument("--cpu", help = "CPU name (e.g. CM4)")
+    devices_parser.add_argument("--paths", action = "store_true", help = "print only SVD file paths")
+    devices_parser.add_argument("--index", help = "index file path (default: inside the SVD data directory)")
+    devices_parser.add_argument("--no-refresh", action = "store_true", help = "use the index without checking for changes")
+    devices_parser.set_defaults(func = cmd_devices)
+
+    lookup_parser = commands.add_parser("lookup", help = "map bus addresses to peripherals, registers and byte lanes")
+    lookup_parser.add_argument("config", help = "TOML config file")
+    lookup_parser.add_argument("addresses", nargs = "*", help = "addresses (e.g. 0x40023800)")
+    lookup_parser.add_argument("--file", help = "read addresses from a file (whitespace separated)")
+    lookup_parser.add_argument("--binary", action = "store_true", help = "address file holds little-endian 32-bit words")
+    lookup_parser.add_argument("--core", type = int, default = 1, help = "core whose SVD file is used (default: 1)")
+    lookup_parser.set_defaults(func = cmd_lookup)
+
+    decode_parser = commands.add_parser("decode", help = "decode register values or sampled traces into fields (CSV)")
+    decode_parser.add_argument("config", help = "TOML config file")
+    decode_parser.add_argument("register", help = "register (PERIPHERAL.REGISTER)")
+    decode_parser.add_argument("values", nargs = "*", help = "register values")
+    decode_parser.add_argument("--file", help = "read register values from a file (whitespace separated)")
+    decode_parser.add_argument("--binary", action = "store_true", help = "value file holds little-endian 32-bit words")
+    decode_parser.add_argument("--changed", action = "store_true", help = "only show fields that differ from reset values")
+    decode_parser.add_argument("--core", type = int, default = 1, help = "core whose SVD file is used (default: 1)")
+    decode_parser.set_defaults(func = cmd_decode)
+
+    dump_parser = commands.add_parser("dump", help = "decode a binary register dump of a peripheral and diff it against reset values")
+    dump_parser.add_argument("config", help = "TOML config file")
+    dump_parser.add_argument("peripheral", help = "peripheral the dump was taken from")
+    dump_parser.add_argument("dump", help = "binary little-endian memory dump")
+    dump_parser.add_argument("--base", help = "address of the first dump byte (default: peripheral base address)")
+    dump_parser.add_argument("--changed", action = "store_true", help = "only show fields that differ from reset values")
+    dump_parser.add_argument("--core", type = int, default = 1, help = "core whose SVD file is used (default: 1)")
+    dump_parser.set_defaults(func = cmd_dump)
+
+    sqlite_parser = commands.add_parser("sqlite", help = "export register metadata of every core to a SQLite database")
+    sqlite_parser.add_argument("config", help = "TOML config file")
+    sqlite_parser.add_argument("output", help = "SQLite database path")
+    sqlite_parser.set_defaults(func = cmd_sqlite)
+
+    diff_parser = commands.add_parser("diff", help = "report structural changes between two revisions of an SVD file")
+    diff_parser.add_argument("old", help = "old SVD file (.svd, .svd.gz, .svd.xz or <pack>!<device>)")
+    diff_parser.add_argument("new", help = "new SVD file")
+    diff_parser.add_argument("--config", help = "TOML config file whose load settings and patches are applied")
+    diff_parser.add_argument("--json", action = "store_true", help = "write the changes as JSON")
+    diff_parser.add_argument("--output", help = "write the report to a file instead of stdout")
+    diff_parser.set_defaults(func = cmd_diff)
+
+    serve_parser = commands.add_parser("serve", help = "serve register metadata queries as JSON over HTTP on localhost")
+    serve_parser.add_argument("configs", nargs = "+", help = "TOML config files")
+    serve_parser.add_argument("--port", type = int, default = 8765, help = "TCP port on 127.0.0.1 (default: 8765)")
+    serve_parser.add_argument("--socket", help = "serve on a Unix domain socket instead of a TCP port")
+    serve_parser.add_argument("--cache-size", type = int, default = 256, help = "rendered header fragments kept in memory")
+    serve_parser.set_defaults(func = cmd_serve)
+
+    args = arg_parser.parse_args(argv)
+    logging.basicConfig(level = logging.INFO, format = "%(message)s")
+    return args.func(args)
@@ -0,0 +1,71 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from typing import TYPE_CHECKING
+import tempfile
+import stat
+import copy
+import os
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd (annotations only, keeps this module light)
+if TYPE_CHECKING:
+    import cmsis_svd as svd
+
+###################################################################################################
+# COMMON RESOURCES
+###################################################################################################
+
+# Error raised for invalid SVD input or generator failures
+class SVDError(Exception):
+    pass
+
+# Formats a SVD description string
+def fmt_desc(desc: str) -> str:
+    new_desc = ""
+    is_first = True
+
+    # Iterate through word and ajust capitalization
+    for word in desc.split():
+        if is_first:
+            new_desc += word[0].upper() + word[1:]
+        elif not word.isupper():
+            new_desc += word.lower()
+        else:
+            new_desc += word
+
+        # Add space between words
+        new_desc += " "
+        is_first = word[-1] == "."
+
+    # Strip new description to remove trailing space
+    return new_desc.strip()
+
+# Returns the device itself when working in place, otherwise a deep copy of it
+def own_device(device: "svd.parser.SVDDevice", in_place: bool) -> "svd.parser.SVDDevice":
+    return device if in_place else copy.deepcopy(device)
+
+# Permission bits of a written file: those of the file it replaces, otherwise the ones open() would
+# give a new file under the process umask
+def output_mode(path: str) -> int:
+    if os.path.isfile(path):
+        return stat.S_IMODE(os.stat(path).st_mode)
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Write generated text to a file, replacing any previous output atomically (the temporary file is
+# created private, so it gets the mode of the output before replacing it)
+def write_output(text: str, path: str) -> None:
+    out_dir = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir = out_dir, prefix = ".tmp_", suffix = os.path.basename(path))
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(text)
+        os.chmod(tmp_path, output_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
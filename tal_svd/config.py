@@ -0,0 +1,159 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass, field, fields
+
+# Package modules
+from .common import SVDError
+from .fingerprint import read_config_values
+
+###################################################################################################
+# CONFIGURATION OBJECT
+###################################################################################################
+
+@dataclass
+class config_t:
+
+    # Path to SVD data directory -> git clone --depth=1 -b main https://github.com/cmsis-svd/cmsis-svd-data.git
+    svd_pkg_path: str
+
+    # Target device vendor name
+    vendor_name: str
+
+    # Core 1 SVD file name
+    core1_svd_name: str
+
+    # Core 2 SVD file name (None if single-core)
+    core2_svd_name: str | None = None
+
+    # Core 1 prefix (None if single-core)
+    core1_prefix: str | None = None
+
+    # Core 2 prefix (None if single-core)
+    core2_prefix: str | None = None
+
+    # Output file path (None if output is only returned)
+    output_path: str | None = None
+    # Outputs of other backends generated in the same run, by backend name ("macro", "enum", "array",
+    # "json" or any registered backend, see backends.py)
+    extra_outputs: dict[str, str] = field(default_factory = dict)
+    # SVD file names of the other devices of a family: output_path gets the peripheral sections common to
+    # every device (core 1 included) and each device gets a header of its other sections (macro style)
+    family_svd_names: list[str] = field(default_factory = list)
+    # Directory of the per-device headers of a family (None for the directory of output_path)
+    family_output_dir: str | None = None
+
+    # Description sidecar path: descriptions are left out of the output and written here instead, as
+    # JSON keyed by symbol for .json paths, otherwise as a doc-only header (None keeps them inline)
+    doc_sidecar_path: str | None = None
+
+    # Footprint report path: estimated flash/RAM storage of the static tables of the enum and array
+    # styles per peripheral and per sparse array, as JSON for .json paths, otherwise as text (None if
+    # not written)
+    footprint_report_path: str | None = None
+    # Budgets in bytes of the static tables of the generated headers, generation fails when exceeded
+    # (None for no budget)
+    flash_budget: int | None = None
+    ram_budget: int | None = None
+    # Size in bytes of the target's pointers (footprint estimates)
+    pointer_size: int = 4
+
+    # Makefile-style depfile path listing every input of the output (None if not written)
+    depfile_path: str | None = None
+
+    # Output style: "macro" (#define macros), "enum" (de-enumerated arrays) or "array" (instance arrays)
+    style: str = "macro"
+
+    # Emit peripherals with identical register layouts as instances of one shared definition, like
+    # peripherals derived from one another (macro style)
+    share_periph_layouts: bool = False
+
+    # Directory of "<section type>.tpl" files overriding the default output templates (see templates.py,
+    # the enum and array styles only use the banner and typedef block templates)
+    template_dir: str | None = None
+
+    # Declarative patch files applied in order to every loaded device (see patch.py)
+    patch_paths: list[str] = field(default_factory = list)
+
+    # Cache generation stage results on disk so config edits only re-run the stages reading the
+    # changed keys (see stages.py)
+    stage_cache: bool = False
+
+    # Parse the peripherals of large SVD files in chunks spread over a process pool (see load.py)
+    parallel_parse: bool = False
+
+    # Validate SVD files against the CMSIS-SVD schema when loading (verdicts cached per content hash)
+    xml_validation: bool = False
+
+    # Fallback access type for registers when not specified
+    fallback_reg_access: svd.parser.SVDAccessType = svd.parser.SVDAccessType.READ_WRITE
+
+    # Minimum column of macro definitions
+    min_def_col: int = 0
+
+    # Number of spaces per indent level
+    indent: int = 2
+
+    # Peripheral de-enumeration settings
+    periph_digit_enum: bool = True
+    periph_digit_enum_exc_list: list[str] = field(default_factory = list)
+    periph_alpha_enum: bool = True
+    periph_alpha_enum_exc_list: list[str] = field(default_factory = list)
+    min_periph_enum_len: int = 2
+    max_periph_enum_len: int = 100
+
+    # Interrupt de-enumeration settings
+    isr_digit_enum: bool = True
+    isr_digit_enum_exc_list: list[str] = field(default_factory = list)
+    isr_alpha_enum: bool = False
+    isr_alpha_enum_exc_list: list[str] = field(default_factory = list)
+    min_isr_enum_len: int = 2
+    max_isr_enum_len: int = 100
+
+    # Register de-enumeration settings
+    reg_digit_enum: bool = True
+    reg_digit_enum_exc_list: list[str] = field(default_factory = list)
+    reg_alpha_enum: bool = False
+    reg_alpha_enum_exc_list: list[str] = field(default_factory = list)
+    min_reg_enum_len: int = 2
+    max_reg_enum_len: int = 100
+
+    # Field de-enumeration settings
+    field_digit_enum: bool = True
+    field_digit_enum_exc_list: list[str] = field(default_factory = list)
+    field_alpha_enum: bool = False
+    field_alpha_enum_exc_list: list[str] = field(default_factory = list)
+    min_field_enum_len: int = 2
+    max_field_enum_len: int = 100
+
+###################################################################################################
+# CONFIGURATION FILES
+###################################################################################################
+
+# Config keys family configs do not support (family runs emit macro headers only, which take no table
+# storage, and are regenerated whole)
+FAMILY_EXCLUDED_KEYS: tuple[str, ...] = ("extra_outputs", "stage_cache", "footprint_report_path", "flash_budget",
+                                         "ram_budget")
+
+# Load a TOML config file whose keys are config_t field names
+def load_config(path: str) -> config_t:
+    values = read_config_values(path)
+    names = [x.name for x in fields(config_t)]
+    for key in values:
+        if key not in names:
+            raise SVDError(f'Unknown config key "{key}" in {path}.')
+    if values.get("family_svd_names"):
+        for key in FAMILY_EXCLUDED_KEYS:
+            if key in values:
+                raise SVDError(f'Config key "{key}" is not supported by family configs ({path}).')
+    if "fallback_reg_access" in values:
+        values["fallback_reg_access"] = svd.parser.SVDAccessType(values["fallback_reg_access"])
+    try:
+        return config_t(**values)
+    except TypeError as e:
+        raise SVDError(f'Invalid config file {path}: {e}')
@@ -0,0 +1,135 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Requires "numpy" library -> pip install -U numpy
+import numpy as np
+
+# Standard libraries
+from dataclasses import dataclass
+
+# Package modules
+from .common import SVDError
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Field layout of a register, the same values emitted as *_MASK and *_POS definitions
+@dataclass
+class reg_layout_t:
+    peripheral: str
+    register: str
+    address: int
+    size: int
+    reset_value: int
+    reset_mask: int
+    field_names: list[str]
+    masks: np.ndarray
+    positions: np.ndarray
+
+    # Decode register values into field values, one column per field (single vectorized pass)
+    def decode(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype = np.uint64).reshape(-1, 1)
+        return (values & self.masks) >> self.positions
+
+    # Field values of the reset value
+    def reset_fields(self) -> np.ndarray:
+        return self.decode(np.asarray([self.reset_value], dtype = np.uint64))[0]
+
+    # Flag fields that differ from their reset values, one row per value (fields whose bits are
+    # outside the reset mask are never flagged)
+    def diff_reset(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype = np.uint64).reshape(-1, 1)
+        changed = (values ^ np.uint64(self.reset_value)) & np.uint64(self.reset_mask)
+        return (changed & self.masks) != 0
+
+# Build the field layout of a register
+def build_reg_layout(device: svd.parser.SVDDevice, peripheral: svd.parser.SVDPeripheral,
+                     register: svd.parser.SVDRegister) -> reg_layout_t:
+    size = register.size or device.width or 32
+    fields = register.get_fields()
+    return reg_layout_t(peripheral = peripheral.name, register = register.name,
+                        address = peripheral.base_address + register.address_offset, size = size,
+                        reset_value = register.reset_value or 0,
+                        reset_mask = register.reset_mask if register.reset_mask is not None else (1 << size) - 1,
+                        field_names = [x.name for x in fields],
+                        masks = np.asarray([((1 << x.bit_width) - 1) << x.bit_offset for x in fields], dtype = np.uint64),
+                        positions = np.asarray([x.bit_offset for x in fields], dtype = np.uint64))
+
+###################################################################################################
+# DECODER
+###################################################################################################
+
+# Decodes register dumps and sampled register traces with precomputed mask/position tables
+class decoder_t:
+
+    def __init__(self, device: svd.parser.SVDDevice):
+        self.layouts: dict[str, reg_layout_t] = {}
+        self.periph_layouts: dict[str, list[reg_layout_t]] = {}
+        self.periph_bases: dict[str, int] = {}
+        for peripheral in device.get_peripherals():
+            self.periph_bases[peripheral.name.upper()] = peripheral.base_address
+            layouts = [build_reg_layout(device, peripheral, x) for x in peripheral.get_registers()]
+            self.periph_layouts[peripheral.name.upper()] = layouts
+            for layout in layouts:
+                self.layouts.setdefault(f'{layout.peripheral}.{layout.register}'.upper(), layout)
+
+    # Find the layout of a register named "PERIPHERAL.REGISTER"
+    def layout(self, name: str) -> reg_layout_t:
+        layout = self.layouts.get(name.upper())
+        if layout is None:
+            raise SVDError(f'Register {name} not found.')
+        return layout
+
+    # Decode a column of sampled values of a register into {field name: values}
+    def decode_trace(self, name: str, values: np.ndarray) -> dict[str, np.ndarray]:
+        layout = self.layout(name)
+        decoded = layout.decode(values)
+        return {x: decoded[:, i] for i, x in enumerate(layout.field_names)}
+
+    # Base address of a peripheral
+    def base_address(self, peripheral: str) -> int:
+        if peripheral.upper() not in self.periph_bases:
+            raise SVDError(f'Peripheral {peripheral} not found.')
+        return self.periph_bases[peripheral.upper()]
+
+    # Read the register values of a peripheral from a binary little-endian memory dump starting at
+    # base_address (registers outside the dump are left out)
+    def dump_values(self, peripheral: str, dump: bytes, base_address: int) -> tuple[list[reg_layout_t], np.ndarray]:
+        layouts = self.periph_layouts.get(peripheral.upper())
+        if layouts is None:
+            raise SVDError(f'Peripheral {peripheral} not found.')
+        layouts = [x for x in layouts if base_address <= x.address and x.address + x.size // 8 <= base_address + len(dump)]
+        data = np.frombuffer(dump, dtype = np.uint8)
+        values = np.zeros(len(layouts), dtype = np.uint64)
+        offsets = np.asarray([x.address - base_address for x in layouts], dtype = np.int64)
+        sizes = np.asarray([x.size // 8 for x in layouts], dtype = np.int64)
+        for byte in range(int(sizes.max(initial = 0))):
+            in_reg = byte < sizes
+            values |= np.where(in_reg, data[np.where(in_reg, offsets + byte, 0)].astype(np.uint64), 0) << np.uint64(8 * byte)
+        return layouts, values
+
+    # Decode a peripheral dump into (register, field, value, reset value, changed) rows, decoding
+    # the fields of every register in one pass over the concatenated mask/position tables
+    def decode_dump(self, peripheral: str, dump: bytes, base_address: int) -> list[tuple[str, str, int, int, bool]]:
+        dump_layouts, dump_values = self.dump_values(peripheral, dump, base_address)
+        keep = [i for i, x in enumerate(dump_layouts) if x.field_names]
+        if not keep:
+            return []
+        layouts = [dump_layouts[i] for i in keep]
+        values = dump_values[keep]
+        reg_index = np.concatenate([np.full(len(x.field_names), i) for i, x in enumerate(layouts)])
+        masks = np.concatenate([x.masks for x in layouts])
+        positions = np.concatenate([x.positions for x in layouts])
+        resets = np.asarray([x.reset_value for x in layouts], dtype = np.uint64)[reg_index]
+        reset_masks = np.asarray([x.reset_mask for x in layouts], dtype = np.uint64)[reg_index]
+        field_values = (values[reg_index] & masks) >> positions
+        reset_values = (resets & masks) >> positions
+        changed = ((values[reg_index] ^ resets) & reset_masks & masks) != 0
+        names = [(x.register, y) for x in layouts for y in x.field_names]
+        return [(reg, name, value, reset, is_changed) for (reg, name), value, reset, is_changed
+                in zip(names, field_values.tolist(), reset_values.tolist(), changed.tolist())]
@@ -0,0 +1,154 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass, field, asdict
+import hashlib
+import json
+
+# Package modules
+from .transform import index_irqs
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Compared properties of each element kind (descriptions are left out)
+PROPS: dict[str, tuple[str, ...]] = {
+    "peripheral": ("base_address", "size"),
+    "register": ("address_offset", "size", "access", "reset_value", "reset_mask"),
+    "field": ("bit_offset", "bit_width", "access"),
+    "interrupt": ("value",)
+}
+
+# Properties reported in hexadecimal
+HEX_PROPS: tuple[str, ...] = ("base_address", "size", "address_offset", "reset_value", "reset_mask")
+
+# Report marks of each kind of change
+MARKS: dict[str, str] = {"added": "+", "removed": "-", "changed": "~"}
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Compared element: its properties, its children by name and a hash of both (equal hashes mean equal
+# subtrees, which are skipped without visiting their children)
+@dataclass
+class element_t:
+    kind: str
+    props: dict[str, object]
+    children: dict[str, "element_t"] = field(default_factory = dict)
+    digest: str = ""
+
+# Change between two revisions of an element (properties of added/removed elements, old and new
+# values of changed properties), children of added/removed elements are not listed
+@dataclass
+class change_t:
+    kind: str
+    path: str
+    action: str
+    props: dict[str, object] = field(default_factory = dict)
+    changes: dict[str, tuple[object, object]] = field(default_factory = dict)
+
+# Value of an access type enum (None if not specified)
+def access_name(access) -> str | None:
+    return access.value if access is not None else None
+
+# Build an element, hashing its properties and the hashes of its children
+def make_element(kind: str, props: dict[str, object], children: dict[str, element_t] | None = None) -> element_t:
+    element = element_t(kind = kind, props = props, children = children or {})
+    digest = hashlib.sha256(repr((kind, sorted(props.items()))).encode())
+    for name, child in element.children.items():
+        digest.update(f'{name}\0{child.digest}\0'.encode())
+    element.digest = digest.hexdigest()
+    return element
+
+# Compared elements of a device keyed by name: peripherals (SVD arrays flattened), their registers
+# and fields, and interrupts (one entry per interrupt name, keyed "IRQ <name>")
+def device_elements(device: svd.parser.SVDDevice) -> dict[str, element_t]:
+    elements: dict[str, element_t] = {}
+    for periph in device.get_peripherals():
+        registers: dict[str, element_t] = {}
+        for reg in periph.get_registers():
+            fields = {x.name: make_element("field", {"bit_offset": x.bit_offset, "bit_width": x.bit_width,
+                                                     "access": access_name(x.access)}) for x in reg.get_fields()}
+            registers[reg.name] = make_element("register", {"address_offset": reg.address_offset,
+                                                            "size": reg.size or device.width,
+                                                            "access": access_name(reg.access),
+                                                            "reset_value": reg.reset_value,
+                                                            "reset_mask": reg.reset_mask}, fields)
+        blocks = periph.address_blocks or []
+        size = max((x.offset + x.size for x in blocks), default = None)
+        elements.setdefault(periph.name, make_element("peripheral", {"base_address": periph.base_address, "size": size},
+                                                      registers))
+    irq_values: dict[str, list[int]] = {}
+    for value, entries in index_irqs(device).items():
+        for entry in entries:
+            if value not in irq_values.setdefault(entry.name, []):
+                irq_values[entry.name].append(value)
+    for name, values in irq_values.items():
+        elements[f'IRQ {name}'] = make_element("interrupt", {"value": values[0] if len(values) == 1 else sorted(values)})
+    return elements
+
+###################################################################################################
+# STRUCTURAL DIFF
+###################################################################################################
+
+# Compare elements keyed by name, appending the changes under a path prefix (linear in the number of
+# elements, unchanged subtrees are skipped by hash)
+def diff_elements(old: dict[str, element_t], new: dict[str, element_t], prefix: str, changes: list[change_t]) -> None:
+    for name, old_element in old.items():
+        new_element = new.get(name)
+        if new_element is None:
+            changes.append(change_t(kind = old_element.kind, path = prefix + name, action = "removed",
+                                    props = old_element.props))
+            continue
+        if new_element.digest == old_element.digest:
+            continue
+        props = {x: (old_element.props.get(x), new_element.props.get(x)) for x in PROPS[old_element.kind]
+                 if old_element.props.get(x) != new_element.props.get(x)}
+        if props:
+            changes.append(change_t(kind = old_element.kind, path = prefix + name, action = "changed", changes = props))
+        diff_elements(old_element.children, new_element.children, f'{prefix}{name}.', changes)
+    for name, new_element in new.items():
+        if name not in old:
+            changes.append(change_t(kind = new_element.kind, path = prefix + name, action = "added",
+                                    props = new_element.props))
+
+# Structural changes between two revisions of a device: additions, removals and changed addresses,
+# sizes, access types, reset values, bit ranges and IRQ numbers
+def diff_devices(old: svd.parser.SVDDevice, new: svd.parser.SVDDevice) -> list[change_t]:
+    changes: list[change_t] = []
+    diff_elements(device_elements(old), device_elements(new), "", changes)
+    return changes
+
+###################################################################################################
+# DIFF OUTPUT
+###################################################################################################
+
+# Format a property value for reports
+def fmt_prop(name: str, value: object) -> str:
+    if isinstance(value, int) and name in HEX_PROPS:
+        return f'0x{value:X}'
+    return str(value)
+
+# Plain-text report: one line per change, marked "+" (added), "-" (removed) or "~" (changed)
+def format_diff_report(changes: list[change_t], old_name: str, new_name: str) -> str:
+    lines = [f'--- {old_name}', f'+++ {new_name}']
+    for change in changes:
+        if change.action == "changed":
+            details = ", ".join(f'{x} {fmt_prop(x, y[0])} -> {fmt_prop(x, y[1])}' for x, y in change.changes.items())
+        else:
+            details = " ".join(f'{x}={fmt_prop(x, y)}' for x, y in change.props.items() if y is not None)
+        lines.append(f'{MARKS[change.action]} {change.kind:<10} {change.path}  {details}'.rstrip())
+    counts = {x: sum(y.action == x for y in changes) for x in MARKS}
+    lines.append(f'{counts["added"]} added, {counts["removed"]} removed, {counts["changed"]} changed')
+    return "\n".join(lines) + "\n"
+
+# JSON report: the compared devices and every change
+def format_diff_json(changes: list[change_t], old_name: str, new_name: str) -> str:
+    return json.dumps({"old": old_name, "new": new_name, "changes": [asdict(x) for x in changes]}, indent = 2) + "\n"
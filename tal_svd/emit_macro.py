@@ -0,0 +1,261 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+import logging
+import io
+
+# Package modules
+from .config import config_t
+from .common import fmt_desc
+from .transform import irq_entry_t, index_irqs, irq_sharers, irq_description, layout_name
+from .templates import load_templates
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Qualifiers associated with different register access types
+REG_QUAL: dict[svd.parser.SVDAccessType, str] = {
+    svd.parser.SVDAccessType.READ_ONLY: "const volatile",
+    svd.parser.SVDAccessType.WRITE_ONLY: "volatile",
+    svd.parser.SVDAccessType.READ_WRITE: "volatile",
+    svd.parser.SVDAccessType.WRITE_ONCE: "volatile",
+    svd.parser.SVDAccessType.READ_WRITE_ONCE: "volatile"
+}
+
+# Ensure register name is formatted correctly
+def reg_name(register: svd.parser.SVDRegister, periph_name: str) -> str:
+    new_reg_name: str = ""
+    for r_word in register.name.upper().split("_"):
+        if all(r_word != x for x in periph_name.split("_")):
+            new_reg_name += r_word + "_"
+    new_reg_name = new_reg_name[:-1]
+    return new_reg_name
+
+###################################################################################################
+# FILE GENERATION
+###################################################################################################
+
+# Generate the #define macro sections of a (merged) device, one per peripheral along with the
+# peripherals derived from it, returning the name and text of each section in output order
+def emit_macro_sections(device: svd.parser.SVDDevice, config: config_t) -> list[tuple[str, str]]:
+    templates = load_templates(config.template_dir)
+    indent: str = " "*(config.indent*2)
+    sections: list[tuple[str, str]] = []
+
+    # Index the interrupts of the device
+    irq_index: dict[int, list[irq_entry_t]] = index_irqs(device)
+    written_irqs: set[tuple[int, str]] = set()
+
+    # Iterate through peripherals
+    for peripheral in device.peripherals:
+
+        # Print out current peripheral
+        log.debug(f'Generating definitions for peripheral: {peripheral.name.upper()}...')
+
+        # Ensure peripheral has associated information
+        if peripheral.registers or peripheral.interrupts:
+
+            # Ensure peripheral is not derived
+            is_derived: bool = False
+            if peripheral.derived_from:
+                for parent_periph in device.peripherals:
+                    if parent_periph.name == peripheral.derived_from:
+                        is_derived = True
+                        break
+            if is_derived:
+                continue
+
+            # Get peripheral name
+            periph_name: str = peripheral.name.upper()
+            if peripheral.group_name:
+                for deriv_periph in device.peripherals:
+                    if (deriv_periph.derived_from and deriv_periph.derived_from == peripheral.name):
+                        periph_name = ""
+                        for parent_char, deriv_char in zip(peripheral.name.upper(), deriv_periph.name.upper()):
+                            if parent_char == deriv_char:
+                                periph_name += parent_char
+
+            # Write peripheral section header
+            file = io.StringIO()
+            file.write(templates.render("banner", indent = indent, title = f'{periph_name} Definitions'))
+
+            # Collect the IRQ interrupts of the peripheral and its derived peripherals not written by an
+            # earlier section (shared IRQs are written once, listing the peripherals sharing them)
+            isr_rows: list[tuple[int, irq_entry_t, list[str]]] = []
+            for x in device.peripherals:
+                if x.name == peripheral.name or (x.derived_from and x.derived_from == peripheral.name):
+                    for interrupt in x.interrupts or []:
+                        if (interrupt.value, interrupt.name) not in written_irqs:
+                            written_irqs.add((interrupt.value, interrupt.name))
+                            entries = irq_index[interrupt.value]
+                            entry = next(y for y in entries if y.name == interrupt.name)
+                            isr_rows.append((interrupt.value, entry, irq_sharers(entries, interrupt.name)))
+
+            # If peripheral or derived has associated IRQ interrupts
+            if isr_rows:
+
+                # Determine maximum length of interrupt values/names
+                max_isr_digits: int = max(len(str(x[0])) for x in isr_rows)
+                max_isr_name_len: int = max(len(x[1].name) for x in isr_rows)
+
+                # Collect interrupt definitions and write the interrupt subsection
+                rows: list[dict] = []
+                for isr_value, entry, sharers in isr_rows:
+                    isr_decl: str = f'#define _{entry.name.upper()}_IRQ'
+                    isr_gap: int = max((max_isr_name_len + 3) - len(entry.name), config.min_def_col - len(isr_decl))
+                    isr_c_gap: int = (max_isr_digits - len(str(isr_value))) + 1
+                    isr_desc: str = fmt_desc(irq_description(irq_index[isr_value], entry.name))
+                    if len(sharers) > 1:
+                        isr_desc += f' (shared by {", ".join(x.upper() for x in sharers)})'
+                    rows.append({"decl": isr_decl, "gap": " "*isr_gap, "value": f'INT32_C({isr_value})',
+                                 "c_gap": " "*isr_c_gap, "comment": f'/** @brief {isr_desc} */'})
+                file.write(templates.render("irq_block", rows, indent = indent, name = periph_name))
+
+            # If peripheral has associated registers
+            if peripheral.registers:
+
+                # If peripheral has any derived peripherals
+                if any(x.derived_from and x.derived_from == peripheral.name for x in device.peripherals):
+
+                    # Determine maximum number of digits in deriv offset and name length
+                    max_deriv_digits: int = max(len(str(x.base_address - peripheral.base_address)) for x in
+                            device.peripherals if x.derived_from and x.derived_from == peripheral.name)
+                    max_deriv_name_len: int = max(len(x.name) for x in device.peripherals if x.name == peripheral.name or
+                                                  (x.derived_from and x.derived_from == peripheral.name))
+
+                    # Collect the peripheral instance offset definitions and write their subsection
+                    rows: list[dict] = []
+                    for deriv_periph in device.peripherals:
+                        if (deriv_periph.name == peripheral.name or (deriv_periph.derived_from and
+                            deriv_periph.derived_from == peripheral.name)):
+                            deriv_decl: str = f'#define _{deriv_periph.name.upper()}_OFF'
+                            deriv_value: int = deriv_periph.base_address - peripheral.base_address
+                            deriv_gap: int = max((max_deriv_name_len + 3) - len(deriv_periph.name), config.min_def_col - len(deriv_decl))
+                            deriv_c_gap: int = (max_deriv_digits - len(str(deriv_value))) + 1
+                            rows.append({"decl": deriv_decl, "gap": " "*deriv_gap, "value": f'INT32_C({deriv_value})',
+                                         "c_gap": " "*deriv_c_gap,
+                                         "comment": f'/** @brief {deriv_periph.name.upper()} instance offset. */'})
+                    file.write(templates.render("offset_table", rows, indent = indent, name = periph_name))
+
+                # Determine maximum length of register qualifiers/names
+                max_reg_qual_len: int = max(len(REG_QUAL[register.access]) for register in peripheral.registers)
+                max_reg_name_len: int = max(len(reg_name(register, periph_name)) for register in peripheral.registers)
+
+                # Collect register definitions and write the register subsection
+                rows: list[dict] = []
+                for register in peripheral.registers:
+                    rname: str = reg_name(register, periph_name)
+                    reg_decl: str = f'#define _{periph_name}_{rname}_REG'
+                    reg_value: int = peripheral.base_address + register.address_offset
+                    reg_gap: int = max((max_reg_name_len + 3) - len(rname), config.min_def_col - len(reg_decl))
+                    reg_c_gap: int = (max_reg_qual_len - len(REG_QUAL[register.access])) + 1
+                    rows.append({"decl": reg_decl, "gap": " "*reg_gap,
+                                 "value": (f'(*({REG_QUAL[register.access]} uint{register.size}_t*)'
+                                           f'UINT{register.size}_C(0x{reg_value:0{peripheral.size // 4}X}))'),
+                                 "c_gap": " "*reg_c_gap, "comment": f'/** @brief {fmt_desc(register.description)} */'})
+                file.write(templates.render("pointer_table", rows, indent = indent, name = periph_name))
+
+                # Collect register reset value definitions and write the reset value subsection
+                rows: list[dict] = []
+                for register in peripheral.registers:
+                    if register.reset_value is not None:
+                        rname: str = reg_name(register, periph_name)
+                        reset_decl: str = f'#define _{periph_name}_{rname}_RST'
+                        reset_value: int = register.reset_value
+                        reset_gap: int = max((max_reg_name_len + 3) - len(rname),
+                                             config.min_def_col - len(reset_decl))
+                        rows.append({"decl": reset_decl, "gap": " "*reset_gap,
+                                     "value": f'UINT{register.size}_C(0x{reset_value:0{peripheral.size // 4}X})',
+                                     "c_gap": " ", "comment": f'/** @brief {fmt_desc(register.description)} */'})
+
+                # Collect the reset values of derived peripherals differing from the shared definition
+                # (instances sharing a layout may reset differently)
+                shared_regs = {(x.address_offset, layout_name(x.name, peripheral.name)): x for x in peripheral.registers}
+                for deriv_periph in device.peripherals:
+                    if deriv_periph.derived_from and deriv_periph.derived_from == peripheral.name:
+                        for deriv_reg in deriv_periph.registers or []:
+                            register = shared_regs.get((deriv_reg.address_offset,
+                                                        layout_name(deriv_reg.name, deriv_periph.name)))
+                            if (register is None or deriv_reg.reset_value is None or
+                                deriv_reg.reset_value == register.reset_value):
+                                continue
+                            rname: str = reg_name(register, periph_name)
+                            reset_decl: str = f'#define _{deriv_periph.name.upper()}_{rname}_RST'
+                            reset_gap: int = max((max_reg_name_len + 3) - len(rname),
+                                                 config.min_def_col - len(reset_decl))
+                            rows.append({"decl": reset_decl, "gap": " "*reset_gap,
+                                         "value": f'UINT{register.size}_C(0x{deriv_reg.reset_value:0{peripheral.size // 4}X})',
+                                         "c_gap": " ", "comment": f'/** @brief {fmt_desc(deriv_reg.description)} */'})
+                file.write(templates.render("reset_table", rows, indent = indent, name = periph_name))
+
+                # If any register has associated fields
+                if any(x.fields for x in peripheral.registers):
+
+                    # Determine the maximum length of field names
+                    max_field_name_len: int = 0
+                    for register in peripheral.registers:
+                        if register.fields:
+                            for field in register.fields:
+                                rname: str = reg_name(register, periph_name)
+                                field_name_len: int = len(rname) + len(field.name)
+                                if field_name_len > max_field_name_len:
+                                    max_field_name_len = field_name_len
+
+                    # Collect field mask definitions and write the field mask subsection
+                    rows: list[dict] = []
+                    for register in peripheral.registers:
+                        if register.fields:
+                            for field in register.fields:
+                                rname: str = reg_name(register, periph_name)
+                                mask_decl: str = f'#define _{periph_name}_{rname}_{field.name.upper()}_MASK'
+                                mask_value: int = ((1 << field.bit_width) - 1) << field.bit_offset
+                                mask_gap: int = max((max_field_name_len + 3) - (len(rname) + len(field.name)),
+                                                    config.min_def_col - len(mask_decl))
+                                rows.append({"decl": mask_decl, "gap": " "*mask_gap,
+                                             "value": f'UINT{register.size}_C(0x{mask_value:0{peripheral.size // 4}X})',
+                                             "c_gap": " ", "comment": f'/** @brief {fmt_desc(field.description)} */'})
+                    file.write(templates.render("mask_table", rows, indent = indent, name = periph_name))
+
+                    # Determine maximum length of field positions
+                    max_field_pos_digits: int = 0
+                    for register in peripheral.registers:
+                        if register.fields:
+                            for field in register.fields:
+                                field_pos_digits: int = len(str(field.bit_offset))
+                                if field_pos_digits > max_field_pos_digits:
+                                    max_field_pos_digits = field_pos_digits
+
+                    # Collect field position definitions and write the field position subsection
+                    rows: list[dict] = []
+                    for register in peripheral.registers:
+                        if register.fields:
+                            for field in register.fields:
+                                rname: str = reg_name(register, periph_name)
+                                pos_decl: str = f'#define _{periph_name}_{rname}_{field.name.upper()}_POS'
+                                pos_value: int = field.bit_offset
+                                pos_gap: int = max((max_field_name_len + 3) - (len(rname) + len(field.name)),
+                                                   config.min_def_col - len(pos_decl))
+                                pos_c_gap: int = (max_field_pos_digits - len(str(pos_value))) + 1
+                                rows.append({"decl": pos_decl, "gap": " "*pos_gap,
+                                             "value": f'INT{register.size}_C({field.bit_offset})',
+                                             "c_gap": " "*pos_c_gap, "comment": f'/** @brief {fmt_desc(field.description)} */'})
+                    file.write(templates.render("position_table", rows, indent = indent, name = periph_name))
+
+            sections.append((periph_name, file.getvalue()))
+
+    return sections
+
+# Generate a header of #define macros for a (merged) device, each section rendered by its template
+def emit_macro_header(device: svd.parser.SVDDevice, config: config_t) -> str:
+    templates = load_templates(config.template_dir)
+    text: str = templates.render("file_header", indent = " "*config.indent)
+    text += "".join(x[1] for x in emit_macro_sections(device, config))
+    return text + templates.render("file_footer", indent = " "*config.indent)
@@ -0,0 +1,128 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+import sqlite3
+import os
+
+# Package modules
+from .common import SVDError
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Database schema (addresses are absolute, masks are field masks within their register, element
+# names compare case-insensitively so name lookups use the name indexes)
+SCHEMA: str = """
+CREATE TABLE devices (
+    id INTEGER PRIMARY KEY, name TEXT NOT NULL, prefix TEXT, cpu TEXT, description TEXT);
+CREATE TABLE peripherals (
+    id INTEGER PRIMARY KEY, device_id INTEGER NOT NULL REFERENCES devices(id),
+    name TEXT NOT NULL COLLATE NOCASE, group_name TEXT, base_address INTEGER NOT NULL, description TEXT,
+    derived_from TEXT, derived_from_id INTEGER REFERENCES peripherals(id));
+CREATE TABLE registers (
+    id INTEGER PRIMARY KEY, peripheral_id INTEGER NOT NULL REFERENCES peripherals(id),
+    name TEXT NOT NULL COLLATE NOCASE, address_offset INTEGER NOT NULL, address INTEGER NOT NULL, size INTEGER,
+    access TEXT, reset_value INTEGER, reset_mask INTEGER, description TEXT);
+CREATE TABLE fields (
+    id INTEGER PRIMARY KEY, register_id INTEGER NOT NULL REFERENCES registers(id),
+    name TEXT NOT NULL COLLATE NOCASE, bit_offset INTEGER NOT NULL, bit_width INTEGER NOT NULL,
+    mask INTEGER NOT NULL, access TEXT, description TEXT);
+CREATE TABLE interrupts (
+    id INTEGER PRIMARY KEY, peripheral_id INTEGER NOT NULL REFERENCES peripherals(id),
+    name TEXT NOT NULL COLLATE NOCASE, value INTEGER NOT NULL, description TEXT);
+CREATE VIRTUAL TABLE descriptions USING fts5(kind UNINDEXED, element_id UNINDEXED, name, description);
+"""
+
+# Indexes, created after the bulk insert
+INDEXES: str = """
+CREATE INDEX peripherals_name ON peripherals(name);
+CREATE INDEX peripherals_address ON peripherals(base_address);
+CREATE INDEX peripherals_derived ON peripherals(derived_from_id);
+CREATE INDEX registers_name ON registers(name);
+CREATE INDEX registers_address ON registers(address);
+CREATE INDEX registers_peripheral ON registers(peripheral_id);
+CREATE INDEX fields_name ON fields(name);
+CREATE INDEX fields_register ON fields(register_id);
+CREATE INDEX interrupts_name ON interrupts(name);
+CREATE INDEX interrupts_value ON interrupts(value);
+"""
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Value of an access type enum (None if not specified)
+def access_name(access) -> str | None:
+    return access.value if access is not None else None
+
+# Insert a device and all its elements, returning the device id
+def insert_device(db: sqlite3.Connection, device: svd.parser.SVDDevice, prefix: str | None) -> int:
+    cpu = device.cpu.name.value if device.cpu is not None and device.cpu.name is not None else None
+    device_id = db.execute("INSERT INTO devices (name, prefix, cpu, description) VALUES (?, ?, ?, ?)",
+                           (device.name, prefix, cpu, device.description)).lastrowid
+    periph_ids: dict[str, int] = {}
+    derived: list[tuple[int, str]] = []
+    texts: list[tuple[str, int, str, str | None]] = []
+    for peripheral in device.get_peripherals():
+        periph_id = db.execute("INSERT INTO peripherals (device_id, name, group_name, base_address, description, derived_from) "
+                               "VALUES (?, ?, ?, ?, ?, ?)",
+                               (device_id, peripheral.name, peripheral.group_name, peripheral.base_address,
+                                peripheral.description, peripheral.derived_from)).lastrowid
+        periph_ids.setdefault(peripheral.name, periph_id)
+        texts.append(("peripheral", periph_id, peripheral.name, peripheral.description))
+        if peripheral.derived_from:
+            derived.append((periph_id, peripheral.derived_from))
+        for interrupt in peripheral.interrupts or []:
+            irq_id = db.execute("INSERT INTO interrupts (peripheral_id, name, value, description) VALUES (?, ?, ?, ?)",
+                                (periph_id, interrupt.name, interrupt.value, interrupt.description)).lastrowid
+            texts.append(("interrupt", irq_id, interrupt.name, interrupt.description))
+        for register in peripheral.get_registers():
+            size = register.size or device.width
+            reg_id = db.execute("INSERT INTO registers (peripheral_id, name, address_offset, address, size, access, "
+                                "reset_value, reset_mask, description) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                (periph_id, register.name, register.address_offset,
+                                 peripheral.base_address + register.address_offset, size,
+                                 access_name(register.access), register.reset_value, register.reset_mask,
+                                 register.description)).lastrowid
+            texts.append(("register", reg_id, register.name, register.description))
+            field_rows = [(reg_id, x.name, x.bit_offset, x.bit_width, ((1 << x.bit_width) - 1) << x.bit_offset,
+                           access_name(x.access), x.description) for x in register.get_fields()]
+            for row in field_rows:
+                field_id = db.execute("INSERT INTO fields (register_id, name, bit_offset, bit_width, mask, access, "
+                                      "description) VALUES (?, ?, ?, ?, ?, ?, ?)", row).lastrowid
+                texts.append(("field", field_id, row[1], row[6]))
+    db.executemany("UPDATE peripherals SET derived_from_id = ? WHERE id = ?",
+                   [(periph_ids.get(name), periph_id) for periph_id, name in derived])
+    db.executemany("INSERT INTO descriptions (kind, element_id, name, description) VALUES (?, ?, ?, ?)", texts)
+    return device_id
+
+###################################################################################################
+# SQLITE EXPORT
+###################################################################################################
+
+# Write devices (with optional core prefixes) to a new SQLite database, replacing any previous file
+def export_sqlite(devices: list[svd.parser.SVDDevice], path: str, prefixes: list[str | None] | None = None) -> None:
+    prefixes = prefixes or [None] * len(devices)
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        with db:
+            db.executescript(SCHEMA)
+            for device, prefix in zip(devices, prefixes):
+                insert_device(db, device, prefix)
+            db.executescript(INDEXES)
+        db.execute("ANALYZE")
+    except sqlite3.Error as e:
+        db.close()
+        os.remove(tmp_path)
+        raise SVDError(f'Failed to write SQLite database {path}: {e}')
+    db.close()
+    os.replace(tmp_path, path)
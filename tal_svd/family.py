@@ -0,0 +1,106 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass, field
+import logging
+import re
+import os
+
+# Package modules
+from .config import config_t
+from .common import SVDError, write_output
+from .fingerprint import family_header_path
+from .load import available_cpus, find_svd_path, load_svd_file, load_svd_files, patch_devices
+from .transform import fill_defaults, share_layouts
+from .emit_macro import emit_macro_sections
+from .templates import load_templates
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Headers of a device family: the sections common to every device and the other sections of each
+# device by header path
+@dataclass
+class family_headers_t:
+    shared: str
+    devices: dict[str, str] = field(default_factory = dict)
+
+# SVD file names of every device of a family (core 1 first)
+def family_svd_names(config: config_t) -> list[str]:
+    if config.core2_svd_name:
+        raise SVDError("Family configs hold single-core devices only (core2_svd_name is set).")
+    if config.style != "macro":
+        raise SVDError(f'Family headers are generated in macro style only (style is "{config.style}").')
+    return [config.core1_svd_name, *config.family_svd_names]
+
+# Paths of the SVD files of every device of a family (core 1 first)
+def find_family_paths(config: config_t) -> list[str]:
+    return [find_svd_path(config, x) for x in family_svd_names(config)]
+
+# Path of the header of a family device: "<svd name>.h" (lower case) in the family output directory
+def device_header_path(config: config_t, svd_name: str) -> str:
+    return family_header_path(config.family_output_dir or os.path.dirname(config.output_path or ""), svd_name)
+
+# Fill in the placeholders of a header that family headers must not share (include guard and path)
+def fill_placeholders(text: str, path: str) -> str:
+    guard = re.sub(r'\W', "_", os.path.basename(path)).upper()
+    return text.replace("__GUARD__", guard).replace("__PATH__", os.path.basename(path))
+
+###################################################################################################
+# FAMILY HEADERS
+###################################################################################################
+
+# Load the SVD files of every device of a family concurrently, with the configured patches applied
+def load_family(config: config_t) -> list[svd.parser.SVDDevice]:
+    paths = find_family_paths(config)
+    if available_cpus() > 1 and not config.parallel_parse:
+        return patch_devices(config, load_svd_files(config, paths))
+    return patch_devices(config, [load_svd_file(config, x) for x in paths])
+
+# Split the macro sections of a family's devices into the sections every device emits identically
+# (in the order of the first device) and the other sections of each device, rendered as a shared
+# header and per-device headers including it
+def generate_family(devices: list[svd.parser.SVDDevice], config: config_t, in_place: bool = False) -> family_headers_t:
+    templates = load_templates(config.template_dir)
+    indent: str = " "*config.indent
+    device_sections: list[list[str]] = []
+    for device in devices:
+        device = fill_defaults(device, config, in_place = in_place)
+        if config.share_periph_layouts:
+            device = share_layouts(device, config, in_place = True)
+        device_sections.append([x[1] for x in emit_macro_sections(device, config)])
+    common: set[str] = set(device_sections[0]).intersection(*device_sections[1:])
+    shared_path = config.output_path or "family.h"
+    shared = templates.render("file_header", indent = indent)
+    shared += "".join(x for x in device_sections[0] if x in common)
+    shared += templates.render("file_footer", indent = indent)
+    headers = family_headers_t(shared = fill_placeholders(shared, shared_path))
+    for svd_name, sections in zip(family_svd_names(config), device_sections):
+        path = device_header_path(config, svd_name)
+        text = templates.render("file_header", indent = indent)
+        text += templates.render("family_include", indent = indent,
+                                 path = os.path.relpath(shared_path, os.path.dirname(path) or ".").replace(os.sep, "/"))
+        text += "".join(x for x in sections if x not in common)
+        text += templates.render("file_footer", indent = indent)
+        headers.devices[path] = fill_placeholders(text, path)
+    log.info(f'{len(common)} of {len(device_sections[0])} sections shared by {len(devices)} devices.')
+    return headers
+
+# Write the per-device headers of a family, leaving unchanged files untouched
+def write_device_headers(headers: family_headers_t) -> None:
+    for path, text in headers.devices.items():
+        old_text: str | None = None
+        if os.path.isfile(path):
+            with open(path) as file:
+                old_text = file.read()
+        if text != old_text:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+            write_output(text, path)
@@ -0,0 +1,196 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries only, this module is on the CLI fast path
+import hashlib
+import tomllib
+import json
+import os
+
+# Package modules
+from .archive import PACK_SEPARATOR, COMPRESSED_SUFFIXES, split_pack_path
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Config keys holding paths, resolved relative to the config file
+CONFIG_PATH_KEYS: tuple[str, ...] = ("svd_pkg_path", "output_path", "depfile_path", "doc_sidecar_path",
+                                     "footprint_report_path", "template_dir", "family_output_dir")
+
+# Config keys holding lists of paths, resolved relative to the config file
+CONFIG_PATH_LIST_KEYS: tuple[str, ...] = ("patch_paths",)
+
+# Config keys holding tables of paths, resolved relative to the config file
+CONFIG_PATH_TABLE_KEYS: tuple[str, ...] = ("extra_outputs",)
+
+# Suffix of the template override files in a template directory
+TEMPLATE_SUFFIX: str = ".tpl"
+
+# Read the raw values of a TOML config file, resolving paths relative to the config file
+def read_config_values(path: str) -> dict:
+    with open(path, "rb") as file:
+        values = tomllib.load(file)
+    config_dir = os.path.dirname(os.path.abspath(path))
+    for key in CONFIG_PATH_KEYS:
+        if values.get(key) is not None:
+            values[key] = os.path.join(config_dir, values[key])
+    for key in CONFIG_PATH_LIST_KEYS:
+        if values.get(key) is not None:
+            values[key] = [os.path.join(config_dir, x) for x in values[key]]
+    for key in CONFIG_PATH_TABLE_KEYS:
+        if values.get(key) is not None:
+            values[key] = {x: os.path.join(config_dir, y) for x, y in values[key].items()}
+    return values
+
+# Find a file within a vendor folder of the SVD data directory, None if missing
+def find_vendor_file(svd_pkg_path: str, vendor_name: str, file_name: str) -> str | None:
+    path = os.path.join(svd_pkg_path, vendor_name, os.path.basename(file_name))
+    if os.path.exists(path):
+        return path
+    for root, _, filenames in os.walk(os.path.join(svd_pkg_path, vendor_name)):
+        if file_name in filenames:
+            return os.path.join(root, file_name)
+    return None
+
+# Find an SVD file within the SVD data directory (same search as for_packaged_svd), also matching
+# compressed copies of the file and "<pack>!<device>" names of SVD files inside pack archives
+def find_svd_file(svd_pkg_path: str, vendor_name: str, svd_name: str) -> str | None:
+    file_name, member = split_pack_path(svd_name)
+    if member is not None:
+        path = find_vendor_file(svd_pkg_path, vendor_name, file_name)
+        return path + PACK_SEPARATOR + member if path else None
+    for suffix in ("", *COMPRESSED_SUFFIXES):
+        path = find_vendor_file(svd_pkg_path, vendor_name, svd_name + suffix)
+        if path is not None:
+            return path
+    return None
+
+# Path of the header of a family device: "<svd name>.h" (lower case) in the family output directory
+# (the directory of the output by default)
+def family_header_path(output_dir: str, svd_name: str) -> str:
+    file_name, member = split_pack_path(svd_name)
+    name = os.path.basename(member or file_name)
+    for suffix in (*COMPRESSED_SUFFIXES, ".svd"):
+        name = name.removesuffix(suffix)
+    return os.path.join(output_dir, name.lower() + ".h")
+
+# Template override files of a template directory, sorted (none without a directory)
+def template_paths(template_dir: str | None) -> list[str]:
+    if not template_dir or not os.path.isdir(template_dir):
+        return []
+    return [os.path.join(template_dir, x) for x in sorted(os.listdir(template_dir)) if x.endswith(TEMPLATE_SUFFIX)]
+
+###################################################################################################
+# INPUT FINGERPRINTS
+###################################################################################################
+
+# Return every input file a generation run reads: the config file, the SVD file of each core (and
+# of each family device), the patch files and the template overrides
+def input_paths(config_path: str, values: dict) -> list[str]:
+    paths = [os.path.abspath(config_path)]
+    svd_names = [values.get("core1_svd_name"), values.get("core2_svd_name"), *values.get("family_svd_names", [])]
+    for svd_name in svd_names:
+        if svd_name:
+            path = find_svd_file(values["svd_pkg_path"], values["vendor_name"], svd_name)
+            paths.append(os.path.abspath(split_pack_path(path)[0]) if path else svd_name)
+    paths += [os.path.abspath(x) for x in values.get("patch_paths", [])]
+    paths += [os.path.abspath(x) for x in template_paths(values.get("template_dir"))]
+    return paths
+
+# Return every output file a generation run writes: the output (first), the outputs of other
+# backends, the description sidecar, the footprint report and the headers of family devices
+def output_paths(values: dict) -> list[str]:
+    output_path = values.get("output_path")
+    if output_path is None:
+        return []
+    paths = [output_path, *values.get("extra_outputs", {}).values()]
+    paths += [values[x] for x in ("doc_sidecar_path", "footprint_report_path") if values.get(x) is not None]
+    if values.get("family_svd_names"):
+        output_dir = values.get("family_output_dir") or os.path.dirname(output_path)
+        paths += [family_header_path(output_dir, x) for x in [values["core1_svd_name"], *values["family_svd_names"]]]
+    return [os.path.abspath(x) for x in dict.fromkeys(paths)]
+
+# File change stamp (mtime in ns and size), None if the file does not exist
+def file_stamp(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+# Stamps of the generator's own sources, so generator edits invalidate previous outputs
+def generator_stamps() -> list:
+    pkg_dir = os.path.dirname(os.path.abspath(__file__))
+    return [(name, file_stamp(os.path.join(pkg_dir, name)))
+            for name in sorted(os.listdir(pkg_dir)) if name.endswith(".py")]
+
+# Fingerprint of a generation run: config contents, input file stamps and generator sources
+def fingerprint(config_path: str, values: dict) -> str:
+    digest = hashlib.sha256()
+    with open(config_path, "rb") as file:
+        digest.update(file.read())
+    paths = input_paths(config_path, values)
+    digest.update(json.dumps([(x, file_stamp(x)) for x in paths[1:]]).encode())
+    digest.update(json.dumps(generator_stamps()).encode())
+    return digest.hexdigest()
+
+###################################################################################################
+# OUTPUT STAMPS
+###################################################################################################
+
+# Path of the stamp file recording the fingerprint the outputs of a run were generated from (next
+# to the first output)
+def stamp_path(output_path: str) -> str:
+    return output_path + ".stamp"
+
+# Check whether every output of a run exists, is unmodified and was generated from the given fingerprint
+def is_up_to_date(output_paths: list[str], fp: str) -> bool:
+    try:
+        with open(stamp_path(output_paths[0])) as file:
+            stamp = json.load(file)
+    except (OSError, ValueError):
+        return False
+    outputs = stamp.get("outputs", {})
+    for path in output_paths:
+        output_stamp = file_stamp(path)
+        if output_stamp is None or outputs.get(path) != list(output_stamp):
+            return False
+    return stamp.get("fingerprint") == fp
+
+# Record the fingerprint the outputs of a run were generated from, with the stamp of every output
+def write_stamp(output_paths: list[str], fp: str) -> None:
+    outputs = {x: list(file_stamp(x) or ()) for x in output_paths}
+    with open(stamp_path(output_paths[0]), "w") as file:
+        json.dump({"fingerprint": fp, "outputs": outputs}, file)
+
+###################################################################################################
+# DEPFILES
+###################################################################################################
+
+# Escape a path for a Makefile-style depfile (also read by ninja), relative to the build directory
+# (the working directory) when inside it since make and ninja match targets textually
+def depfile_escape(path: str) -> str:
+    rel_path = os.path.relpath(path)
+    if not rel_path.startswith(".."):
+        path = rel_path
+    return path.replace("\\", "/").replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
+
+# Bump the output mtimes past their inputs so mtime based build systems see them as current, even
+# when unchanged contents were left untouched
+def touch_outputs(output_paths: list[str], paths: list[str]) -> None:
+    stamps = [file_stamp(x) for x in paths]
+    newest = max((x[0] for x in stamps if x is not None), default = 0)
+    for output_path in output_paths:
+        output_stamp = file_stamp(output_path)
+        if output_stamp is not None and output_stamp[0] < newest:
+            os.utime(output_path, ns = (newest, newest))
+
+# Write a Makefile-style depfile making every output of a generation run depend on every input file
+# of the run
+def write_depfile(depfile_path: str, output_paths: list[str], paths: list[str]) -> None:
+    targets = " ".join(depfile_escape(x) for x in output_paths)
+    deps = " \\\n  ".join(depfile_escape(x) for x in paths)
+    with open(depfile_path, "w") as file:
+        file.write(f'{targets}: \\\n  {deps}\n')
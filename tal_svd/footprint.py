@@ -0,0 +1,200 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from dataclasses import dataclass, field, asdict
+import logging
+import json
+import re
+import os
+
+# Package modules
+from .config import config_t
+from .common import SVDError, write_output
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Output styles emitting static tables (macro style definitions take no storage)
+TABLE_STYLES: tuple[str, ...] = ("enum", "array")
+
+# Output line opening the section of a peripheral (or of a group of de-enumerated peripherals)
+PERIPH_SECTION: re.Pattern = re.compile(r"@section (\S+) Register")
+
+# Static table declaration: qualified type, name, array dimensions and opening brace of an initializer
+STATIC_DECL: re.Pattern = re.compile(r"^static\s+(?P<type>.*?)\s*\b(?P<name>\w+)\s*(?P<dims>(?:\[\d+\]\s*)*)=\s*(?P<open>\{)?")
+
+# Element type of a table
+INT_TYPE: re.Pattern = re.compile(r"\bu?int(\d+)_t\b")
+
+# Lines opening and closing the (nested) initializers of array tables
+ARRAY_OPEN: re.Pattern = re.compile(r"=\s*\{$")
+ARRAY_CLOSE: re.Pattern = re.compile(r"^\}[,;]?$")
+
+###################################################################################################
+# STATIC TABLES
+###################################################################################################
+
+# Static table of a generated header: storage ("flash" for const tables, "ram" otherwise), element
+# size in bytes, number of elements (slots) and elements given by its initializer
+@dataclass
+class table_t:
+    name: str
+    periph: str
+    storage: str
+    element_size: int
+    slots: int = 1
+    filled: int = 1
+
+# Storage estimate of the static tables of a generated header, per peripheral and in total
+@dataclass
+class footprint_t:
+    style: str
+    tables: list[table_t] = field(default_factory = list)
+    periphs: dict[str, dict[str, int]] = field(default_factory = dict)
+    flash: int = 0
+    ram: int = 0
+
+# Size in bytes of the elements of a table type (pointers of the configured size)
+def element_size(type_text: str, config: config_t) -> int:
+    if "*" in type_text:
+        return config.pointer_size
+    match = INT_TYPE.search(type_text)
+    return int(match.group(1)) // 8 if match else config.pointer_size
+
+# Whether a table is read-only: const pointers, or const elements when not pointers
+def is_const(type_text: str) -> bool:
+    return "const" in type_text.rsplit("*", 1)[-1].split()
+
+# Find the static tables of a generated header, counting the filled elements of array initializers
+def header_tables(text: str, config: config_t) -> list[table_t]:
+    tables: list[table_t] = []
+    periph = ""
+    depth = 0
+    for line in text.split("\n"):
+        code = line.strip()
+        if depth:
+            if ARRAY_CLOSE.match(code):
+                depth -= 1
+            elif ARRAY_OPEN.search(code):
+                depth += 1
+            elif code and not code.startswith("/"):
+                tables[-1].filled += 1
+            continue
+        if (section := PERIPH_SECTION.search(code)):
+            periph = section.group(1)
+            continue
+        decl = STATIC_DECL.match(code)
+        if decl is None:
+            continue
+        slots = 1
+        for dim in re.findall(r"\d+", decl.group("dims")):
+            slots *= int(dim)
+        table = table_t(name = decl.group("name"), periph = periph,
+                        storage = "flash" if is_const(decl.group("type")) else "ram",
+                        element_size = element_size(decl.group("type"), config), slots = slots)
+        if decl.group("open") and decl.group("dims"):
+            table.filled = 0
+            depth = 1
+        tables.append(table)
+    return tables
+
+# Storage estimate of a generated header
+def header_footprint(text: str, style: str, config: config_t) -> footprint_t:
+    footprint = footprint_t(style = style, tables = header_tables(text, config))
+    for table in footprint.tables:
+        size = table.element_size * table.slots
+        totals = footprint.periphs.setdefault(table.periph, {"tables": 0, "flash": 0, "ram": 0})
+        totals["tables"] += 1
+        totals[table.storage] += size
+        if table.storage == "flash":
+            footprint.flash += size
+        else:
+            footprint.ram += size
+    return footprint
+
+# Arrays of a footprint with unfilled slots, largest unused storage first
+def sparse_tables(footprint: footprint_t) -> list[table_t]:
+    tables = [x for x in footprint.tables if x.filled < x.slots]
+    return sorted(tables, key = lambda x: -(x.slots - x.filled) * x.element_size)
+
+###################################################################################################
+# FOOTPRINT OUTPUT
+###################################################################################################
+
+# Plain-text report: totals of each style, storage of each peripheral and unused storage of each
+# sparse array
+def format_footprint_report(footprints: list[footprint_t], config: config_t) -> str:
+    lines = [f'Estimated storage of static tables ({config.pointer_size}-byte pointers)']
+    for footprint in footprints:
+        lines += ["", f'{footprint.style} style: {footprint.flash} bytes flash, {footprint.ram} bytes RAM, '
+                      f'{len(footprint.tables)} tables', "",
+                  f'  {"Peripheral":<24} {"Tables":>7} {"Flash":>9} {"RAM":>9}']
+        for periph, totals in sorted(footprint.periphs.items(), key = lambda x: -x[1]["flash"] - x[1]["ram"]):
+            lines.append(f'  {periph or "-":<24} {totals["tables"]:>7} {totals["flash"]:>9} {totals["ram"]:>9}')
+        sparse = sparse_tables(footprint)
+        if sparse:
+            lines += ["", f'  {"Sparse array":<40} {"Filled":>9} {"Bytes":>9} {"Unused":>9}']
+            for table in sparse:
+                lines.append(f'  {table.name:<40} {f"{table.filled}/{table.slots}":>9} '
+                             f'{table.element_size * table.slots:>9} '
+                             f'{table.element_size * (table.slots - table.filled):>9}')
+    return "\n".join(lines) + "\n"
+
+# JSON report: the footprint of each style with every table
+def format_footprint_json(footprints: list[footprint_t]) -> str:
+    return json.dumps({x.style: asdict(x) for x in footprints}, indent = 2) + "\n"
+
+###################################################################################################
+# FOOTPRINT REPORT AND BUDGETS
+###################################################################################################
+
+# Whether a config asks for a footprint report or budgets
+def wants_footprint(config: config_t) -> bool:
+    return (config.footprint_report_path is not None or config.flash_budget is not None
+            or config.ram_budget is not None)
+
+# Backends to emit for the footprint of a config besides its outputs: every table style when reporting
+def footprint_backends(config: config_t) -> list[str]:
+    if config.footprint_report_path is not None:
+        return list(TABLE_STYLES)
+    return []
+
+# Check the table styles generated by a config against its budgets (other styles are only reported)
+def check_budgets(footprints: list[footprint_t], config: config_t) -> None:
+    generated = [config.style, *config.extra_outputs]
+    for footprint in footprints:
+        if footprint.style not in generated:
+            continue
+        for storage, used, budget in (("flash", footprint.flash, config.flash_budget),
+                                      ("RAM", footprint.ram, config.ram_budget)):
+            if budget is not None and used > budget:
+                periph, totals = max(footprint.periphs.items(), key = lambda x: x[1][storage.lower()])
+                raise SVDError(f'Static tables of the {footprint.style} style take {used} bytes of {storage}, '
+                               f'over the budget of {budget} bytes (largest: {periph} with '
+                               f'{totals[storage.lower()]} bytes).')
+
+# Estimate the storage of the static tables of the headers emitted by a run (outputs by backend name),
+# writing the configured report (JSON for .json paths, text otherwise) and enforcing the budgets
+def write_footprint(texts: dict[str, str], config: config_t) -> None:
+    if not wants_footprint(config):
+        return
+    footprints = [header_footprint(texts[x], x, config) for x in TABLE_STYLES if x in texts]
+    for footprint in footprints:
+        log.info(f'{footprint.style} style tables: {footprint.flash} bytes flash, {footprint.ram} bytes RAM.')
+    if config.footprint_report_path is not None:
+        if config.footprint_report_path.endswith(".json"):
+            report = format_footprint_json(footprints)
+        else:
+            report = format_footprint_report(footprints, config)
+        old_report: str | None = None
+        if os.path.isfile(config.footprint_report_path):
+            with open(config.footprint_report_path) as file:
+                old_report = file.read()
+        if report != old_report:
+            write_output(report, config.footprint_report_path)
+    check_budgets(footprints, config)
@@ -0,0 +1,218 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries only, lookups must not pay for parsing whole SVD files
+from dataclasses import dataclass, asdict
+import xml.etree.ElementTree as ET
+import zipfile
+import difflib
+import fnmatch
+import hashlib
+import lzma
+import logging
+import json
+import os
+
+# Package modules
+from .common import SVDError, write_output
+from .archive import PACK_SEPARATOR, COMPRESSED_SUFFIXES, local_tag, is_pack_path, split_pack_path, pack_members, open_svd
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Default index file name, stored at the root of the SVD data directory
+INDEX_FILE_NAME: str = ".tal_svd_index.json"
+
+# Index file format version, older or newer index files are rebuilt
+INDEX_VERSION: int = 2
+
+# File name suffixes of indexed SVD files (pack archives are indexed member by member)
+SVD_SUFFIXES: tuple[str, ...] = (".svd", ".svd.gz", ".svd.xz")
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Indexed SVD file (path relative to the SVD data directory, "<pack>!<member>" for pack members): its
+# size (of the member for pack members), and the size and mtime of the file it was scanned from (the
+# pack for pack members) to detect changes
+@dataclass
+class index_entry_t:
+    path: str
+    vendor: str
+    device: str
+    cpu: str | None
+    size: int
+    file_size: int
+    mtime_ns: int
+    sha256: str
+
+# Read the device name and CPU name from the head of an SVD file, stopping at the peripherals
+def read_device_info(file) -> tuple[str | None, str | None]:
+    device_name: str | None = None
+    cpu_name: str | None = None
+    path: list[str] = []
+    for event, elem in ET.iterparse(file, events = ("start", "end")):
+        tag = local_tag(elem.tag)
+        if event == "start":
+            if tag == "peripherals":
+                break
+            path.append(tag)
+            continue
+        if path == ["device", "name"]:
+            device_name = (elem.text or "").strip()
+        elif path == ["device", "cpu", "name"]:
+            cpu_name = (elem.text or "").strip()
+        path.pop()
+    return device_name, cpu_name
+
+# Check whether the characters of a query appear in order within a name
+def is_subsequence(query: str, name: str) -> bool:
+    chars = iter(name)
+    return all(x in chars for x in query)
+
+# Hash a file in chunks
+def file_sha256(file) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+# SVD file name of an indexed path, without pack archive and compression suffix
+def svd_file_name(path: str) -> str:
+    file_name = os.path.basename(path.replace(PACK_SEPARATOR, "/"))
+    stem, suffix = os.path.splitext(file_name)
+    return stem if suffix.lower() in COMPRESSED_SUFFIXES else file_name
+
+# Scan a single SVD file (or pack member of the given size) into an index entry
+def scan_svd_file(svd_pkg_path: str, rel_path: str, st: os.stat_result, size: int) -> index_entry_t:
+    with open_svd(os.path.join(svd_pkg_path, rel_path)) as file:
+        device_name, cpu_name = read_device_info(file)
+    with open_svd(os.path.join(svd_pkg_path, rel_path)) as file:
+        sha256 = file_sha256(file)
+    file_name = svd_file_name(rel_path)
+    return index_entry_t(path = rel_path, vendor = rel_path.split(os.sep, 1)[0],
+                         device = device_name or file_name.split(".", 1)[0], cpu = cpu_name,
+                         size = size, file_size = st.st_size, mtime_ns = st.st_mtime_ns, sha256 = sha256)
+
+###################################################################################################
+# DEVICE INDEX
+###################################################################################################
+
+# Index of the SVD files of an SVD data directory (vendor folders holding SVD files)
+class svd_index_t:
+
+    def __init__(self, svd_pkg_path: str, index_path: str | None = None):
+        self.svd_pkg_path = os.path.abspath(svd_pkg_path)
+        self.index_path = index_path or os.path.join(self.svd_pkg_path, INDEX_FILE_NAME)
+        self.entries: dict[str, index_entry_t] = {}
+
+    # Read the index file, leaving the index empty when missing or outdated
+    def load(self) -> None:
+        try:
+            with open(self.index_path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.entries = {x["path"]: index_entry_t(**x) for x in data["entries"]}
+
+    # Write the index file
+    def save(self) -> None:
+        data = {"version": INDEX_VERSION, "entries": [asdict(x) for x in self.entries.values()]}
+        write_output(json.dumps(data, indent = 1), self.index_path)
+
+    # Rescan SVD files added or changed since the last refresh and drop removed ones, returns
+    # whether the index changed
+    def refresh(self) -> bool:
+        if not os.path.isdir(self.svd_pkg_path):
+            raise SVDError(f'SVD data directory {self.svd_pkg_path} not found.')
+        entries: dict[str, index_entry_t] = {}
+        old_entries: dict[str, list[index_entry_t]] = {}
+        for entry in self.entries.values():
+            old_entries.setdefault(split_pack_path(entry.path)[0], []).append(entry)
+        changed = False
+        for root, dirnames, filenames in os.walk(self.svd_pkg_path):
+            dirnames[:] = sorted(x for x in dirnames if not x.startswith("."))
+            for file_name in sorted(filenames):
+                is_pack = is_pack_path(file_name)
+                if not is_pack and not file_name.lower().endswith(SVD_SUFFIXES):
+                    continue
+                rel_path = os.path.relpath(os.path.join(root, file_name), self.svd_pkg_path)
+                if os.sep not in rel_path:
+                    continue
+                st = os.stat(os.path.join(root, file_name))
+                cached = old_entries.get(rel_path, [])
+                if cached and all(x.mtime_ns == st.st_mtime_ns and x.file_size == st.st_size for x in cached):
+                    entries.update((x.path, x) for x in cached)
+                    continue
+                try:
+                    if is_pack:
+                        sizes = {rel_path + PACK_SEPARATOR + x: y for x, y in pack_members(os.path.join(root, file_name)).items()}
+                    else:
+                        sizes = {rel_path: st.st_size}
+                except (OSError, zipfile.BadZipFile) as e:
+                    log.warning(f'Skipping {rel_path}: {e}')
+                    continue
+                for path, size in sizes.items():
+                    try:
+                        entries[path] = scan_svd_file(self.svd_pkg_path, path, st, size)
+                    except (OSError, EOFError, ET.ParseError, lzma.LZMAError, zipfile.BadZipFile) as e:
+                        log.warning(f'Skipping {path}: {e}')
+                    changed = True
+        changed = changed or entries.keys() != self.entries.keys()
+        self.entries = entries
+        return changed
+
+    # Absolute path of an indexed SVD file ("<pack>!<member>" for pack members)
+    def full_path(self, entry: index_entry_t) -> str:
+        return os.path.join(self.svd_pkg_path, entry.path)
+
+    # Find a device by exact name or file name (case insensitive)
+    def find(self, name: str, vendor: str | None = None) -> index_entry_t:
+        name = name.lower()
+        matches = [x for x in self.select(vendor = vendor)
+                   if x.device.lower() == name or svd_file_name(x.path).lower() in (name, name + ".svd")]
+        if not matches:
+            hint = self.search(name, vendor = vendor, limit = 3)
+            suggestion = f' Did you mean {", ".join(x.device for x in hint)}?' if hint else ""
+            raise SVDError(f'Device {name} not found in {self.svd_pkg_path}.{suggestion}')
+        if len(matches) > 1:
+            raise SVDError(f'Device {name} is ambiguous: {", ".join(x.path for x in matches)}.')
+        return matches[0]
+
+    # Fuzzy search of device names, best matches first
+    def search(self, query: str, vendor: str | None = None, limit: int = 10) -> list[index_entry_t]:
+        query = query.lower()
+        scored: list[tuple[float, str, index_entry_t]] = []
+        for entry in self.select(vendor = vendor):
+            device = entry.device.lower()
+            score = difflib.SequenceMatcher(None, query, device).ratio()
+            if query in device:
+                score += 1.0
+            elif is_subsequence(query, device):
+                score += 0.5
+            if score >= 0.5:
+                scored.append((-score, entry.path, entry))
+        return [x[2] for x in sorted(scored)[:limit]]
+
+    # Select devices by vendor, device name glob pattern and CPU name (all case insensitive)
+    def select(self, vendor: str | None = None, pattern: str | None = None, cpu: str | None = None) -> list[index_entry_t]:
+        return [x for x in self.entries.values()
+                if (vendor is None or x.vendor.lower() == vendor.lower())
+                and (pattern is None or fnmatch.fnmatch(x.device.lower(), pattern.lower()))
+                and (cpu is None or (x.cpu or "").lower() == cpu.lower())]
+
+# Load the index of an SVD data directory, refreshing and saving it when files changed
+def load_index(svd_pkg_path: str, index_path: str | None = None, refresh: bool = True) -> svd_index_t:
+    index = svd_index_t(svd_pkg_path, index_path)
+    index.load()
+    if (refresh or not index.entries) and index.refresh():
+        index.save()
+        log.info(f'Indexed {len(index.entries)} SVD files in {index.svd_pkg_path}.')
+    return index
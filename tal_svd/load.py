@@ -0,0 +1,194 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+from lxml import etree
+
+# Standard libraries
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import os
+
+# Package modules
+from .config import config_t
+from .common import SVDError
+from .fingerprint import find_svd_file
+from .archive import open_svd
+from .validate import parse_validated
+from .patch import load_patches, apply_patches
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Peripheral chunks handed to each worker process when parsing in parallel (smaller chunks balance
+# uneven peripherals better)
+CHUNKS_PER_WORKER: int = 4
+
+# Smallest serialized peripheral list worth parsing in parallel (bytes)
+MIN_PARALLEL_BYTES: int = 256 * 1024
+
+# Private cmsis_svd internals chunked parsing relies on (cmsis_svd 0.6, pinned in requirements.txt),
+# by owner name
+CHUNKED_PARSE_INTERNALS: dict[str, tuple[str, ...]] = {
+    "SVDXmlPreprocessing": ("_REGISTER_PROPERTIES_GROUP", "_propagate_register_properties_group",
+                            "_derived_from_enumerated_values", "_derived_from_field", "_derived_from_register",
+                            "_derived_from_cluster", "_derived_from_peripherals"),
+    "SVDParser": ("_parse_peripheral", "_parse_device"),
+    "SVDDevice": ("_set_parent_association",)
+}
+
+###################################################################################################
+# CHUNKED PARSING
+###################################################################################################
+
+# Check whether the installed cmsis_svd has the internals chunked parsing relies on
+def chunked_parse_supported() -> bool:
+    for owner, names in CHUNKED_PARSE_INTERNALS.items():
+        cls = getattr(svd.parser, owner, None)
+        if cls is None or not all(hasattr(cls, x) for x in names):
+            return False
+    return True
+
+# Parse a chunk of peripherals (a device element holding the device register properties and the
+# peripherals of the chunk) into model peripherals
+def parse_peripheral_chunk(xml: bytes) -> list[svd.parser.SVDPeripheral]:
+    root = etree.fromstring(xml)
+    svd.parser.SVDXmlPreprocessing(root)._propagate_register_properties_group()
+    parser = svd.SVDParser(etree.ElementTree(root))
+    return [parser._parse_peripheral(x) for x in root.findall("./peripherals/peripheral")]
+
+# Split the peripherals of an SVD tree into chunks of similar size for parse_peripheral_chunk
+# (derivedFrom references are resolved on the whole tree first so chunks stand alone), returns
+# None when the peripherals are too small to be worth it
+def split_peripherals(root: etree._Element, count: int) -> list[bytes] | None:
+    preprocessing = svd.parser.SVDXmlPreprocessing(root)
+    preprocessing._derived_from_enumerated_values()
+    preprocessing._derived_from_field()
+    preprocessing._derived_from_register()
+    preprocessing._derived_from_cluster()
+    preprocessing._derived_from_peripherals()
+    periphs = [etree.tostring(x) for x in root.findall("./peripherals/peripheral")]
+    total = sum(len(x) for x in periphs)
+    if total < MIN_PARALLEL_BYTES:
+        return None
+    properties = b"".join(etree.tostring(x) for x in (root.find(k) for k in
+                          sorted(svd.parser.SVDXmlPreprocessing._REGISTER_PROPERTIES_GROUP)) if x is not None)
+    chunks: list[bytes] = []
+    chunk: list[bytes] = []
+    size = 0
+    for periph in periphs:
+        chunk.append(periph)
+        size += len(periph)
+        if size * count >= total:
+            chunks.append(b"<device>" + properties + b"<peripherals>" + b"".join(chunk) + b"</peripherals></device>")
+            chunk, size = [], 0
+    if chunk:
+        chunks.append(b"<device>" + properties + b"<peripherals>" + b"".join(chunk) + b"</peripherals></device>")
+    return chunks
+
+# Parse an SVD tree with its peripherals split into chunks parsed in a process pool, giving the same
+# device as SVDParser.get_device (falls back to it for small SVD files)
+def parse_chunked(tree: etree._ElementTree, workers: int) -> svd.parser.SVDDevice:
+    root = tree.getroot()
+    chunks = split_peripherals(root, workers * CHUNKS_PER_WORKER)
+    if chunks is None:
+        svd.parser.SVDXmlPreprocessing(root)._propagate_register_properties_group()
+        return svd.SVDParser(tree)._parse_device(root)
+    with ProcessPoolExecutor(max_workers = workers) as pool:
+        results = pool.map(parse_peripheral_chunk, chunks)
+        for periph in root.findall("./peripherals/peripheral"):
+            periph.getparent().remove(periph)
+        device = svd.SVDParser(tree)._parse_device(root)
+        device.peripherals = [x for result in results for x in result]
+    device._set_parent_association()
+    return device
+
+###################################################################################################
+# SVD LOADING
+###################################################################################################
+
+# Find the path of an SVD file within the SVD data directory (same search as for_packaged_svd)
+def find_svd_path(config: config_t, svd_name: str) -> str:
+    path = find_svd_file(config.svd_pkg_path, config.vendor_name, svd_name)
+    if path is None:
+        raise SVDError(f'SVD file {svd_name} not found.')
+    return path
+
+# Return the paths of the SVD files of every configured core (core 1 first)
+def find_svd_paths(config: config_t) -> list[str]:
+    paths = [find_svd_path(config, config.core1_svd_name)]
+    if config.core2_svd_name:
+        paths.append(find_svd_path(config, config.core2_svd_name))
+    return paths
+
+# Load and parse a single SVD file from a path, compressed SVD files (.gz/.xz) and "<pack>!<device>"
+# paths are decompressed while parsing, schema validation verdicts are cached per content hash
+def load_svd_file(config: config_t, path: str) -> svd.parser.SVDDevice:
+    log.info(f'Parsing SVD file {os.path.basename(path)}...')
+    with open_svd(path) as file:
+        if config.xml_validation:
+            tree = parse_validated(file.read(), path)
+        else:
+            tree = etree.parse(file)
+    parallel = config.parallel_parse and available_cpus() > 1
+    if parallel and not chunked_parse_supported():
+        log.warning("Parallel parsing is not supported by the installed cmsis-svd (see requirements.txt).")
+        parallel = False
+    if parallel:
+        device = parse_chunked(tree, available_cpus())
+    else:
+        device = svd.SVDParser(tree).get_device()
+    if device is None:
+        raise SVDError(f'Invalid SVD file {path}.')
+    log.info(f'SVD file {os.path.basename(path)} loaded and parsed successfully!')
+    return device
+
+# Apply the configured patch files to freshly loaded devices
+def patch_devices(config: config_t, devices: list[svd.parser.SVDDevice]) -> list[svd.parser.SVDDevice]:
+    if not config.patch_paths:
+        return devices
+    patches = load_patches(config.patch_paths)
+    return [apply_patches(x, patches, in_place = True) for x in devices]
+
+# Load and parse a single SVD file from the SVD data directory, with the configured patches applied
+def load_device(config: config_t, svd_name: str) -> svd.parser.SVDDevice:
+    return patch_devices(config, [load_svd_file(config, find_svd_path(config, svd_name))])[0]
+
+# Number of CPUs this process may run on
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Load the SVD files of several cores concurrently (core 1 in this process, the others in a process
+# pool), raising a single error naming every core that failed
+def load_svd_files(config: config_t, paths: list[str]) -> list[svd.parser.SVDDevice]:
+    devices: list[svd.parser.SVDDevice | None] = [None] * len(paths)
+    errors: list[str] = []
+    with ProcessPoolExecutor(max_workers = max(len(paths) - 1, 1)) as pool:
+        futures = {i: pool.submit(load_svd_file, config, path) for i, path in enumerate(paths) if i > 0}
+        try:
+            devices[0] = load_svd_file(config, paths[0])
+        except Exception as e:
+            errors.append(f'core 1 ({os.path.basename(paths[0])}): {e}')
+        for i, future in futures.items():
+            try:
+                devices[i] = future.result()
+            except Exception as e:
+                errors.append(f'core {i + 1} ({os.path.basename(paths[i])}): {e}')
+    if errors:
+        raise SVDError("Failed to load SVD files: " + "; ".join(errors))
+    return devices
+
+# Load the SVD file of every configured core (core 1 first), with the configured patches applied
+# (cores are loaded one after the other when each one is parsed in parallel)
+def load_devices(config: config_t) -> list[svd.parser.SVDDevice]:
+    paths = find_svd_paths(config)
+    if len(paths) > 1 and available_cpus() > 1 and not config.parallel_parse:
+        return patch_devices(config, load_svd_files(config, paths))
+    return patch_devices(config, [load_svd_file(config, path) for path in paths])
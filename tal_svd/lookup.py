@@ -0,0 +1,148 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Requires "numpy" library -> pip install -U numpy
+import numpy as np
+
+# Standard libraries
+from dataclasses import dataclass
+import bisect
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Result of an address lookup (register is None for addresses inside a peripheral but not inside
+# any of its registers, lane is the byte offset of the address within the register)
+@dataclass
+class lookup_result_t:
+    address: int
+    peripheral: str
+    register: str | None = None
+    lane: int = 0
+    size: int | None = None
+
+# Sorted non-overlapping intervals [start, end) with an item index each, when intervals overlap
+# the one starting first keeps the shared addresses (lists for single lookups, arrays for batches)
+@dataclass
+class interval_table_t:
+    starts: list[int]
+    ends: list[int]
+    items: list[int]
+    start_array: np.ndarray | None = None
+    end_array: np.ndarray | None = None
+    item_array: np.ndarray | None = None
+
+# Build an interval table from (start, end, item) tuples
+def build_intervals(intervals: list[tuple[int, int, int]]) -> interval_table_t:
+    table = interval_table_t(starts = [], ends = [], items = [])
+    for start, end, item in sorted(intervals):
+        if table.ends and start < table.ends[-1]:
+            start = table.ends[-1]
+        if start < end:
+            table.starts.append(start)
+            table.ends.append(end)
+            table.items.append(item)
+    table.start_array = np.asarray(table.starts, dtype = np.uint64)
+    table.end_array = np.asarray(table.ends, dtype = np.uint64)
+    table.item_array = np.asarray(table.items, dtype = np.int64)
+    return table
+
+# Find the item of the interval holding an address (None if not covered)
+def find_interval(table: interval_table_t, address: int) -> int | None:
+    i = bisect.bisect_right(table.starts, address) - 1
+    if i >= 0 and address < table.ends[i]:
+        return table.items[i]
+    return None
+
+# Find the items of the intervals holding each address (-1 if not covered)
+def find_intervals(table: interval_table_t, addresses: np.ndarray) -> np.ndarray:
+    if not table.starts:
+        return np.full(addresses.shape, -1, dtype = np.int64)
+    i = np.searchsorted(table.start_array, addresses, side = "right") - 1
+    valid = i >= 0
+    i = np.where(valid, i, 0)
+    return np.where(valid & (addresses < table.end_array[i]), table.item_array[i], -1)
+
+###################################################################################################
+# ADDRESS INDEX
+###################################################################################################
+
+# Reverse lookup from bus addresses to peripherals, registers and byte lanes of a device
+class address_index_t:
+
+    def __init__(self, device: svd.parser.SVDDevice):
+        self.periph_names: list[str] = []
+        self.reg_names: list[str] = []
+        self.reg_periphs: list[int] = []
+        self.reg_starts: list[int] = []
+        self.reg_sizes: list[int] = []
+        periph_intervals: list[tuple[int, int, int]] = []
+        reg_intervals: list[tuple[int, int, int]] = []
+        for peripheral in device.get_peripherals():
+            periph_index = len(self.periph_names)
+            self.periph_names.append(peripheral.name)
+            periph_end = peripheral.base_address
+            for register in peripheral.get_registers():
+                start = peripheral.base_address + register.address_offset
+                size = register.size or device.width or 32
+                reg_intervals.append((start, start + max(size // 8, 1), len(self.reg_names)))
+                periph_end = max(periph_end, start + max(size // 8, 1))
+                self.reg_names.append(register.name)
+                self.reg_periphs.append(periph_index)
+                self.reg_starts.append(start)
+                self.reg_sizes.append(size)
+            if peripheral.address_blocks:
+                for block in peripheral.address_blocks:
+                    start = peripheral.base_address + block.offset
+                    periph_intervals.append((start, start + block.size, periph_index))
+            elif periph_end > peripheral.base_address:
+                periph_intervals.append((peripheral.base_address, periph_end, periph_index))
+        self.periph_table = build_intervals(periph_intervals)
+        self.reg_table = build_intervals(reg_intervals)
+        self.reg_periph_array = np.asarray(self.reg_periphs, dtype = np.int64)
+        self.reg_start_array = np.asarray(self.reg_starts, dtype = np.uint64)
+
+    # Look up a single address, None if it is outside every peripheral
+    def lookup(self, address: int) -> lookup_result_t | None:
+        reg_index = find_interval(self.reg_table, address)
+        if reg_index is not None:
+            return lookup_result_t(address = address, peripheral = self.periph_names[self.reg_periphs[reg_index]],
+                                   register = self.reg_names[reg_index], lane = address - self.reg_starts[reg_index],
+                                   size = self.reg_sizes[reg_index])
+        periph_index = find_interval(self.periph_table, address)
+        if periph_index is not None:
+            return lookup_result_t(address = address, peripheral = self.periph_names[periph_index])
+        return None
+
+    # Look up a batch of addresses, returning peripheral indices, register indices and byte lanes
+    # (-1 where not found) indexing periph_names and reg_names
+    def lookup_many(self, addresses: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        addresses = np.asarray(addresses, dtype = np.uint64)
+        reg_index = find_intervals(self.reg_table, addresses)
+        found = reg_index >= 0
+        safe_index = np.where(found, reg_index, 0)
+        periph_index = find_intervals(self.periph_table, addresses)
+        lane = np.full(addresses.shape, -1, dtype = np.int64)
+        if self.reg_names:
+            periph_index = np.where(found, self.reg_periph_array[safe_index], periph_index)
+            lane = np.where(found, (addresses - self.reg_start_array[safe_index]).astype(np.int64), -1)
+        return periph_index, reg_index, lane
+
+    # Look up a batch of addresses as result objects (None where not found)
+    def lookup_all(self, addresses: list[int]) -> list[lookup_result_t | None]:
+        periph_index, reg_index, lane = self.lookup_many(np.asarray(addresses, dtype = np.uint64))
+        results: list[lookup_result_t | None] = []
+        for address, p, r, b in zip(addresses, periph_index.tolist(), reg_index.tolist(), lane.tolist()):
+            if p < 0:
+                results.append(None)
+            elif r < 0:
+                results.append(lookup_result_t(address = address, peripheral = self.periph_names[p]))
+            else:
+                results.append(lookup_result_t(address = address, peripheral = self.periph_names[p],
+                                               register = self.reg_names[r], lane = b, size = self.reg_sizes[r]))
+        return results
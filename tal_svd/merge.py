@@ -0,0 +1,127 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+import logging
+
+# Package modules
+from .config import config_t
+from .transform import flatten_arrays
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# DUAL-CORE MERGING
+###################################################################################################
+
+# Merge the core 2 device into the core 1 device, prefixing elements only present in one core
+def merge_devices(device1: svd.parser.SVDDevice, device2: svd.parser.SVDDevice,
+                  config: config_t, in_place: bool = False) -> svd.parser.SVDDevice:
+    device1 = flatten_arrays(device1, in_place)
+    device2 = flatten_arrays(device2, in_place)
+
+    # Iterate through peripherals in core 1 -> core 2
+    for peripheral1 in device1.peripherals:
+        log.debug(f'Merging core 1 peripheral: {peripheral1.name.upper()}...')
+        peripheral_found: bool = False
+        for peripheral2 in device2.peripherals:
+            if (peripheral2.name == peripheral1.name and
+                peripheral2.base_address == peripheral1.base_address):
+                peripheral_found = True
+
+                # Find interrupts only in core 1 and rename them
+                if peripheral1.interrupts:
+                    for interrupt1 in peripheral1.interrupts:
+                        if (not peripheral2.interrupts or
+                            not any(interrupt2.name == interrupt1.name and
+                                    interrupt2.value == interrupt1.value
+                                    for interrupt2 in peripheral2.interrupts)):
+                            interrupt1.name = f'{config.core1_prefix}_{interrupt1.name}'
+
+                # Iterate through registers in core 1 -> core 2
+                if peripheral1.registers:
+                    for register1 in peripheral1.registers:
+                        register_found: bool = False
+                        if peripheral2.registers:
+                            for register2 in peripheral2.registers:
+                                if (register2.name == register1.name and
+                                    register2.address_offset == register1.address_offset and
+                                    register2.size == register1.size and
+                                    register2.access == register1.access):
+                                    register_found = True
+
+                                    # Find fields only in core 1 and rename them
+                                    if register1.fields:
+                                        for field1 in register1.fields:
+                                            if (not register2.fields or
+                                                not any(field2.name == field1.name and
+                                                        field2.bit_offset == field1.bit_offset and
+                                                        field2.bit_width == field1.bit_width
+                                                        for field2 in register2.fields)):
+                                                field1.name = f'{config.core1_prefix}_{field1.name}'
+
+                        # If register only in core 1, rename it
+                        if not register_found:
+                            register1.name = f'{config.core1_prefix}_{register1.name}'
+
+        # If peripheral only in core 1, rename it
+        if not peripheral_found:
+            peripheral1.name = f'{config.core1_prefix}_{peripheral1.name}'
+
+    # Iterate through peripherals in core 2 -> core 1
+    for peripheral2 in device2.peripherals:
+        log.debug(f'Merging core 2 peripheral: {peripheral2.name.upper()}...')
+        peripheral_found: bool = False
+        for peripheral1 in device1.peripherals:
+            if (peripheral2.name == peripheral1.name and
+                peripheral2.base_address == peripheral1.base_address):
+                peripheral_found = True
+
+                # Find interrupts only in core 2, rename them and add them to core 1
+                if peripheral2.interrupts:
+                    for interrupt2 in peripheral2.interrupts:
+                        if (not peripheral1.interrupts or
+                            not any(interrupt1.name == interrupt2.name and
+                                    interrupt1.value == interrupt2.value
+                                    for interrupt1 in peripheral1.interrupts)):
+                            interrupt2.name = f'{config.core2_prefix}_{interrupt2.name}'
+                            peripheral1.interrupts.append(interrupt2)
+
+                # Iterate through registers in core 2 -> core 1
+                if peripheral2.registers:
+                    for register2 in peripheral2.registers:
+                        register_found: bool = False
+                        if peripheral1.registers:
+                            for register1 in peripheral1.registers:
+                                if (register2.name == register1.name and
+                                    register2.address_offset == register1.address_offset and
+                                    register2.size == register1.size and
+                                    register2.access == register1.access):
+                                    register_found = True
+
+                                    # Find fields only in core 2, rename them and add them to core 1
+                                    if register2.fields:
+                                        for field2 in register2.fields:
+                                            if (not register1.fields or
+                                                not any(field1.name == field2.name and
+                                                        field1.bit_offset == field2.bit_offset and
+                                                        field1.bit_width == field2.bit_width
+                                                        for field1 in register1.fields)):
+                                                field2.name = f'{config.core2_prefix}_{field2.name}'
+                                                register1.fields.append(field2)
+
+                        # If register only in core 2, rename it and add it to core 1
+                        if not register_found:
+                            register2.name = f'{config.core2_prefix}_{register2.name}'
+                            peripheral1.registers.append(register2)
+
+        # If peripheral only in core 2, rename it and add it to core 1
+        if not peripheral_found:
+            peripheral2.name = f'{config.core2_prefix}_{peripheral2.name}'
+            device1.peripherals.append(peripheral2)
+
+    return device1
@@ -0,0 +1,290 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass, field
+import fnmatch
+import tomllib
+import logging
+
+# Package modules
+from .common import SVDError, own_device
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Patch actions
+PATCH_ACTIONS: tuple[str, ...] = ("delete", "rename", "add", "modify")
+
+# Element levels a patch path goes through, outermost first
+PATCH_LEVELS: tuple[str, ...] = ("peripheral", "register", "field")
+
+# Attribute holding the children of each level (also the expanded elements of SVD arrays)
+CHILD_ATTRS: dict[str, str] = {"peripheral": "peripherals", "register": "registers", "field": "fields"}
+
+# Model classes of elements created by "add" patches
+ELEMENT_CLASSES: dict[str, type] = {
+    "peripheral": svd.parser.SVDPeripheral,
+    "register": svd.parser.SVDRegister,
+    "field": svd.parser.SVDField,
+    "interrupt": svd.parser.SVDInterrupt
+}
+
+# Attribute values converted from their TOML form
+ATTRIBUTE_TYPES: dict[str, type] = {"access": svd.parser.SVDAccessType}
+
+# Keys of a patch entry in a patch file
+PATCH_KEYS: tuple[str, ...] = ("action", "device", "peripheral", "register", "field", "interrupt",
+                               "exclude", "name", "set", "defaults")
+
+###################################################################################################
+# PATCHES
+###################################################################################################
+
+# Edit of the elements matched by a path of name patterns (peripheral, then register, then field),
+# or of the interrupts of the matched peripherals selected by name pattern or value. Patch files
+# hold a list of [[patch]] tables with the same keys, for example:
+#
+#   [[patch]]
+#   action = "delete"
+#   peripheral = "*"
+#   exclude = ["ADC3"]
+#   interrupt = 127
+@dataclass
+class patch_t:
+    action: str
+    path: dict[str, str]
+    interrupt: str | int | None = None
+    device: str = "*"
+    exclude: list[str] = field(default_factory = list)
+    name: str | None = None
+    values: dict = field(default_factory = dict)
+    defaults: dict = field(default_factory = dict)
+    source: str = "patch"
+
+# Check whether a name pattern holds wildcards
+def is_pattern(text: str) -> bool:
+    return any(x in text for x in "*?[")
+
+# Convert a patch attribute value to its model type
+def attribute_value(key: str, value):
+    return ATTRIBUTE_TYPES[key](value) if key in ATTRIBUTE_TYPES and not isinstance(value, ATTRIBUTE_TYPES[key]) else value
+
+# Build a patch from a patch file entry
+def parse_patch(entry: dict, source: str) -> patch_t:
+    for key in entry:
+        if key not in PATCH_KEYS:
+            raise SVDError(f'{source}: unknown patch key "{key}".')
+    patch = patch_t(action = entry.get("action"), source = source, device = entry.get("device", "*"),
+                    path = {x: entry[x] for x in PATCH_LEVELS if x in entry},
+                    interrupt = entry.get("interrupt"), exclude = entry.get("exclude", []),
+                    name = entry.get("name"), values = entry.get("set", {}), defaults = entry.get("defaults", {}))
+    if patch.action not in PATCH_ACTIONS:
+        raise SVDError(f'{source}: action must be one of {", ".join(PATCH_ACTIONS)}.')
+    if list(patch.path) != list(PATCH_LEVELS[:len(patch.path)]):
+        raise SVDError(f'{source}: patch path must start at the peripheral and skip no level.')
+    if patch.interrupt is not None and len(patch.path) > 1:
+        raise SVDError(f'{source}: interrupt patches select peripherals only.')
+    if patch.interrupt is None and not patch.path:
+        raise SVDError(f'{source}: patch selects no element.')
+    if patch.action == "rename" and not patch.name:
+        raise SVDError(f'{source}: rename patch needs a name.')
+    if patch.action == "add":
+        new_name = patch.interrupt if patch.interrupt is not None else list(patch.path.values())[-1]
+        if not isinstance(new_name, str) or is_pattern(new_name):
+            raise SVDError(f'{source}: added element needs a plain name.')
+    return patch
+
+# Load the patches of patch files, in file order
+def load_patches(paths: list[str]) -> list[patch_t]:
+    patches: list[patch_t] = []
+    for path in paths:
+        try:
+            with open(path, "rb") as file:
+                entries = tomllib.load(file).get("patch", [])
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise SVDError(f'Invalid patch file {path}: {e}')
+        patches += [parse_patch(x, f'{path} patch {i + 1}') for i, x in enumerate(entries)]
+    return patches
+
+###################################################################################################
+# MODEL INDEX
+###################################################################################################
+
+# Upper-cased name index of the elements of a device, each element with the list holding it so
+# patches find, delete and rename elements without scanning the model
+class model_index_t:
+
+    def __init__(self, device: svd.parser.SVDDevice):
+        self.device = device
+        self.children: dict[tuple[int, str], dict[str, list[tuple[list, object]]]] = {}
+        self.irq_values: dict[int, list[tuple[svd.parser.SVDPeripheral, svd.parser.SVDInterrupt]]] = {}
+        for _, periph in self.elements(device, "peripheral"):
+            for isr in periph.interrupts or []:
+                self.irq_values.setdefault(isr.value, []).append((periph, isr))
+
+    # Children of an element at a level with their holding lists, SVD arrays and clusters
+    # contribute their elements (lookups leave the model untouched, missing lists stay None)
+    def elements(self, parent, level: str) -> list[tuple[list, object]]:
+        attr = CHILD_ATTRS[level]
+        found = []
+        for child in getattr(parent, attr) or []:
+            items = getattr(child, attr, None)
+            if isinstance(items, list):
+                found += [(items, x) for x in items]
+            else:
+                found.append((getattr(parent, attr), child))
+        return found
+
+    # Name index of the children of an element at a level, built on first use
+    def names(self, parent, level: str) -> dict[str, list[tuple[list, object]]]:
+        key = (id(parent), level)
+        if key not in self.children:
+            names: dict[str, list[tuple[list, object]]] = {}
+            for item in self.elements(parent, level):
+                names.setdefault(item[1].name.upper(), []).append(item)
+            self.children[key] = names
+        return self.children[key]
+
+    # Children of an element at a level whose names match a pattern and no exclude pattern
+    def match(self, parent, level: str, pattern: str, exclude: list[str] | None = None) -> list[tuple[list, object]]:
+        names = self.names(parent, level)
+        if is_pattern(pattern):
+            keys = [x for x in names if fnmatch.fnmatchcase(x, pattern.upper())]
+        else:
+            keys = [pattern.upper()] if pattern.upper() in names else []
+        keys = [x for x in keys if not any(fnmatch.fnmatchcase(x, y.upper()) for y in exclude or [])]
+        return [x for key in keys for x in names[key]]
+
+    # Interrupts of matched peripherals selected by value or name pattern
+    def match_irqs(self, periphs: list, interrupt: str | int) -> list[tuple[svd.parser.SVDPeripheral, svd.parser.SVDInterrupt]]:
+        periph_ids = {id(x) for x in periphs}
+        if isinstance(interrupt, int):
+            return [x for x in self.irq_values.get(interrupt, []) if id(x[0]) in periph_ids]
+        return [(x, y) for x in periphs for y in x.interrupts or [] if fnmatch.fnmatchcase(y.name.upper(), interrupt.upper())]
+
+    # Add an element to the children of an element
+    def add(self, parent, level: str, element) -> None:
+        names = self.names(parent, level)
+        if element.name.upper() in names:
+            raise SVDError(f'{level.capitalize()} {element.name} already exists.')
+        container = getattr(parent, CHILD_ATTRS[level])
+        if container is None:
+            container = []
+            setattr(parent, CHILD_ATTRS[level], container)
+        container.append(element)
+        names[element.name.upper()] = [(container, element)]
+
+    # Drop an element from a name index
+    def unindex(self, names: dict[str, list[tuple[list, object]]], element) -> tuple[list, object] | None:
+        key = element.name.upper()
+        item = next((x for x in names.get(key, []) if x[1] is element), None)
+        names[key] = [x for x in names.get(key, []) if x[1] is not element]
+        if not names[key]:
+            del names[key]
+        return item
+
+    # Rename a child of an element
+    def rename(self, parent, level: str, element, name: str) -> None:
+        names = self.names(parent, level)
+        item = self.unindex(names, element)
+        element.name = name
+        names.setdefault(name.upper(), []).append(item)
+
+    # Delete children of an element (one pass over each holding list)
+    def delete(self, parent, level: str, items: list[tuple[list, object]]) -> None:
+        doomed = {id(x[1]) for x in items}
+        for container in {id(x[0]): x[0] for x in items}.values():
+            container[:] = [x for x in container if id(x) not in doomed]
+        names = self.names(parent, level)
+        for _, element in items:
+            self.unindex(names, element)
+
+    # Register an interrupt added to a peripheral
+    def add_irq(self, periph: svd.parser.SVDPeripheral, isr: svd.parser.SVDInterrupt) -> None:
+        if periph.interrupts is None:
+            periph.interrupts = []
+        periph.interrupts.append(isr)
+        self.irq_values.setdefault(isr.value, []).append((periph, isr))
+
+    # Delete interrupts from their peripherals
+    def delete_irqs(self, irqs: list[tuple[svd.parser.SVDPeripheral, svd.parser.SVDInterrupt]]) -> None:
+        doomed = {id(x[1]) for x in irqs}
+        for periph in {id(x[0]): x[0] for x in irqs}.values():
+            periph.interrupts[:] = [x for x in periph.interrupts if id(x) not in doomed]
+        for value in {x[1].value for x in irqs}:
+            self.irq_values[value] = [x for x in self.irq_values[value] if id(x[1]) not in doomed]
+
+###################################################################################################
+# PATCH APPLICATION
+###################################################################################################
+
+# Set patch values on an element (defaults only replace unset values)
+def modify_element(element, patch: patch_t) -> None:
+    for values, overwrite in ((patch.values, True), (patch.defaults, False)):
+        for key, value in values.items():
+            if not hasattr(element, key):
+                raise SVDError(f'{patch.source}: {type(element).__name__} has no attribute "{key}".')
+            if overwrite or not getattr(element, key):
+                setattr(element, key, attribute_value(key, value))
+
+# Apply one patch to an indexed device
+def apply_patch(index: model_index_t, patch: patch_t) -> None:
+    levels = list(patch.path)
+    parents: list = [index.device]
+    for level in (levels if patch.interrupt is not None else levels[:-1]):
+        exclude = patch.exclude if level == "peripheral" else []
+        parents = [x[1] for parent in parents for x in index.match(parent, level, patch.path[level], exclude)]
+    if patch.interrupt is not None:
+        if not levels:
+            parents = [x[1] for x in index.match(index.device, "peripheral", "*", patch.exclude)]
+        if patch.action == "add":
+            values = {key: attribute_value(key, value) for key, value in patch.values.items()}
+            for periph in parents:
+                index.add_irq(periph, ELEMENT_CLASSES["interrupt"](name = patch.interrupt, **values))
+            return
+        irqs = index.match_irqs(parents, patch.interrupt)
+        if not irqs:
+            log.warning(f'{patch.source}: no interrupt matches {patch.interrupt}.')
+        if patch.action == "delete":
+            index.delete_irqs(irqs)
+        for _, isr in irqs if patch.action != "delete" else []:
+            if patch.action == "rename":
+                isr.name = patch.name
+            modify_element(isr, patch)
+        return
+    level = levels[-1]
+    if patch.action == "add":
+        values = {key: attribute_value(key, value) for key, value in patch.values.items()}
+        for parent in parents:
+            index.add(parent, level, ELEMENT_CLASSES[level](name = patch.path[level], **values))
+        return
+    exclude = patch.exclude if level == "peripheral" else []
+    matches = [(parent, index.match(parent, level, patch.path[level], exclude)) for parent in parents]
+    if not any(x[1] for x in matches):
+        log.warning(f'{patch.source}: no {level} matches {".".join(patch.path.values())}.')
+    for parent, items in matches:
+        if patch.action == "delete":
+            index.delete(parent, level, items)
+            continue
+        for _, element in items:
+            if patch.action == "rename":
+                index.rename(parent, level, element, patch.name)
+            modify_element(element, patch)
+
+# Apply patches to a device, skipping patches made for other devices
+def apply_patches(device: svd.parser.SVDDevice, patches: list[patch_t],
+                  in_place: bool = False) -> svd.parser.SVDDevice:
+    device = own_device(device, in_place)
+    index = model_index_t(device)
+    for patch in patches:
+        if fnmatch.fnmatchcase((device.name or "").upper(), patch.device.upper()):
+            apply_patch(index, patch)
+    return device
@@ -0,0 +1,40 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Package modules
+from .config import config_t
+from .common import SVDError
+from .merge import merge_devices
+from .transform import fill_defaults, share_layouts, normalize_device, de_enum_device
+from .emit_macro import emit_macro_header
+from .emit_enum import emit_enum_header
+from .emit_array import emit_array_header
+
+###################################################################################################
+# PIPELINE
+###################################################################################################
+
+# Supported output styles
+STYLES: tuple[str, ...] = ("macro", "enum", "array")
+
+# Run the merge, transform and emit stages of the configured style on loaded core devices
+def generate(devices: list[svd.parser.SVDDevice], config: config_t, in_place: bool = False) -> str:
+    if config.style == "macro":
+        device = devices[0]
+        if len(devices) > 1:
+            device = merge_devices(devices[0], devices[1], config, in_place = in_place)
+            in_place = True
+        device = fill_defaults(device, config, in_place = in_place)
+        if config.share_periph_layouts:
+            device = share_layouts(device, config, in_place = True)
+        return emit_macro_header(device, config)
+    if config.style == "enum":
+        device = normalize_device(devices[0], config, in_place = in_place)
+        return emit_enum_header(de_enum_device(device, config, in_place = True), config)
+    if config.style == "array":
+        return emit_array_header(normalize_device(devices[0], config, in_place = in_place), config)
+    raise SVDError(f'Unknown output style "{config.style}".')
@@ -0,0 +1,240 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+import socketserver
+import threading
+import logging
+import json
+import os
+import re
+
+# Package modules
+from .config import config_t, load_config
+from .common import SVDError
+from .load import load_devices
+from .pipeline import generate
+from .lookup import address_index_t
+from .decode import decoder_t
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Default number of rendered header fragments kept in memory
+DEFAULT_CACHE_SIZE: int = 256
+
+# Start of a peripheral section in rendered headers
+SECTION_PATTERN: re.Pattern = re.compile(r"^[ \t]*/\*+\n[ \t]*\* @section (\S+)[^\n]*\n", re.MULTILINE)
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Device served from memory with its lookup tables
+@dataclass
+class served_device_t:
+    device: svd.parser.SVDDevice
+    addresses: address_index_t
+    decoder: decoder_t
+    peripherals: dict[str, svd.parser.SVDPeripheral] = field(default_factory = dict)
+    interrupts: dict[int, list[tuple[str, svd.parser.SVDInterrupt]]] = field(default_factory = dict)
+
+# Build the lookup tables of a device
+def serve_device(device: svd.parser.SVDDevice) -> served_device_t:
+    served = served_device_t(device = device, addresses = address_index_t(device), decoder = decoder_t(device))
+    for peripheral in device.get_peripherals():
+        served.peripherals.setdefault(peripheral.name.upper(), peripheral)
+        for interrupt in peripheral.interrupts or []:
+            served.interrupts.setdefault(interrupt.value, []).append((peripheral.name, interrupt))
+    return served
+
+# Split a rendered header into peripheral sections
+def split_sections(text: str) -> dict[str, str]:
+    matches = list(SECTION_PATTERN.finditer(text))
+    sections: dict[str, str] = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else text.rfind("#ifdef __cplusplus")
+        sections.setdefault(match.group(1).upper(), text[match.start():end].rstrip() + "\n")
+    return sections
+
+# Integer of a query (numbers or number strings), checked to fit the 64-bit unsigned lookup tables
+def query_int(value: int | str) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise SVDError(f'Invalid integer {value!r}.')
+    number = int(value, 0) if isinstance(value, str) else value
+    if not 0 <= number < 2 ** 64:
+        raise SVDError(f'Integer {value} is out of range (0 to 2**64-1).')
+    return number
+
+# JSON form of an interrupt
+def irq_json(periph_name: str, interrupt: svd.parser.SVDInterrupt) -> dict:
+    return {"peripheral": periph_name, "name": interrupt.name, "value": interrupt.value,
+            "description": interrupt.description}
+
+###################################################################################################
+# QUERY SERVICE
+###################################################################################################
+
+# Answers register metadata queries from devices loaded once
+class query_service_t:
+
+    def __init__(self, config_paths: list[str], cache_size: int = DEFAULT_CACHE_SIZE):
+        self.configs: dict[str, config_t] = {}
+        self.config_devices: dict[str, list[svd.parser.SVDDevice]] = {}
+        self.devices: dict[str, served_device_t] = {}
+        self.fragments: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self.render_lock = threading.Lock()
+        for path in config_paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            config = load_config(path)
+            devices = load_devices(config)
+            self.configs[name] = config
+            self.config_devices[name] = devices
+            for device in devices:
+                self.devices.setdefault(device.name.upper(), serve_device(device))
+
+    # Find a served device by name (optional when a single device is served)
+    def device(self, name: str | None) -> served_device_t:
+        if name is None and len(self.devices) == 1:
+            return next(iter(self.devices.values()))
+        if name is None:
+            raise SVDError(f'Several devices are served, select one of {", ".join(self.devices)}.')
+        served = self.devices.get(name.upper())
+        if served is None:
+            raise SVDError(f'Device {name} is not served.')
+        return served
+
+    # Rendered header fragment of a peripheral section, rendering the whole header on a miss and
+    # keeping the most recently used fragments
+    def fragment(self, config_name: str | None, section: str) -> str:
+        if config_name is None and len(self.configs) == 1:
+            config_name = next(iter(self.configs))
+        if config_name not in self.configs:
+            raise SVDError(f'Config {config_name} is not served.')
+        key = (config_name, section.upper())
+        with self.lock:
+            if key in self.fragments:
+                self.fragments.move_to_end(key)
+                return self.fragments[key]
+        with self.render_lock:
+            sections = split_sections(generate(self.config_devices[config_name], self.configs[config_name]))
+        if key[1] not in sections:
+            raise SVDError(f'Section {section} not found in {config_name} header.')
+        with self.lock:
+            for name, text in sections.items():
+                self.fragments[(config_name, name)] = text
+                self.fragments.move_to_end((config_name, name))
+            self.fragments.move_to_end(key)
+            while len(self.fragments) > self.cache_size:
+                self.fragments.popitem(last = False)
+        return sections[key[1]]
+
+    # Answer a single query
+    def query(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "devices":
+            return {"devices": sorted(self.devices), "configs": sorted(self.configs)}
+        if op == "fragment":
+            return {"text": self.fragment(request.get("config"), request["section"])}
+        served = self.device(request.get("device"))
+        if op == "peripheral":
+            peripheral = served.peripherals.get(request["name"].upper())
+            if peripheral is None:
+                raise SVDError(f'Peripheral {request["name"]} not found.')
+            return {"name": peripheral.name, "base_address": peripheral.base_address, "group": peripheral.group_name,
+                    "description": peripheral.description, "derived_from": peripheral.derived_from,
+                    "registers": [x.name for x in peripheral.get_registers()],
+                    "interrupts": [irq_json(peripheral.name, x) for x in peripheral.interrupts or []]}
+        if op == "register":
+            layout = served.decoder.layout(request["name"])
+            return {"peripheral": layout.peripheral, "name": layout.register, "address": layout.address,
+                    "size": layout.size, "reset_value": layout.reset_value,
+                    "fields": [{"name": x, "mask": m, "pos": p} for x, m, p in
+                               zip(layout.field_names, layout.masks.tolist(), layout.positions.tolist())]}
+        if op == "address":
+            addresses = request["addresses"] if "addresses" in request else [request["address"]]
+            addresses = [query_int(x) for x in addresses]
+            return {"results": [asdict(x) if x is not None else None for x in served.addresses.lookup_all(addresses)]}
+        if op == "irq":
+            if "value" in request:
+                matches = served.interrupts.get(int(request["value"]), [])
+            else:
+                matches = [x for y in served.interrupts.values() for x in y if x[1].name.upper() == request["name"].upper()]
+            return {"interrupts": [irq_json(*x) for x in matches]}
+        if op == "decode":
+            values = [query_int(x) for x in request["values"]]
+            return {"fields": {x: y.tolist() for x, y in served.decoder.decode_trace(request["register"], values).items()}}
+        raise SVDError(f'Unknown query "{op}".')
+
+    # Answer a query or a batch (list) of queries, reporting errors per query
+    def handle(self, request: dict | list) -> dict | list:
+        if isinstance(request, list):
+            return [self.handle(x) if not isinstance(x, list) else {"error": "Query is not a JSON object."}
+                    for x in request]
+        if not isinstance(request, dict):
+            return {"error": "Query is not a JSON object."}
+        try:
+            return self.query(request)
+        except (SVDError, KeyError, ValueError, TypeError) as e:
+            return {"error": str(e) if not isinstance(e, KeyError) else f'Missing key {e}.'}
+
+###################################################################################################
+# SERVER
+###################################################################################################
+
+# JSON over HTTP request handler (POST a query object or a list of queries)
+class query_handler_t(BaseHTTPRequestHandler):
+    service: query_service_t
+
+    def do_POST(self) -> None:
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            body = json.dumps(self.service.handle(request)).encode()
+            self.send_response(200)
+        except ValueError as e:
+            body = json.dumps({"error": f'Invalid JSON: {e}'}).encode()
+            self.send_response(400)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        return str(self.client_address[0]) if self.client_address else "local"
+
+    def log_message(self, format: str, *args) -> None:
+        log.debug(format % args)
+
+# HTTP server on a Unix domain socket
+class unix_http_server_t(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+# Serve queries on localhost (TCP port) or on a Unix domain socket until interrupted
+def serve(service: query_service_t, port: int = 8765, socket_path: str | None = None) -> None:
+    handler = type("handler_t", (query_handler_t,), {"service": service})
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = unix_http_server_t(socket_path, handler)
+        log.info(f'Serving {", ".join(service.devices)} on {socket_path}.')
+    else:
+        server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        log.info(f'Serving {", ".join(service.devices)} on http://127.0.0.1:{server.server_port}.')
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -0,0 +1,122 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from dataclasses import dataclass
+import json
+import re
+import os
+
+# Package modules
+from .config import config_t
+from .common import write_output
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Output line ending in a description comment
+COMMENT_LINE: re.Pattern = re.compile(r"^(?P<code>.*?\S)\s+/\*\* @brief (?P<desc>.*) \*/$")
+
+# Symbol declared by a line of generated code
+DEFINE_SYMBOL: re.Pattern = re.compile(r"^#define\s+(\w+)")
+TYPEDEF_SYMBOL: re.Pattern = re.compile(r"^typedef\b.*?(\w+)\s*;$")
+STATIC_SYMBOL: re.Pattern = re.compile(r"^static\b.*?(\w+)\s*(?:\[[^\]]*\]\s*)*=")
+
+# Lines opening and closing the (nested) initializers of array tables
+ARRAY_OPEN: re.Pattern = re.compile(r"^(?:static\b.*?(\w+)\s*(?:\[[^\]]*\]\s*)+|(\[\d+\])\s*)=\s*\{$")
+ARRAY_CLOSE: re.Pattern = re.compile(r"^\}[,;]?$")
+ARRAY_ELEMENT: re.Pattern = re.compile(r"^(\[\d+\])\s*=")
+
+# Doxygen commands documenting each kind of symbol in a doc-only header
+DOC_COMMANDS: dict[str, str] = {"def": "@def", "typedef": "@typedef", "var": "@var"}
+
+###################################################################################################
+# DESCRIPTION SIDECARS
+###################################################################################################
+
+# Description of a generated symbol (array table elements are named "<table>[<index>]..." and
+# documented with their table)
+@dataclass
+class doc_entry_t:
+    symbol: str
+    kind: str
+    description: str
+    table: str | None = None
+
+# Remove the description comments of generated code, returning the slimmed code and the
+# description of every commented symbol in output order
+def split_descriptions(text: str) -> tuple[str, list[doc_entry_t]]:
+    lines: list[str] = []
+    entries: list[doc_entry_t] = []
+    tables: list[str] = []
+    for line in text.split("\n"):
+        code = line.strip()
+        opened = ARRAY_OPEN.match(code)
+        if opened:
+            tables.append(opened.group(1) or opened.group(2))
+        elif ARRAY_CLOSE.match(code) and tables:
+            tables.pop()
+        match = COMMENT_LINE.match(line)
+        if match is None:
+            lines.append(line)
+            continue
+        code = match.group("code").strip()
+        entry: doc_entry_t | None = None
+        if (symbol := DEFINE_SYMBOL.match(code)):
+            entry = doc_entry_t(symbol = symbol.group(1), kind = "def", description = match.group("desc"))
+        elif (symbol := TYPEDEF_SYMBOL.match(code)):
+            entry = doc_entry_t(symbol = symbol.group(1), kind = "typedef", description = match.group("desc"))
+        elif (symbol := STATIC_SYMBOL.match(code)):
+            entry = doc_entry_t(symbol = symbol.group(1), kind = "var", description = match.group("desc"))
+        elif (symbol := ARRAY_ELEMENT.match(code)) and tables:
+            entry = doc_entry_t(symbol = "".join(tables) + symbol.group(1), kind = "element",
+                                description = match.group("desc"), table = tables[0])
+        if entry is None:
+            lines.append(line)
+            continue
+        lines.append(match.group("code"))
+        entries.append(entry)
+    return "\n".join(lines), entries
+
+# JSON sidecar: descriptions keyed by symbol (the first description of a repeated symbol)
+def format_json_sidecar(entries: list[doc_entry_t]) -> str:
+    docs: dict[str, str] = {}
+    for entry in entries:
+        docs.setdefault(entry.symbol, entry.description)
+    return json.dumps(docs, indent = 2) + "\n"
+
+# Doc-only header sidecar: a Doxygen block per symbol, the elements of an array table listed in the
+# block of their table
+def format_header_sidecar(entries: list[doc_entry_t], header_name: str) -> str:
+    blocks: dict[str, list[str]] = {}
+    for entry in entries:
+        if entry.kind == "element":
+            if entry.table not in blocks:
+                blocks[entry.table] = [f' * @var {entry.table}']
+            blocks[entry.table].append(f' * @li {entry.symbol[len(entry.table):]} {entry.description}')
+        elif entry.symbol not in blocks:
+            blocks[entry.symbol] = [f' * {DOC_COMMANDS[entry.kind]} {entry.symbol}', f' * @brief {entry.description}']
+    text = f'/**\n * @file\n * @brief Descriptions of the symbols of {header_name}, for documentation tools only.\n */\n'
+    for block in blocks.values():
+        text += "\n/**\n" + "\n".join(block) + "\n */\n"
+    return text
+
+# Move the descriptions of a generated header to the configured sidecar (JSON when its name ends in
+# .json, a doc-only header otherwise), returning the slimmed header
+def write_sidecar(text: str, config: config_t) -> str:
+    if config.doc_sidecar_path is None:
+        return text
+    text, entries = split_descriptions(text)
+    if config.doc_sidecar_path.endswith(".json"):
+        docs = format_json_sidecar(entries)
+    else:
+        docs = format_header_sidecar(entries, os.path.basename(config.output_path or "the generated header"))
+    old_docs: str | None = None
+    if os.path.isfile(config.doc_sidecar_path):
+        with open(config.doc_sidecar_path) as file:
+            old_docs = file.read()
+    if docs != old_docs:
+        write_output(docs, config.doc_sidecar_path)
+    return text
@@ -0,0 +1,223 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Callable
+import importlib.metadata
+import hashlib
+import logging
+import pickle
+import json
+import os
+
+# Package modules
+from .config import config_t
+from .common import SVDError
+from .fingerprint import file_stamp, generator_stamps, template_paths
+from .archive import split_pack_path
+from .validate import CACHE_DIR
+from .load import find_svd_paths, load_svd_file
+from .patch import load_patches, apply_patches
+from .merge import merge_devices
+from .transform import (enum_device_t, fill_defaults, share_layouts, normalize_device, de_enum_isrs,
+                        de_enum_periphs, de_enum_registers, de_enum_fields)
+from .emit_macro import emit_macro_header
+from .emit_enum import emit_enum_header
+from .emit_array import emit_array_header
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Stage result cache directory
+STAGE_CACHE_DIR: str = os.path.join(CACHE_DIR, "stages")
+
+# Stage results kept on disk
+MAX_DISK_ENTRIES: int = 64
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Stage of the generation DAG: the config keys it reads and whether its result is cached (results
+# of cheap stages are recomputed from their nearest cached ancestor instead)
+@dataclass
+class stage_t:
+    keys: tuple[str, ...]
+    persist: bool = True
+
+# Stages of the generation DAG
+STAGES: dict[str, stage_t] = {
+    "load": stage_t(keys = ("xml_validation",)),
+    "patch": stage_t(keys = ("patch_paths",), persist = False),
+    "merge": stage_t(keys = ("core1_prefix", "core2_prefix")),
+    "defaults": stage_t(keys = ("fallback_reg_access",), persist = False),
+    "share": stage_t(keys = ("share_periph_layouts",), persist = False),
+    "normalize": stage_t(keys = ("fallback_reg_access",), persist = False),
+    "isrs": stage_t(keys = ("isr_digit_enum", "isr_digit_enum_exc_list", "isr_alpha_enum",
+                            "isr_alpha_enum_exc_list", "min_isr_enum_len", "max_isr_enum_len")),
+    "periphs": stage_t(keys = ("periph_digit_enum", "periph_digit_enum_exc_list", "periph_alpha_enum",
+                               "periph_alpha_enum_exc_list", "min_periph_enum_len", "max_periph_enum_len")),
+    "registers": stage_t(keys = ("reg_digit_enum", "reg_digit_enum_exc_list", "reg_alpha_enum",
+                                 "reg_alpha_enum_exc_list", "min_reg_enum_len", "max_reg_enum_len")),
+    "fields": stage_t(keys = ("field_digit_enum", "field_digit_enum_exc_list", "field_alpha_enum",
+                              "field_alpha_enum_exc_list", "min_field_enum_len", "max_field_enum_len")),
+    "emit_macro": stage_t(keys = ("indent", "min_def_col", "template_dir")),
+    "emit_enum": stage_t(keys = ("indent", "template_dir")),
+    "emit_array": stage_t(keys = ("template_dir",))
+}
+
+# Node of the generation DAG: its stage, its key (stage name, parent keys, the config keys the stage
+# reads and any extra inputs) and how it computes its result from the results of its parents
+@dataclass
+class node_t:
+    stage: str
+    key: str
+    compute: Callable
+    parents: list["node_t"] = field(default_factory = list)
+
+# Build a DAG node
+def make_node(stage: str, config: config_t, compute: Callable, parents: list[node_t] | None = None,
+              extra: list | None = None) -> node_t:
+    parents = parents or []
+    values = {x: getattr(config, x, None) for x in STAGES[stage].keys}
+    text = json.dumps([stage, [x.key for x in parents], values, extra], default = str)
+    return node_t(stage = stage, key = hashlib.sha256(text.encode()).hexdigest(), compute = compute, parents = parents)
+
+###################################################################################################
+# STAGE CACHE
+###################################################################################################
+
+# Pickled stage results by key, the most recently used in memory and optionally on disk
+class stage_cache_t:
+
+    def __init__(self, cache_dir: str | None = None, max_entries: int = 32):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.blobs: OrderedDict[str, bytes] = OrderedDict()
+
+    # Find a cached result
+    def get(self, key: str) -> bytes | None:
+        if key in self.blobs:
+            self.blobs.move_to_end(key)
+            return self.blobs[key]
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, key + ".pickle"), "rb") as file:
+                blob = file.read()
+        except OSError:
+            return None
+        self.store(key, blob)
+        return blob
+
+    # Keep a result in memory
+    def store(self, key: str, blob: bytes) -> None:
+        self.blobs[key] = blob
+        while len(self.blobs) > self.max_entries:
+            self.blobs.popitem(last = False)
+
+    # Cache a result in memory and on disk, dropping the oldest disk entries
+    def put(self, key: str, blob: bytes) -> None:
+        self.store(key, blob)
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok = True)
+            tmp_path = os.path.join(self.cache_dir, f'.{key}.tmp')
+            with open(tmp_path, "wb") as file:
+                file.write(blob)
+            os.replace(tmp_path, os.path.join(self.cache_dir, key + ".pickle"))
+            paths = [os.path.join(self.cache_dir, x) for x in os.listdir(self.cache_dir) if x.endswith(".pickle")]
+            for path in sorted(paths, key = os.path.getmtime)[:-MAX_DISK_ENTRIES]:
+                os.remove(path)
+        except OSError as e:
+            log.warning(f'Failed to write stage cache {self.cache_dir}: {e}')
+
+    # Result of a node: cached results are unpickled (private copies), other results are computed
+    # from the results of the node's parents, each node is computed once per evaluation (children
+    # that modify a shared parent result in place come last among the children of their parent)
+    def evaluate(self, node: node_t, results: dict[str, object] | None = None) -> object:
+        results = {} if results is None else results
+        if node.key in results:
+            return results[node.key]
+        blob = self.get(node.key)
+        if blob is not None:
+            log.debug(f'Stage {node.stage} cached.')
+            result = pickle.loads(blob)
+        else:
+            log.debug(f'Running stage {node.stage}...')
+            result = node.compute(*[self.evaluate(x, results) for x in node.parents])
+            if STAGES[node.stage].persist:
+                self.put(node.key, pickle.dumps(result))
+        results[node.key] = result
+        return result
+
+###################################################################################################
+# GENERATION DAG
+###################################################################################################
+
+# Stage functions
+def patch_stage(config: config_t, *devices):
+    if not config.patch_paths:
+        return list(devices)
+    patches = load_patches(config.patch_paths)
+    return [apply_patches(x, patches, in_place = True) for x in devices]
+
+def merge_stage(config: config_t, devices):
+    return merge_devices(devices[0], devices[1], config, in_place = True) if len(devices) > 1 else devices[0]
+
+def isrs_stage(config: config_t, device):
+    return de_enum_isrs(device, config)
+
+def periphs_stage(config: config_t, device):
+    return device, de_enum_periphs(device, config)
+
+def registers_stage(config: config_t, result):
+    return *result, de_enum_registers(result[0], config)
+
+def fields_stage(config: config_t, result):
+    return *result, de_enum_fields(result[0], config)
+
+def enum_emit_stage(config: config_t, isrs, result):
+    return emit_enum_header(enum_device_t(device = result[0], isr_dim = isrs[0], isr_dim_name = isrs[1],
+                                          isr_dim_index = isrs[2], periph_dim = result[1], reg_dim = result[2],
+                                          field_dim = result[3]), config)
+
+# Build the generation DAG of a config (load, patch, merge and share layouts or group interrupts,
+# peripherals, registers and fields, emit), returning its output node
+def build_dag(config: config_t) -> node_t:
+    if config.style not in ("macro", "enum", "array"):
+        raise SVDError(f'Unknown output style "{config.style}".')
+    paths = find_svd_paths(config)
+    if config.style != "macro":
+        paths = paths[:1]
+    sources = [importlib.metadata.version("cmsis-svd"), generator_stamps()]
+    loads = [make_node("load", config, lambda path = x: load_svd_file(config, path),
+                       extra = [x, file_stamp(split_pack_path(x)[0]), sources]) for x in paths]
+    patched = make_node("patch", config, lambda *x: patch_stage(config, *x), loads,
+                        extra = [(x, file_stamp(x)) for x in config.patch_paths])
+    templates = [(x, file_stamp(x)) for x in template_paths(config.template_dir)]
+    if config.style == "macro":
+        merged = make_node("merge", config, lambda x: merge_stage(config, x), [patched])
+        filled = make_node("defaults", config, lambda x: fill_defaults(x, config, in_place = True), [merged])
+        if config.share_periph_layouts:
+            filled = make_node("share", config, lambda x: share_layouts(x, config, in_place = True), [filled])
+        return make_node("emit_macro", config, lambda x: emit_macro_header(x, config), [filled], templates)
+    normalized = make_node("normalize", config, lambda x: normalize_device(x[0], config, in_place = True), [patched])
+    if config.style == "array":
+        return make_node("emit_array", config, lambda x: emit_array_header(x, config), [normalized], templates)
+    isrs = make_node("isrs", config, lambda x: isrs_stage(config, x), [normalized])
+    periphs = make_node("periphs", config, lambda x: periphs_stage(config, x), [normalized])
+    registers = make_node("registers", config, lambda x: registers_stage(config, x), [periphs])
+    fields = make_node("fields", config, lambda x: fields_stage(config, x), [registers])
+    return make_node("emit_enum", config, lambda x, y: enum_emit_stage(config, x, y), [isrs, fields], templates)
+
+# Generate the output of a config, re-running only the stages whose inputs or config keys changed
+def generate_staged(config: config_t, cache: stage_cache_t) -> str:
+    return cache.evaluate(build_dag(config))
@@ -0,0 +1,200 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from functools import lru_cache
+from typing import Callable
+import logging
+import string
+import os
+
+# Package modules
+from .common import SVDError
+from .fingerprint import TEMPLATE_SUFFIX, file_stamp, template_paths
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Markers around the part of a template rendered once per row
+ROWS_START: str = "{@rows}"
+ROWS_END: str = "{@end}"
+
+# Functions applying the conversions of template fields ("{name!r}")
+CONVERSIONS: dict[str, str] = {"r": "repr", "s": "str", "a": "ascii"}
+
+# Default template of each section type, format fields are filled from the section values and the
+# part between the row markers is repeated for each row (row values first, then section values).
+# The macro style renders every section from templates, the enum and array styles only their
+# banners and typedef blocks (their tables are emitted directly)
+DEFAULT_TEMPLATES: dict[str, str] = {
+    "file_header": (
+        "/**\n"
+        " * This file is part of the Titan Flight Computer Project\n"
+        " * Copyright (c) 2024 UW SARP\n"
+        " *\n"
+        " * This program is free software: you can redistribute it and/or modify\n"
+        " * it under the terms of the GNU General Public License as published by\n"
+        " * the Free Software Foundation, version 3.\n"
+        " *\n"
+        " * This program is distributed in the hope that it will be useful, but\n"
+        " * WITHOUT ANY WARRANTY; without even the implied warranty of\n"
+        " * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU\n"
+        " * General Public License for more details.\n"
+        " *\n"
+        " * You should have received a copy of the GNU General Public License\n"
+        " * along with this program. If not, see <http://www.gnu.org/licenses/>.\n"
+        " *\n"
+        " * @file __PATH__\n"
+        " * @authors __AUTHORS__\n"
+        " * @brief __BRIEF__.\n"
+        " */\n"
+        "\n"
+        "#ifndef __GUARD__\n"
+        "#define __GUARD__\n"
+        "\n"
+        "{indent}#include <stdint.h>\n"
+        "\n"
+        "{indent}#ifdef __cplusplus\n"
+        "{indent}{indent}extern \"C\" {{\n"
+        "{indent}#endif\n"
+        "\n"),
+    "family_include": (
+        "{indent}#include \"{path}\"\n"
+        "\n"),
+    "file_footer": (
+        "{indent}#ifdef __cplusplus\n"
+        "{indent}{indent}}} /* extern \"C\" */\n"
+        "{indent}#endif\n"
+        "\n"
+        "#endif /* __GUARD__ */"),
+    "banner": (
+        "{indent}/**********************************************************************************************\n"
+        "{indent} * @section {title}\n"
+        "{indent} **********************************************************************************************/\n"
+        "\n"),
+    "irq_block": (
+        "{indent}/** @subsection {name} IRQ interrupt definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "offset_table": (
+        "{indent}/** @subsection {name} instance offset definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "pointer_table": (
+        "{indent}/** @subsection {name} register reference definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "reset_table": (
+        "{indent}/** @subsection {name} register reset value definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "mask_table": (
+        "{indent}/** @subsection {name} field mask definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "position_table": (
+        "{indent}/** @subsection {name} field position definitions */\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{value}{c_gap}{comment}\n{@end}"
+        "\n"),
+    "typedef_block": (
+        "{indent}/**** @subsection {title} ****/\n"
+        "\n"
+        "{@rows}{indent}{decl}{gap}{comment}\n{@end}"
+        "\n")
+}
+
+###################################################################################################
+# TEMPLATE COMPILATION
+###################################################################################################
+
+# Python expressions concatenating the literal text and format fields of a template part
+def part_exprs(text: str, row: bool, source: str) -> list[str]:
+    exprs: list[str] = []
+    try:
+        pieces = list(string.Formatter().parse(text))
+    except ValueError as e:
+        raise SVDError(f'Invalid template {source}: {e}')
+    for literal, name, spec, conversion in pieces:
+        if literal:
+            exprs.append(repr(literal))
+        if name is None:
+            continue
+        if not name.isidentifier() or "{" in spec:
+            raise SVDError(f'Invalid template {source}: field "{name}" is not a value name with a plain format.')
+        value = f'(r[{name!r}] if {name!r} in r else v[{name!r}])' if row else f'v[{name!r}]'
+        if conversion:
+            value = f'{CONVERSIONS[conversion]}({value})'
+        exprs.append(f'format({value}, {spec!r})' if spec else f'str({value})')
+    return exprs
+
+# Python source of the render function of a template: render(v, rows) returns the whole section
+def template_source(text: str, source: str) -> str:
+    head, rows, tail = text, "", ""
+    if ROWS_START in text:
+        head, rest = text.split(ROWS_START, 1)
+        if ROWS_END not in rest:
+            raise SVDError(f'Invalid template {source}: {ROWS_START} without {ROWS_END}.')
+        rows, tail = rest.split(ROWS_END, 1)
+    exprs = part_exprs(head, False, source)
+    if rows:
+        exprs.append(f'"".join([{" + ".join(part_exprs(rows, True, source)) or repr("")} for r in rows])')
+    exprs += part_exprs(tail, False, source)
+    return f'def render(v, rows):\n    return "".join(({", ".join(exprs) or repr("")},))\n'
+
+# Compile a template into its render function (once per template text in this process)
+@lru_cache(maxsize = None)
+def compile_template(text: str, source: str = "template") -> Callable:
+    namespace: dict = {}
+    exec(compile(template_source(text, source), source, "exec"), namespace)
+    return namespace["render"]
+
+###################################################################################################
+# TEMPLATE SETS
+###################################################################################################
+
+# Compiled templates of every section type, the defaults overridden by "<section type>.tpl" files
+# of a template directory
+class template_set_t:
+
+    def __init__(self, template_dir: str | None = None):
+        texts = dict(DEFAULT_TEMPLATES)
+        self.stamps = [(x, file_stamp(x)) for x in template_paths(template_dir)]
+        for path in template_paths(template_dir):
+            section = os.path.basename(path)[:-len(TEMPLATE_SUFFIX)]
+            if section not in DEFAULT_TEMPLATES:
+                log.warning(f'Ignoring template {path}: unknown section type "{section}".')
+                continue
+            try:
+                with open(path) as file:
+                    texts[section] = file.read()
+            except OSError as e:
+                raise SVDError(f'Invalid template {path}: {e}')
+        self.renders: dict[str, Callable] = {x: compile_template(y, x) for x, y in texts.items()}
+
+    # Render a whole section from its values and rows
+    def render(self, section: str, rows: list[dict] | None = None, **values) -> str:
+        try:
+            return self.renders[section](values, rows or [])
+        except KeyError as e:
+            raise SVDError(f'Template {section} uses unknown value {e}.')
+
+# Template sets by template directory
+TEMPLATE_SETS: dict[str | None, template_set_t] = {}
+
+# Template set of a template directory, overrides are re-read when their files change
+def load_templates(template_dir: str | None = None) -> template_set_t:
+    templates = TEMPLATE_SETS.get(template_dir)
+    if templates is None or templates.stamps != [(x, file_stamp(x)) for x in template_paths(template_dir)]:
+        templates = template_set_t(template_dir)
+        TEMPLATE_SETS[template_dir] = templates
+    return templates
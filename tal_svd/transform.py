@@ -0,0 +1,772 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Standard libraries
+from dataclasses import dataclass
+import hashlib
+import logging
+import re
+
+# Package modules
+from .config import config_t
+from .common import fmt_desc, own_device
+from .patch import patch_t, apply_patches
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# TRANSFORM RESULTS
+###################################################################################################
+
+# De-enumerated device and the array dimensions found for each element kind
+@dataclass
+class enum_device_t:
+    device: svd.parser.SVDDevice
+    isr_dim: dict[str, int]
+    isr_dim_name: dict[int, str]
+    isr_dim_index: dict[int, int]
+    periph_dim: dict[str, int]
+    reg_dim: dict[str, int]
+    field_dim: dict[str, int]
+
+###################################################################################################
+# ARRAY METADATA
+###################################################################################################
+
+# Upper-cased name shared by the elements of an SVD array ("x" in place of the index, as
+# de-enumeration names it)
+def dim_common_name(name: str) -> str:
+    return "x".join(x.upper() for x in name.replace("[%s]", "%s").split("%s"))
+
+# Array positions of SVD dimIndex values: numbers and single letters keep their value like in
+# name-based de-enumeration, other indices (or clashing values) use their position
+def dim_positions(dim_index: list[str]) -> list[int]:
+    positions = []
+    for index in dim_index:
+        if index.isdigit():
+            positions.append(int(index))
+        elif len(index) == 1 and index.isalpha():
+            positions.append(ord(index.lower()) - ord('a'))
+        else:
+            return list(range(len(dim_index)))
+    if len(set(positions)) != len(positions):
+        return list(range(len(dim_index)))
+    return positions
+
+# Replace SVD arrays (peripheral, register or field arrays) with their elements, keeping the array
+# metadata of each element as its common name (dim_name) and array position (dim_index), single
+# elements get none
+def flatten_dim(elements: list, meta_attr: str, items_attr: str) -> list:
+    flat = []
+    for element in elements or []:
+        meta = getattr(element, meta_attr, None)
+        if meta is None:
+            element.dim_name = None
+            flat.append(element)
+            continue
+        items = getattr(element, items_attr)
+        dim_index = [str(x) for x in meta.dim_index or range(len(items))]
+        positions = dim_positions(dim_index)
+        for item, index, position in zip(items, dim_index, positions):
+            item.dim_index_separator = None
+            if "%s" in meta.name:
+                item.name = meta.name.replace("[%s]", "%s") % index
+                item.dim_name = dim_common_name(meta.name)
+                item.dim_index = position
+            else:
+                item.dim_name = None
+                item.dim_index = None
+        flat.extend(items)
+    return flat
+
+# Sizes of the SVD arrays among elements keyed by prefix and common name, arrays outside the
+# configured lengths lose their metadata and are left to name-based de-enumeration
+def dim_sizes(elements: list, prefix: str, min_len: int, max_len: int) -> dict[str, int]:
+    groups: dict[str, list] = {}
+    for element in elements or []:
+        if element.dim_name is not None:
+            groups.setdefault(element.dim_name, []).append(element)
+    sizes: dict[str, int] = {}
+    for name, members in groups.items():
+        size = max(x.dim_index for x in members) + 1
+        if len(members) < min_len or size > max_len:
+            for member in members:
+                member.dim_name = None
+                member.dim_index = None
+        else:
+            sizes[f'{prefix}{name}'] = size
+    return sizes
+
+###################################################################################################
+# SVD PRE-FORMATTING
+###################################################################################################
+
+# Flatten the peripheral, register and field arrays of a device into their elements (see flatten_dim)
+def flatten_arrays(device: svd.parser.SVDDevice, in_place: bool = False) -> svd.parser.SVDDevice:
+    device = own_device(device, in_place)
+    device.peripherals = flatten_dim(device.peripherals, "meta_peripheral", "peripherals")
+    for periph in device.peripherals:
+        if periph.registers:
+            periph.registers = flatten_dim(periph.registers, "meta_register", "registers")
+            for reg in periph.registers:
+                if reg.fields:
+                    reg.fields = flatten_dim(reg.fields, "meta_field", "fields")
+    return device
+
+# Patches filling in missing descriptions and register access types
+def default_patches(config: config_t) -> list[patch_t]:
+    return [patch_t(action = "modify", path = {"peripheral": "*"}, source = "defaults",
+                    defaults = {"description": "No description."}),
+            patch_t(action = "modify", path = {"peripheral": "*", "register": "*"}, source = "defaults",
+                    defaults = {"access": config.fallback_reg_access, "description": "No description."}),
+            patch_t(action = "modify", path = {"peripheral": "*", "register": "*", "field": "*"}, source = "defaults",
+                    defaults = {"description": "No description."})]
+
+# Flatten SVD arrays and fill in missing descriptions and register access types
+def fill_defaults(device: svd.parser.SVDDevice, config: config_t,
+                  in_place: bool = False) -> svd.parser.SVDDevice:
+    return apply_patches(flatten_arrays(device, in_place), default_patches(config), in_place = True)
+
+# Upper-case names, format descriptions and flatten SVD arrays into elements carrying their array
+# metadata ahead of de-enumeration
+def normalize_device(device: svd.parser.SVDDevice, config: config_t,
+                     in_place: bool = False) -> svd.parser.SVDDevice:
+    device = flatten_arrays(device, in_place)
+    for periph in device.peripherals:
+        if periph.interrupts:
+            for isr in periph.interrupts:
+                if isr.description:
+                    isr.description = fmt_desc(isr.description)
+                else:
+                    isr.description = "No description."
+        periph.name = periph.name.upper()
+        if periph.registers:
+            for reg in periph.registers:
+                if reg.description:
+                    reg.description = fmt_desc(reg.description)
+                else:
+                    reg.description = "No description."
+                if reg.access is None:
+                    reg.access = config.fallback_reg_access
+                reg.name = reg.name.upper()
+                if reg.fields:
+                    for field in reg.fields:
+                        if field.description:
+                            field.description = fmt_desc(field.description)
+                        else:
+                            field.description = "No description."
+                        field.name = field.name.upper()
+    return device
+
+###################################################################################################
+# LAYOUT SHARING
+###################################################################################################
+
+# Upper-cased name without the words of the peripheral name (as macro definitions name registers)
+def layout_name(name: str, periph_name: str) -> str:
+    periph_words = periph_name.upper().split("_")
+    return "_".join(x for x in name.upper().split("_") if x not in periph_words)
+
+# Structural hash of the register and field layout of a peripheral: register offsets, sizes and
+# access, field bit ranges, and register and field names without the words of the peripheral name
+# (the names of the shared macros). Reset values (emitted per instance where they differ),
+# descriptions, interrupts and the peripheral size are left out
+def layout_hash(periph: svd.parser.SVDPeripheral) -> str:
+    layout = []
+    for reg in sorted(periph.registers or [], key = lambda x: (x.address_offset, x.name)):
+        layout.append((layout_name(reg.name, periph.name), reg.address_offset, reg.size, str(reg.access),
+                       sorted((layout_name(x.name, periph.name), x.bit_offset, x.bit_width) for x in reg.fields or [])))
+    return hashlib.sha256(repr(layout).encode()).hexdigest()
+
+# Characters two names share at the same positions (the section name of derived peripherals)
+def common_chars(name1: str, name2: str) -> str:
+    return "".join(x for x, y in zip(name1.upper(), name2.upper()) if x == y)
+
+# Mark peripherals whose layout matches an earlier peripheral of the same group as derived from it,
+# so they are emitted as instance offsets of one shared definition (peripherals derived from a
+# merged peripheral move along, merges that would garble the shared section name are skipped)
+def share_layouts(device: svd.parser.SVDDevice, config: config_t,
+                  in_place: bool = False) -> svd.parser.SVDDevice:
+    device = own_device(device, in_place)
+    names = {x.name for x in device.peripherals}
+    positions = {id(x): i for i, x in enumerate(device.peripherals)}
+    derived: dict[str, list[svd.parser.SVDPeripheral]] = {}
+    roots: list[svd.parser.SVDPeripheral] = []
+    for periph in device.peripherals:
+        if periph.derived_from in names:
+            derived.setdefault(periph.derived_from, []).append(periph)
+        elif periph.registers:
+            roots.append(periph)
+    shared: dict[tuple[str | None, str], svd.parser.SVDPeripheral] = {}
+    for periph in roots:
+        key = (periph.group_name, layout_hash(periph))
+        root = shared.setdefault(key, periph)
+        if root is periph:
+            continue
+        family = derived.setdefault(root.name, [])
+        members = family + [periph] + derived.get(periph.name, [])
+        members.sort(key = lambda x: positions[id(x)])
+        if root.group_name:
+            name = common_chars(root.name, members[-1].name)
+            if (not name or not common_chars(root.name, periph.name) or
+                (family and name != common_chars(root.name, family[-1].name))):
+                continue
+        log.debug(f'Sharing {root.name.upper()} layout with {periph.name.upper()}...')
+        for member in members:
+            member.derived_from = root.name
+        family[:] = members
+        derived.pop(periph.name, None)
+    return device
+
+###################################################################################################
+# COMMON FUNCTIONS
+###################################################################################################
+
+def diff_start_digit(text1: str, text2: str):
+    if text1[0].isdigit() and text2[0].isdigit():
+        for i in range(max(len(text1), len(text2))):
+            c1 = None if i >= len(text1) else text1[i]
+            c2 = None if i >= len(text2) else text2[i]
+            if (c1 is not None and c1.isdigit()) or (c2 is not None and c2.isdigit()):
+                if c1 != c2:
+                    return True
+            else:
+                return False
+    return False
+
+def diff_start_alpha(text1: str, text2: str):
+    return (text1[0] != text2[0] and
+            text1[0].isalpha() and text2[0].isalpha() and
+            len(text1) == len(text2) and
+            (len(text1) == 1 or text1[1] == text2[1]))
+
+###################################################################################################
+# DE-ENUMERATION FUNCTIONS
+###################################################################################################
+
+# De-enumerate all elements within a register based on a common numeric difference
+def de_enum_fields_dig(x: svd.parser.SVDRegister, y: svd.parser.SVDRegister,
+                   x_num: int, y_num: int):
+    if x.fields:
+        for field1 in x.fields:
+            if not field1.dim_index_separator:
+                for field2 in y.fields:
+                    if (not field2.dim_index_separator and
+                        field1.name != field2.name and
+                        field1.bit_offset == field2.bit_offset and
+                        field1.bit_width == field2.bit_width and
+                        field1.access != field2.access):
+                        for i in range(min(len(field1.name), len(field2.name))):
+                            if diff_start_digit(field1.name[i:], field2.name[i:]):
+                                field1_cname = field1.name[:i] + field1.name[i:].lstrip('0123456789')
+                                field2_cname = field2.name[:i] + field2.name[i:].lstrip('0123456789')
+                                common_name = field1.name[:i] + "x" + field1.name[i:].lstrip('0123456789')
+                                if field1_cname == field2_cname:
+                                    field1_num = int(re.search('[0-9]+', field1.name[i:]).group())
+                                    field2_num = int(re.search('[0-9]+', field2.name[i:]).group())
+                                    if field1_num == x_num and field2_num == y_num:
+                                        for xf in x.fields:
+                                            if xf.name == field1.name:
+                                                xf.dim_index_separator = common_name
+                                        for yf in y.fields:
+                                            if yf.name == field2.name:
+                                                yf.dim_index_separator = common_name
+                                        break
+
+# De-enumerate all elements within a peripheral based on a common alphnumeric difference
+def de_enum_fields_alpha(x: svd.parser.SVDRegister, y: svd.parser.SVDRegister,
+                     x_alpha: str, y_alpha: str):
+    if x.fields:
+        for field1 in x.fields:
+            if not field1.dim_index_separator:
+                for field2 in y.fields:
+                    if (not field2.dim_index_separator and
+                        field1.name != field2.name and
+                        field1.bit_offset == field2.bit_offset and
+                        field1.bit_width == field2.bit_width and
+                        field1.access == field2.access):
+                        for i in range(min(len(field1.name), len(field2.name))):
+                            if diff_start_alpha(field1.name[i:], field2.name[i:]):
+                                field1_cname = field1.name[:i] + field1.name[(i + 1):]
+                                field2_cname = field2.name[:i] + field2.name[(i + 1):]
+                                common_name = field1.name[:i] + "x" + field1.name[(i + 1):]
+                                if field1_cname == field2_cname:
+                                    field1_num = ord(field1.name[i].lower()) - ord('a')
+                                    field2_num = ord(field2.name[i].lower()) - ord('a')
+                                    if field1_num == x_alpha and field2_num == y_alpha:
+                                        for xf in x.fields:
+                                            if xf.name == field1:
+                                                xf.dim_index_seperator = common_name
+                                        for yf in y.fields:
+                                            if yf.name == field2:
+                                                yf.dim_index_seperator = common_name
+                                        break
+
+# De-enumerate all elements within a peripheral based on a common numeric difference
+def de_enum_registers_dig(x: svd.parser.SVDPeripheral, y: svd.parser.SVDPeripheral,
+                      x_num: int, y_num: int):
+    if x.registers:
+        for reg1 in x.registers:
+            if not reg1.dim_index_separator:
+                for reg2 in y.registers:
+                    if not reg2.dim_index_separator:
+                        de_enum_fields_dig(reg1, reg2, x_num, y_num)
+                        if (reg1.name != reg2.name and
+                            reg1.address_offset == reg2.address_offset and
+                            reg1.size == reg2.size and
+                            reg1.access == reg2.access):
+                            for i in range(min(len(reg1.name), len(reg2.name))):
+                                if diff_start_digit(reg1.name[i:], reg2.name[i:]):
+                                    reg1_cname = reg1.name[:i] + reg1.name[i:].lstrip('0123456789')
+                                    reg2_cname = reg2.name[:i] + reg2.name[i:].lstrip('0123456789')
+                                    common_name = reg1.name[:i] + "x" + reg1.name[i:].lstrip('0123456789')
+                                    if reg1_cname == reg2_cname:
+                                        reg1_num = int(re.search('[0-9]+', reg1.name[i:]).group())
+                                        reg2_num = int(re.search('[0-9]+', reg2.name[i:]).group())
+                                        if reg1_num == 0 and reg2_num == 0:
+                                            for xr in x.registers:
+                                                if xr.name == reg1.name:
+                                                    xr.dim_index_separator = common_name
+                                            for yr in y.registers:
+                                                if yr == reg2:
+                                                    yr.dim_index_separator = common_name
+                                            break
+
+# De-enumerate all elements within a peripheral based on a common alphnumeric difference
+def de_enum_registers_alpha(x: svd.parser.SVDPeripheral, y: svd.parser.SVDPeripheral,
+                        x_alpha: str, y_alpha: str):
+    if x.registers:
+        for reg1 in x.registers:
+            if not reg1.dim_index_separator:
+                for reg2 in y.registers:
+                    if not reg2.dim_index_separator:
+                        de_enum_fields_alpha(reg1, reg2, x_alpha, y_alpha)
+                        if (reg1.name != reg2.name and
+                            reg1.address_offset == reg2.address_offset and
+                            reg1.size == reg2.size and
+                            reg1.access == reg2.access):
+                            for i in range(min(len(reg1.name), len(reg2.name))):
+                                if diff_start_alpha(reg1.name[i:], reg2.name[i:]):
+                                    reg1_cname = reg1.name[:i] + reg1.name[(i + 1):]
+                                    reg2_cname = reg2.name[:i] + reg2.name[(i + 1):]
+                                    common_name = reg1.name[:i] + "x" + reg1.name[(i + 1):]
+                                    if reg1_cname == reg2_cname:
+                                        reg1_num = ord(reg1.name[i].lower()) - ord('a')
+                                        reg2_num = ord(reg2.name[i].lower()) - ord('a')
+                                        if reg1_num == x_alpha and reg2_num == y_alpha:
+                                            for xr in x.registers:
+                                                if xr == reg1:
+                                                    xr.dim_index_separator = common_name
+                                            for yr in y.registers:
+                                                if yr == reg2:
+                                                    yr.dim_index_separator = common_name
+                                            break
+
+###################################################################################################
+# INTERRUPT INDEX
+###################################################################################################
+
+# Interrupt reported by a peripheral
+@dataclass
+class irq_entry_t:
+    periph: str
+    name: str
+    description: str | None
+
+# Index the interrupts of a device in one pass, returning the peripherals reporting each IRQ value
+# (in device order, repeated interrupts of a peripheral listed once)
+def index_irqs(device: svd.parser.SVDDevice) -> dict[int, list[irq_entry_t]]:
+    irq_index: dict[int, list[irq_entry_t]] = {}
+    seen: set[tuple[int, str, str]] = set()
+    for periph in device.peripherals:
+        for isr in periph.interrupts or []:
+            if (isr.value, periph.name, isr.name) not in seen:
+                seen.add((isr.value, periph.name, isr.name))
+                irq_index.setdefault(isr.value, []).append(irq_entry_t(periph = periph.name, name = isr.name,
+                                                                      description = isr.description))
+    return irq_index
+
+# Distinct interrupts of an IRQ index: the first entry of each interrupt name of each value
+def unique_irqs(irq_index: dict[int, list[irq_entry_t]]) -> list[tuple[int, irq_entry_t]]:
+    irqs: list[tuple[int, irq_entry_t]] = []
+    for value, entries in irq_index.items():
+        names: set[str] = set()
+        for entry in entries:
+            if entry.name not in names:
+                names.add(entry.name)
+                irqs.append((value, entry))
+    return irqs
+
+# Names of the peripherals sharing an interrupt
+def irq_sharers(entries: list[irq_entry_t], name: str) -> list[str]:
+    return list(dict.fromkeys(x.periph for x in entries if x.name == name))
+
+# Description of an interrupt: the one given by every peripheral reporting it, otherwise a neutral
+# one (shared interrupts are often described after each sharing peripheral)
+def irq_description(entries: list[irq_entry_t], name: str) -> str | None:
+    descriptions = {x.description for x in entries if x.name == name}
+    if len(descriptions) == 1:
+        return descriptions.pop()
+    return f'{name} interrupt'
+
+###################################################################################################
+# DE-ENUMERATION
+###################################################################################################
+
+# Group numbered/lettered interrupts into arrays (the device is left unchanged), returning the array
+# sizes by common name and the common name and array index of each interrupt value (keyed on the IRQ
+# index of the device, built when not given)
+def de_enum_isrs(device: svd.parser.SVDDevice, config: config_t, irq_index: dict[int, list[irq_entry_t]] | None = None
+                 ) -> tuple[dict[str, int], dict[int, str], dict[int, int]]:
+    # Format interrupts of each peripheral (aborted common names are excluded per peripheral),
+    # matched against each distinct interrupt of the IRQ index once
+    isr_dim: dict[str, int] = {}
+    isr_dim_name: dict[int, str] = {}
+    isr_dim_index: dict[int, int] = {}
+    irqs = unique_irqs(irq_index if irq_index is not None else index_irqs(device))
+    for periph1 in device.peripherals:
+        isr_cname_xlist: list[str] = []
+        for isr1 in periph1.interrupts or []:
+            value1 = isr1.value
+            if isr_dim_name.get(value1) is None:
+                def abort(common_name):
+                    if common_name is not None:
+                        isr_dim[common_name] = None
+                        isr_cname_xlist.append(common_name)
+                        for value3, _ in irqs:
+                            if isr_dim_name.get(value3) == common_name:
+                                isr_dim_name[value3] = None
+                                isr_dim_index[value3] = None
+                cur_common_name: str = None
+                isr_num_list: list[int] = []
+                for value2, isr2 in irqs:
+                    if value1 != value2 and isr_dim_name.get(value2) is None:
+                        for c1, c2, i in zip(isr1.name, isr2.name, range(min(len(isr1.name), len(isr2.name)))):
+                            if (config.isr_digit_enum != (isr1.name in config.isr_digit_enum_exc_list) and
+                                diff_start_digit(isr1.name[i:], isr2.name[i:])):
+                                isr1_cname = isr1.name[:i] + isr1.name[i:].lstrip('0123456789')
+                                isr2_cname = isr2.name[:i] + isr2.name[i:].lstrip('0123456789')
+                                common_name = isr1.name[:i] + "x" + isr1.name[i:].lstrip('0123456789')
+                                isr1_num = int(re.search('[0-9]+', isr1.name[i:]).group())
+                                isr2_num = int(re.search('[0-9]+', isr2.name[i:]).group())
+                                if isr1_cname == isr2_cname and common_name not in isr_cname_xlist:
+                                    if max(isr1_num, isr2_num) < config.max_isr_enum_len:
+                                        cur_common_name = common_name
+                                        isr_dim_name[value1] = common_name
+                                        isr_dim_index[value1] = isr1_num
+                                        isr_dim_name[value2] = common_name
+                                        isr_dim_index[value2] = isr2_num
+                                        isr_num_list.append(isr2_num)
+                                        if isr_dim.get(common_name):
+                                            isr_dim[common_name] = max(isr_dim[common_name], isr2_num + 1)
+                                        else:
+                                            isr_num_list.append(isr1_num)
+                                            isr_dim[common_name] = max(isr1_num, isr2_num) + 1
+                                    else:
+                                        abort(common_name)
+                        if isr_dim_name.get(value2) is None:
+                            for c1, c2, i in zip(isr1.name, isr2.name, range(min(len(isr1.name), len(isr2.name)))):
+                                if (config.isr_alpha_enum != (isr1.name in config.isr_alpha_enum_exc_list) and
+                                    diff_start_alpha(isr1.name[i:], isr2.name[i:])):
+                                    isr1_cname = isr1.name[:i] + isr1.name[(i + 1):]
+                                    isr2_cname = isr2.name[:i] + isr2.name[(i + 1):]
+                                    common_name = isr1.name[:i] + "x" + isr1.name[(i + 1):]
+                                    isr1_num = ord(isr1.name[i].lower()) - ord('a')
+                                    isr2_num = ord(isr2.name[i].lower()) - ord('a')
+                                    if isr1_cname == isr2_cname and common_name not in isr_cname_xlist:
+                                        if max(isr1_num, isr2_num) < config.max_isr_enum_len:
+                                            cur_common_name = common_name
+                                            isr_dim_name[value1] = common_name
+                                            isr_dim_index[value1] = isr1_num
+                                            isr_dim_name[value2] = common_name
+                                            isr_dim_index[value2] = isr2_num
+                                            isr_num_list.append(isr2_num)
+                                            if isr_dim.get(common_name):
+                                                isr_dim[common_name] = max(isr_dim[common_name], isr2_num + 1)
+                                            else:
+                                                isr_num_list.append(isr1_num)
+                                                isr_dim[common_name] = max(isr1_num, isr2_num) + 1
+                                        else:
+                                            abort(common_name)
+                if len(isr_num_list) > 0:
+                    if len(isr_num_list) < config.min_isr_enum_len:
+                        abort(cur_common_name)
+    return isr_dim, isr_dim_name, isr_dim_index
+
+# Group numbered/lettered peripherals into arrays in place (along with the registers and fields
+# named after them), returning the array sizes by common name
+def de_enum_periphs(device: svd.parser.SVDDevice, config: config_t) -> dict[str, int]:
+    # Format peripherals (SVD arrays first, name-based guessing for the remaining peripherals)
+    periph_dim: dict[str, int] = dim_sizes(device.peripherals, "", config.min_periph_enum_len,
+                                           config.max_periph_enum_len)
+    periph_cname_xlist: list[str] = list(periph_dim)
+    for periph1 in device.peripherals:
+        if periph1.dim_name is None:
+            def abort(common_name):
+                periph_dim[common_name] = None
+                periph_cname_xlist.append(common_name)
+                for periph3 in device.peripherals:
+                    if periph3.dim_name == common_name:
+                        periph3.dim_name = None
+                        periph3.dim_index = None
+                        if periph3.registers:
+                            for reg3 in periph3.registers:
+                                reg3.dim_index_separator = None
+                                if reg3.fields:
+                                    for field3 in reg3.fields:
+                                        field3.dim_index_separator = None
+            cur_common_name: str = None
+            periph_num_list: list[int] = []
+            for periph2 in device.peripherals:
+                if periph2.dim_name is None and periph1.name != periph2.name:
+                    for c1, c2, i in zip(periph1.name, periph2.name, range(min(len(periph1.name), len(periph2.name)))):
+                        if (config.periph_digit_enum != (periph1.name in config.periph_digit_enum_exc_list) and diff_start_digit(periph1.name[i:], periph2.name[i:])):
+                            periph1_cname = periph1.name[:i] + periph1.name[i:].lstrip('0123456789')
+                            periph2_cname = periph2.name[:i] + periph2.name[i:].lstrip('0123456789')
+                            common_name = periph1.name[:i] + "x" + periph1.name[i:].lstrip('0123456789')
+                            periph1_num = int(re.search('[0-9]+', periph1.name[i:]).group())
+                            periph2_num = int(re.search('[0-9]+', periph2.name[i:]).group())
+                            if periph1_cname == periph2_cname and common_name not in periph_cname_xlist:
+                                if (max(periph1_num, periph2_num) < config.max_periph_enum_len):
+                                        de_enum_registers_dig(periph1, periph2, periph1_num, periph2_num)
+                                        cur_common_name = common_name
+                                        periph1.dim_name = common_name
+                                        periph1.dim_index = periph1_num
+                                        periph2.dim_name = common_name
+                                        periph2.dim_index = periph2_num
+                                        periph_num_list.append(periph2_num)
+                                        if periph_dim.get(common_name) is not None:
+                                            periph_dim[common_name] = max(periph_dim[common_name], periph2_num + 1)
+                                        else:
+                                            periph_num_list.append(periph1_num)
+                                            periph_dim[common_name] = max(periph1_num, periph2_num) + 1
+                                else:
+                                    abort(common_name)
+                    if periph2.dim_name is None:
+                        for c1, c2, i in zip(periph1.name, periph2.name, range(min(len(periph1.name), len(periph2.name)))):
+                            if (config.periph_alpha_enum != (periph1.name in config.periph_alpha_enum_exc_list) and
+                                diff_start_alpha(periph1.name[i:], periph2.name[i:])):
+                                periph1_cname = periph1.name[:i] + periph1.name[(i + 1):]
+                                periph2_cname = periph2.name[:i] + periph2.name[(i + 1):]
+                                common_name = periph1.name[:i] + "x" + periph1.name[(i + 1):]
+                                periph1_num = ord(periph1.name[i].lower()) - ord('a')
+                                periph2_num = ord(periph2.name[i].lower()) - ord('a')
+                                if periph1_cname == periph2_cname and common_name not in periph_cname_xlist:
+                                    if (max(periph1_num, periph2_num) < config.max_periph_enum_len):
+                                        de_enum_registers_alpha(periph1, periph2, periph1_num, periph2_num)
+                                        cur_common_name = common_name
+                                        periph1.dim_name = common_name
+                                        periph1.dim_index = periph1_num
+                                        periph2.dim_name = common_name
+                                        periph2.dim_index = periph2_num
+                                        periph_num_list.append(periph2_num)
+                                        if periph_dim.get(common_name) is not None:
+                                            periph_dim[common_name] = max(periph_dim[common_name], periph2_num + 1)
+                                        else:
+                                            periph_num_list.append(periph1_num)
+                                            periph_dim[common_name] = max(periph1_num, periph2_num) + 1
+                                    else:
+                                        abort(common_name)
+            if len(periph_num_list) > 0:
+                if len(periph_num_list) < config.min_periph_enum_len:
+                    abort(cur_common_name)
+
+    # Update de-enumerated register and field names
+    for periph in device.peripherals:
+        if periph.registers:
+            for reg in periph.registers:
+                if reg.dim_index_separator is not None:
+                    reg.name = reg.dim_index_separator
+                    reg.dim_index_separator = None
+                if reg.fields:
+                    for field in reg.fields:
+                        if field.dim_index_separator is not None:
+                            field.name = field.dim_index_separator
+                            field.dim_index_separator = None
+    return periph_dim
+
+# Group numbered/lettered registers of each peripheral into arrays in place, returning the array
+# sizes by peripheral and common name
+def de_enum_registers(device: svd.parser.SVDDevice, config: config_t) -> dict[str, int]:
+    # Format registers (SVD arrays first, name-based guessing for the remaining registers)
+    reg_dim: dict[str, int] = {}
+    for periph in device.peripherals:
+        if periph.registers:
+            svd_reg_dim = dim_sizes(periph.registers, f'{periph.name}_', config.min_reg_enum_len,
+                                    config.max_reg_enum_len)
+            reg_dim.update(svd_reg_dim)
+            reg_cname_xlist: list[str] = [x[len(periph.name) + 1:] for x in svd_reg_dim]
+            for reg1 in periph.registers:
+                if reg1.dim_name is None:
+                    def abort(common_name):
+                        reg_dim[f'{periph.name}_{common_name}'] = None
+                        reg_cname_xlist.append(common_name)
+                        for reg3 in periph.registers:
+                            if reg3.dim_name == common_name:
+                                reg3.dim_name = None
+                                reg3.dim_index = None
+                                if reg3.fields:
+                                    for field3 in reg3.fields:
+                                        field3.dim_index_separator = None
+                    cur_common_name: str = None
+                    dim_num_list: list[int] = []
+                    for reg2 in periph.registers:
+                        if reg2.dim_name is None and reg1.name != reg2.name and ((reg1.fields == None) == (reg2.fields == None)):
+                            for c1, c2, i in zip(reg1.name, reg2.name, range(min(len(reg1.name), len(reg2.name)))):
+                                if (config.reg_digit_enum != (reg1.name in config.reg_digit_enum_exc_list) and
+                                    diff_start_digit(reg1.name[i:], reg2.name[i:])):
+                                    reg1_cname = reg1.name[:i] + reg1.name[i:].lstrip('0123456789')
+                                    reg2_cname = reg2.name[:i] + reg2.name[i:].lstrip('0123456789')
+                                    common_name = reg1.name[:i] + "x" + reg1.name[i:].lstrip('0123456789')
+                                    reg1_num = int(re.search('[0-9]+', reg1.name[i:]).group())
+                                    reg2_num = int(re.search('[0-9]+', reg2.name[i:]).group())
+                                    if reg1_cname == reg2_cname and common_name not in reg_cname_xlist:
+                                        if (max(reg1_num, reg2_num) < config.max_reg_enum_len):
+                                            de_enum_fields_dig(reg1, reg2, reg1_num, reg2_num)
+                                            cur_common_name = common_name
+                                            reg1.dim_name = common_name
+                                            reg1.dim_index = reg1_num
+                                            reg2.dim_name = common_name
+                                            reg2.dim_index = reg2_num
+                                            dim_num_list.append(reg2_num)
+                                            id = f'{periph.name}_{common_name}'
+                                            if reg_dim.get(id) is not None:
+                                                reg_dim[id] = max(reg_dim[id], reg2_num + 1)
+                                            else:
+                                                reg_dim[id] = max(reg1_num, reg2_num) + 1
+                                                dim_num_list.append(reg1_num)
+                                        else:
+                                            abort(common_name)
+                            if reg2.dim_name is None:
+                                for c1, c2, i in zip(reg1.name, reg2.name, range(min(len(reg1.name), len(reg2.name)))):
+                                    if (config.reg_alpha_enum != (reg1.name in config.reg_alpha_enum_exc_list) and
+                                        diff_start_alpha(reg1.name[i:], reg2.name[i:])):
+                                        reg1_cname = reg1.name[:i] + reg1.name[(i + 1):]
+                                        reg2_cname = reg2.name[:i] + reg2.name[(i + 1):]
+                                        common_name = reg1.name[:i] + "x" + reg1.name[(i + 1):]
+                                        reg1_num = ord(reg1.name[i].lower()) - ord('a')
+                                        reg2_num = ord(reg2.name[i].lower()) - ord('a')
+                                        if reg1_cname == reg2_cname and common_name not in reg_cname_xlist:
+                                            if (max(reg1_num, reg2_num) < config.max_reg_enum_len):
+                                                de_enum_fields_alpha(reg1, reg2, reg1_num, reg2_num)
+                                                cur_common_name = common_name
+                                                reg1.dim_name = common_name
+                                                reg1.dim_index = reg1_num
+                                                reg2.dim_name = common_name
+                                                reg2.dim_index = reg2_num
+                                                id = f'{periph.name}_{common_name}'
+                                                dim_num_list.append(reg2_num)
+                                                if reg_dim.get(id) is not None:
+                                                    reg_dim[id] = max(reg_dim[id], reg2_num + 1)
+                                                else:
+                                                    dim_num_list.append(reg1_num)
+                                                    reg_dim[id] = max(reg1_num, reg2_num) + 1
+                                            else:
+                                                abort(common_name)
+                    if len(dim_num_list) > 0:
+                        if len(dim_num_list) < config.min_reg_enum_len:
+                            abort(cur_common_name)
+
+    # Update de-enumerated field names
+    for periph in device.peripherals:
+        if periph.registers:
+            for reg in periph.registers:
+                if reg.fields:
+                    for field in reg.fields:
+                        if field.dim_index_separator is not None:
+                            field.name = field.dim_index_separator
+                            field.dim_index_separator = None
+    return reg_dim
+
+# Group numbered/lettered fields of each register into arrays in place, returning the array sizes
+# by peripheral, register and common name
+def de_enum_fields(device: svd.parser.SVDDevice, config: config_t) -> dict[str, int]:
+    # Format fields (SVD arrays first, name-based guessing for the remaining fields)
+    field_dim: dict[str, int] = {}
+    for periph in device.peripherals:
+        if periph.registers:
+            for reg in periph.registers:
+                if reg.fields:
+                    svd_field_dim = dim_sizes(reg.fields, f'{periph.name}_{reg.name}_', config.min_field_enum_len,
+                                              config.max_field_enum_len)
+                    field_dim.update(svd_field_dim)
+                    field_cname_xlist: list[str] = [x[len(periph.name) + len(reg.name) + 2:] for x in svd_field_dim]
+                    for field1 in reg.fields:
+                        if field1.dim_name is None:
+                            def abort(common_name):
+                                field_dim[f'{periph.name}_{reg.name}_{common_name}'] = None
+                                field_cname_xlist.append(common_name)
+                                for field3 in reg.fields:
+                                    if field3.dim_name == common_name:
+                                        field3.dim_name = None
+                                        field3.dim_index = None
+                            cur_common_name: str = None
+                            field_num_list: list[int] = []
+                            for field2 in reg.fields:
+                                if field2.dim_name is None and field1.name != field2.name:
+                                    for c1, c2, i in zip(field1.name, field2.name, range(min(len(field1.name), len(field2.name)))):
+                                        if (config.field_digit_enum != (field1.name in config.field_digit_enum_exc_list) and
+                                            diff_start_digit(field1.name[i:], field2.name[i:])):
+                                            field1_cname = field1.name[:i] + field1.name[i:].lstrip('0123456789')
+                                            field2_cname = field2.name[:i] + field2.name[i:].lstrip('0123456789')
+                                            common_name = field1.name[:i] + "x" + field1.name[i:].lstrip('0123456789')
+                                            field1_num = int(re.search('[0-9]+', field1.name[i:]).group())
+                                            field2_num = int(re.search('[0-9]+', field2.name[i:]).group())
+                                            if field1_cname == field2_cname and common_name not in field_cname_xlist:
+                                                if max(field1_num, field2_num) < config.max_field_enum_len:
+                                                    cur_common_name = common_name
+                                                    field1.dim_name = common_name
+                                                    field1.dim_index = field1_num
+                                                    field2.dim_name = common_name
+                                                    field2.dim_index = field2_num
+                                                    field_num_list.append(field2_num)
+                                                    id = f'{periph.name}_{reg.name}_{common_name}'
+                                                    if field_dim.get(id) is not None:
+                                                        field_dim[id] = max(field_dim[id], field2_num + 1)
+                                                    else:
+                                                        field_num_list.append(field1_num)
+                                                        field_dim[id] = max(field1_num, field2_num) + 1
+                                                else:
+                                                    abort(common_name)
+                                    if field2.dim_name is None:
+                                        for c1, c2, i in zip(field1.name, field2.name, range(min(len(field1.name), len(field2.name)))):
+                                            if (config.field_alpha_enum != (field1.name in config.field_alpha_enum_exc_list) and
+                                                diff_start_alpha(field1.name[i:], field2.name[i:])):
+                                                field1_cname = field1.name[:i] + field1.name[(i + 1):]
+                                                field2_cname = field2.name[:i] + field2.name[(i + 1):]
+                                                common_name = field1.name[:i] + "x" + field1.name[(i + 1):]
+                                                field1_num = ord(field1.name[i].lower()) - ord('a')
+                                                field2_num = ord(field2.name[i].lower()) - ord('a')
+                                                if field1_cname == field2_cname and common_name not in field_cname_xlist:
+                                                    if max(field1_num, field2_num) < config.max_field_enum_len:
+                                                        cur_common_name = common_name
+                                                        field1.dim_name = common_name
+                                                        field1.dim_index = field1_num
+                                                        field2.dim_name = common_name
+                                                        field2.dim_index = field2_num
+                                                        field_num_list.append(field2_num)
+                                                        id = f'{periph.name}_{reg.name}_{common_name}'
+                                                        if field_dim.get(id) is not None:
+                                                            field_dim[id] = max(field_dim[id], field2_num + 1)
+                                                        else:
+                                                            field_num_list.append(field1_num)
+                                                            field_dim[id] = max(field1_num, field2_num) + 1
+                                                    else:
+                                                        abort(common_name)
+                            if len(field_num_list) > 0:
+                                if len(field_num_list) < config.min_field_enum_len:
+                                    abort(cur_common_name)
+    return field_dim
+
+# Group numbered/lettered interrupts, peripherals, registers and fields into arrays
+def de_enum_device(device: svd.parser.SVDDevice, config: config_t,
+                   in_place: bool = False) -> enum_device_t:
+    device = own_device(device, in_place)
+    isr_dim, isr_dim_name, isr_dim_index = de_enum_isrs(device, config)
+    return enum_device_t(device = device, isr_dim = isr_dim, isr_dim_name = isr_dim_name,
+                         isr_dim_index = isr_dim_index, periph_dim = de_enum_periphs(device, config),
+                         reg_dim = de_enum_registers(device, config), field_dim = de_enum_fields(device, config))
@@ -0,0 +1,88 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+from lxml import etree
+
+# Standard libraries
+import importlib.metadata
+import hashlib
+import logging
+import json
+import io
+import os
+
+# Package modules
+from .common import SVDError, write_output
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# CONFIGURATION VALUES
+###################################################################################################
+
+# Cache directory (TAL_SVD_CACHE_DIR, else the user cache directory)
+CACHE_DIR: str = os.environ.get("TAL_SVD_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "tal_svd")
+
+# Validation verdict cache file
+VALIDATION_CACHE_PATH: str = os.path.join(CACHE_DIR, "validation.json")
+
+###################################################################################################
+# VALIDATION CACHE
+###################################################################################################
+
+# Cache key of SVD contents, including the cmsis_svd version since it ships the schemas
+def validation_key(data: bytes) -> str:
+    return f'{importlib.metadata.version("cmsis-svd")}:{hashlib.sha256(data).hexdigest()}'
+
+# Read cached verdicts (key -> error message, empty if the SVD is valid)
+def read_verdicts(path: str = VALIDATION_CACHE_PATH) -> dict[str, str]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+# Store a verdict, merging with verdicts written by other processes meanwhile
+def store_verdict(key: str, error: str, path: str = VALIDATION_CACHE_PATH) -> None:
+    verdicts = read_verdicts(path)
+    verdicts[key] = error
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        write_output(json.dumps(verdicts, indent = 1), path)
+    except OSError as e:
+        log.warning(f'Failed to write validation cache {path}: {e}')
+
+# Shorten a schema error log to its first errors
+def fmt_verdict(verdict: str, max_lines: int = 3) -> str:
+    lines = verdict.splitlines()
+    if len(lines) <= max_lines:
+        return verdict
+    return "\n".join(lines[:max_lines]) + f'\n({len(lines) - max_lines} more errors)'
+
+# Parse SVD contents, validating them against the CMSIS-SVD schema once per unique content hash:
+# known-good contents skip validation and known-bad contents fail before parsing
+def parse_validated(data: bytes, path: str, cache_path: str = VALIDATION_CACHE_PATH) -> etree._ElementTree:
+    key = validation_key(data)
+    verdict = read_verdicts(cache_path).get(key)
+    if verdict:
+        raise SVDError(f'Invalid SVD file {path} (cached verdict): {fmt_verdict(verdict)}')
+    try:
+        tree = etree.parse(io.BytesIO(data))
+    except etree.XMLSyntaxError as e:
+        verdict = str(e)
+    else:
+        if verdict is not None:
+            return tree
+        try:
+            verdict = svd.SVDParser.validate_xml_tree(tree)[1]
+        except svd.parser.SVDParserValidationError as e:
+            verdict = str(e) or "unsupported schema"
+    store_verdict(key, verdict, cache_path)
+    if verdict:
+        raise SVDError(f'Invalid SVD file {path}: {fmt_verdict(verdict)}')
+    log.info(f'SVD file {os.path.basename(path)} passed schema validation.')
+    return tree
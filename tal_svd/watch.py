@@ -0,0 +1,158 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Standard libraries
+from dataclasses import dataclass, field
+import argparse
+import logging
+import time
+import os
+
+# Package modules
+from .config import config_t, load_config
+from .common import write_output
+from .fingerprint import file_stamp, template_paths, read_config_values, output_paths, fingerprint, write_stamp
+from .archive import split_pack_path
+from .load import find_svd_paths, load_devices
+from .stages import stage_cache_t, generate_staged
+from .sidecar import write_sidecar
+from .family import find_family_paths, load_family, generate_family, write_device_headers
+from .backends import emit_backends, file_sink_t, write_sinks
+from .footprint import wants_footprint, footprint_backends, write_footprint
+
+log = logging.getLogger(__name__)
+
+###################################################################################################
+# IMPLEMENTATION RESOURCES
+###################################################################################################
+
+# Generation job described by one config file
+@dataclass
+class watch_job_t:
+    config_path: str
+    config_stamp: tuple[int, int] | None = None
+    aux_stamps: list[tuple[str, tuple[int, int] | None]] = field(default_factory = list)
+    config: config_t | None = None
+    svd_paths: list[str] = field(default_factory = list)
+    svd_stamps: list[tuple[int, int] | None] = field(default_factory = list)
+    dirty: bool = True
+
+###################################################################################################
+# WATCH MODE
+###################################################################################################
+
+# Keeps parsed devices and stage results hot and regenerates outputs when their SVD files, patch
+# files, templates or config files change, re-running only the stages whose inputs changed (family
+# configs and configs with extra outputs or footprint reports are regenerated whole)
+class watcher_t:
+
+    def __init__(self, config_paths: list[str]):
+        self.jobs: list[watch_job_t] = [watch_job_t(config_path = x) for x in config_paths]
+        self.stages = stage_cache_t(max_entries = 16 * len(config_paths))
+
+    # Stamps of the patch files and template overrides of a config
+    def aux_stamps(self, config: config_t) -> list:
+        return [(x, file_stamp(x)) for x in config.patch_paths + template_paths(config.template_dir)]
+
+    # Reload config files that changed since the last poll, patch file and template edits only mark
+    # their jobs (the stages reading them are keyed by their stamps)
+    def poll_configs(self) -> None:
+        for job in self.jobs:
+            stamp = file_stamp(job.config_path)
+            if job.config is not None and stamp == job.config_stamp:
+                aux_stamps = self.aux_stamps(job.config)
+                if aux_stamps != job.aux_stamps:
+                    job.aux_stamps = aux_stamps
+                    job.dirty = True
+                continue
+            job.config_stamp = stamp
+            try:
+                job.config = load_config(job.config_path)
+                job.svd_paths = find_family_paths(job.config) if job.config.family_svd_names else find_svd_paths(job.config)
+                job.aux_stamps = self.aux_stamps(job.config)
+                job.dirty = True
+                log.info(f'Loaded config {job.config_path}.')
+            except Exception:
+                job.config = None
+                log.exception(f'Invalid config {job.config_path}.')
+
+    # Mark the jobs reading SVD files that changed since the last poll (the load stage is keyed by
+    # the file stamps, so changed files are re-parsed on the next generation)
+    def poll_devices(self) -> None:
+        for job in self.jobs:
+            if job.config is None:
+                continue
+            stamps = [file_stamp(split_pack_path(x)[0]) for x in job.svd_paths]
+            if stamps != job.svd_stamps:
+                job.svd_stamps = stamps
+                job.dirty = True
+
+    # Regenerate outputs of dirty jobs, leaving unchanged output files untouched, and record the
+    # fingerprint of their inputs (taken before generating) so later generate runs skip them
+    def run_jobs(self) -> None:
+        for job in self.jobs:
+            if not job.dirty or job.config is None:
+                continue
+            job.dirty = False
+            start = time.perf_counter()
+            try:
+                values = read_config_values(job.config_path)
+                fp = fingerprint(job.config_path, values)
+                if job.config.family_svd_names:
+                    headers = generate_family(load_family(job.config), job.config, in_place = True)
+                    write_device_headers(headers)
+                    text = write_sidecar(headers.shared, job.config)
+                elif job.config.extra_outputs or wants_footprint(job.config):
+                    backends = [job.config.style, *footprint_backends(job.config), *job.config.extra_outputs]
+                    texts = emit_backends(load_devices(job.config), job.config, backends, in_place = True)
+                    write_footprint(texts, job.config)
+                    write_sinks(texts, {x: file_sink_t(y) for x, y in job.config.extra_outputs.items()})
+                    text = write_sidecar(texts[job.config.style], job.config)
+                else:
+                    text = write_sidecar(generate_staged(job.config, self.stages), job.config)
+            except Exception:
+                log.exception(f'Generation failed for {job.config_path}.')
+                continue
+            if job.config.output_path is None:
+                continue
+            old_text: str | None = None
+            if os.path.isfile(job.config.output_path):
+                with open(job.config.output_path) as file:
+                    old_text = file.read()
+            if text != old_text:
+                write_output(text, job.config.output_path)
+                log.info(f'Wrote {job.config.output_path} in {(time.perf_counter() - start) * 1000:.0f} ms.')
+            else:
+                log.info(f'{job.config.output_path} is up to date.')
+            write_stamp(output_paths(values), fp)
+
+    # Run a single poll cycle
+    def poll(self) -> None:
+        self.poll_configs()
+        self.poll_devices()
+        self.run_jobs()
+
+    # Poll forever
+    def run(self, interval: float = 0.25) -> None:
+        while True:
+            self.poll()
+            time.sleep(interval)
+
+###################################################################################################
+# IMPLEMENTATION
+###################################################################################################
+
+def main(argv: list[str] | None = None) -> None:
+    arg_parser = argparse.ArgumentParser(description = "Regenerate headers when SVD or config files change.")
+    arg_parser.add_argument("configs", nargs = "+", help = "TOML config files")
+    arg_parser.add_argument("--interval", type = float, default = 0.25, help = "poll interval in seconds")
+    args = arg_parser.parse_args(argv)
+    logging.basicConfig(level = logging.INFO, format = "%(message)s")
+    try:
+        watcher_t(args.configs).run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+###################################################################################################
+# IMPORTS
+###################################################################################################
+
+# Requires "cmsis_svd" library -> pip install -U cmsis-svd
+import cmsis_svd as svd
+
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Standard libraries
+import copy
+import os
+
+# Package modules
+from tal_svd.config import config_t
+
+###################################################################################################
+# FIXTURES
+###################################################################################################
+
+# SVD data directory of the tests (vendor "Test") and its small device: GPIOA/GPIOB (same layout,
+# different reset values), GPIOC derived from GPIOA, TIM2/TIM3, ADC1/ADC2 sharing IRQ 18 and USART1
+DATA_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SVD_PATH: str = os.path.join(DATA_DIR, "Test", "TEST.svd")
+
+# The test device with a DMA1/DMA2 peripheral array holding register and field arrays
+DIM_SVD_PATH: str = os.path.join(DATA_DIR, "Test", "DIM.svd")
+
+@pytest.fixture(scope = "session")
+def parsed_device() -> svd.parser.SVDDevice:
+    return svd.SVDParser.for_xml_file(SVD_PATH).get_device()
+
+@pytest.fixture
+def dim_device() -> svd.parser.SVDDevice:
+    return svd.SVDParser.for_xml_file(DIM_SVD_PATH).get_device()
+
+# Fresh copy of the test device (tests may modify it)
+@pytest.fixture
+def device(parsed_device) -> svd.parser.SVDDevice:
+    return copy.deepcopy(parsed_device)
+
+@pytest.fixture
+def config() -> config_t:
+    return config_t(svd_pkg_path = DATA_DIR, vendor_name = "Test", core1_svd_name = "TEST.svd")
+
+# Write a config file for the test device in a temporary directory, returning its path
+@pytest.fixture
+def write_config(tmp_path):
+    def write(**values) -> str:
+        values = {"svd_pkg_path": DATA_DIR, "vendor_name": "Test", "core1_svd_name": "TEST.svd", **values}
+        lines = []
+        for key, value in values.items():
+            if isinstance(value, dict):
+                continue
+            lines.append(f'{key} = {value!r}'.replace("'", '"') if not isinstance(value, bool) else
+                         f'{key} = {str(value).lower()}')
+        for key, value in values.items():
+            if isinstance(value, dict):
+                lines.append(f'[{key}]')
+                lines += [f'{x} = "{y}"' for x, y in value.items()]
+        path = tmp_path / "test.toml"
+        path.write_text("\n".join(lines) + "\n")
+        return str(path)
+    return write
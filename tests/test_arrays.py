@@ -0,0 +1,28 @@
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Standard libraries
+import dataclasses
+
+# Package modules
+from tal_svd.transform import normalize_device
+from tal_svd.emit_array import dim_groups
+from tal_svd.pipeline import generate
+
+def test_dim_groups(dim_device, config):
+    device = normalize_device(dim_device, config)
+    groups = dim_groups(device.peripherals)
+    assert [x.name for x in groups["DMAx"]] == ["DMA1", "DMA2"]
+    assert "DMA1" not in [x.name for x in groups[None]]
+    registers = dim_groups(groups["DMAx"][0].registers)
+    assert [(x.name, x.dim_index) for x in registers["CCRx"]] == [("CCR0", 0), ("CCR1", 1), ("CCR2", 2), ("CCR3", 3)]
+
+# SVD arrays are flattened into their elements by every style
+@pytest.mark.parametrize("style, expected", [("macro", ["@section DMA1 ", "@section DMA2 ", "_DMA2_CCR3_REG",
+                                                        "_DMA1_ISR_TCIF3_MASK"]),
+                                             ("enum", ["DMAx_ISR_PTR[3]", "DMAx_CCRx_PTR[3][4]"]),
+                                             ("array", ["DMAx_ISR_PTR[3]", "DMAx_ISR_TCIFx_MASK[3][4]"])])
+def test_arrays(dim_device, config, style, expected):
+    header = generate([dim_device], dataclasses.replace(config, style = style))
+    for text in expected:
+        assert text in header
@@ -0,0 +1,21 @@
+# Standard libraries
+import dataclasses
+import copy
+import json
+
+# Package modules
+from tal_svd.backends import emit_backends
+from tal_svd.pipeline import generate
+
+# Outputs of one multi-backend run match the single-style runs
+def test_backends_match_single_style(device, config):
+    texts = emit_backends([copy.deepcopy(device)], config, ["macro", "enum", "array", "json"])
+    for style in ("macro", "enum", "array"):
+        assert texts[style] == generate([copy.deepcopy(device)], dataclasses.replace(config, style = style))
+    layout = json.loads(texts["json"])
+    assert [x["value"] for x in layout["interrupts"]] == [18, 28, 29, 37]
+
+def test_sinks_get_outputs(device, config):
+    received = {}
+    emit_backends([device], config, ["enum"], {"json": lambda x: received.setdefault("json", x)})
+    assert json.loads(received["json"])["device"] == "TEST"
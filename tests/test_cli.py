@@ -0,0 +1,28 @@
+# Package modules
+from tal_svd.cli import main
+
+def test_decode(write_config, capsys):
+    assert main(["decode", write_config(), "TIM2.CR1", "3", "1"]) == 0
+    assert capsys.readouterr().out == "value,UDIS,CEN\n3,1,1\n1,0,1\n"
+
+# Unknown registers and peripherals are reported without a traceback
+def test_decode_errors(write_config, tmp_path):
+    config_path = write_config()
+    dump_path = tmp_path / "dump.bin"
+    dump_path.write_bytes(bytes(8))
+    assert main(["decode", config_path, "TIM2.NOPE", "1"]) == 1
+    assert main(["dump", config_path, "NOPE", str(dump_path)]) == 1
+    assert main(["dump", config_path, "USART1", str(tmp_path / "missing.bin")]) == 1
+
+def test_lookup(write_config, capsys):
+    assert main(["lookup", write_config(), "0x40000016", "0x10000000"]) == 1
+    assert capsys.readouterr().out == "0x40000016  GPIOA ODR +2\n0x10000000  -\n"
+
+# Unconfigured cores and malformed or out of range values are reported without a traceback
+def test_lookup_errors(write_config, tmp_path):
+    config_path = write_config()
+    assert main(["lookup", config_path, "0x40000000", "--core", "2"]) == 1
+    assert main(["lookup", config_path, "zz"]) == 1
+    assert main(["lookup", config_path, "-1"]) == 1
+    assert main(["lookup", config_path, "--file", str(tmp_path / "missing.txt")]) == 1
+    assert main(["decode", config_path, "TIM2.CR1", "0x1_0000_0000_0000_0000"]) == 1
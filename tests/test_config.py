@@ -0,0 +1,21 @@
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Package modules
+from tal_svd.common import SVDError
+from tal_svd.config import load_config
+
+def test_load_config(write_config):
+    config = load_config(write_config(output_path = "out.h", style = "enum"))
+    assert (config.style, config.core1_svd_name) == ("enum", "TEST.svd")
+
+def test_unknown_key(write_config):
+    with pytest.raises(SVDError):
+        load_config(write_config(output_path = "out.h", nope = 1))
+
+# Family runs emit the macro headers only, other outputs would never be written
+@pytest.mark.parametrize("values", [{"extra_outputs": {"json": "out.json"}}, {"stage_cache": True},
+                                    {"footprint_report_path": "fp.txt"}, {"flash_budget": 0}, {"ram_budget": 100}])
+def test_family_rejects_other_outputs(write_config, values):
+    with pytest.raises(SVDError, match = "family"):
+        load_config(write_config(output_path = "out.h", family_svd_names = ["TEST.svd"], **values))
@@ -0,0 +1,15 @@
+# Package modules
+from tal_svd.diff import diff_devices
+
+def test_identical_devices(device, parsed_device):
+    assert diff_devices(parsed_device, device) == []
+
+def test_changes(device, parsed_device):
+    usart = next(x for x in device.peripherals if x.name == "USART1")
+    usart.registers = [x for x in usart.registers if x.name != "DR"]
+    usart.registers[0].reset_value = 0
+    next(x for x in device.peripherals if x.name == "TIM2").interrupts[0].value = 30
+    changes = {(x.path, x.action) for x in diff_devices(parsed_device, device)}
+    assert ("USART1.DR", "removed") in changes
+    assert ("USART1.SR", "changed") in changes
+    assert ("IRQ TIM2", "changed") in changes
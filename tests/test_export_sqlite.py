@@ -0,0 +1,16 @@
+# Standard libraries
+import sqlite3
+
+# Package modules
+from tal_svd.export_sqlite import export_sqlite
+
+# Plain name comparisons match any case and use the name indexes
+def test_name_lookup_uses_index(device, tmp_path):
+    path = str(tmp_path / "test.db")
+    export_sqlite([device], path)
+    db = sqlite3.connect(path)
+    assert db.execute("SELECT COUNT(*) FROM fields WHERE name = 'cen'").fetchone() == (2,)
+    for table in ("peripherals", "registers", "fields", "interrupts"):
+        plan = " ".join(x[-1] for x in db.execute(f'EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE name = \'EN\''))
+        assert f'USING INDEX {table}_name' in plan
+    db.close()
@@ -0,0 +1,40 @@
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Standard libraries
+import dataclasses
+
+# Package modules
+from tal_svd.common import SVDError
+from tal_svd.footprint import header_footprint, check_budgets, sparse_tables
+
+HEADER: str = """
+    /**********************************************************************************************
+     * @section TIMx Register Information
+     **********************************************************************************************/
+
+    static RW_ uint32_t* const TIMx_CR1_PTR[4] = {
+      [2] = (RW_ uint32_t* const)0x40000000U,   /** @brief Control register */
+      [3] = (RW_ uint32_t* const)0x40000400U    /** @brief Control register */
+    };
+    static const uint16_t TIMx_CR1_RST = 0x0000U;
+    static uint8_t TIMx_STATE[2][3] = {
+      [0] = {
+        [1] = 0x01U
+      }
+    };
+"""
+
+def test_header_footprint(config):
+    footprint = header_footprint(HEADER, "enum", config)
+    assert (footprint.flash, footprint.ram) == (4 * 4 + 2, 6)
+    assert footprint.periphs["TIMx"] == {"tables": 3, "flash": 18, "ram": 6}
+    assert [(x.name, x.filled, x.slots) for x in sparse_tables(footprint)] == [("TIMx_CR1_PTR", 2, 4),
+                                                                                ("TIMx_STATE", 1, 6)]
+
+def test_budgets(config):
+    footprint = header_footprint(HEADER, "enum", config)
+    check_budgets([footprint], dataclasses.replace(config, style = "enum", flash_budget = 18, ram_budget = 6))
+    check_budgets([footprint], dataclasses.replace(config, style = "macro", flash_budget = 1))
+    with pytest.raises(SVDError):
+        check_budgets([footprint], dataclasses.replace(config, style = "enum", ram_budget = 5))
@@ -0,0 +1,22 @@
+# Standard libraries
+import zipfile
+import shutil
+import os
+
+# Package modules
+from tal_svd.index import load_index
+
+from conftest import SVD_PATH
+
+# Pack members are indexed with their own size, changes are detected on the pack file
+def test_pack_member_size(tmp_path):
+    os.makedirs(tmp_path / "Test")
+    shutil.copy(SVD_PATH, tmp_path / "Test" / "TEST.svd")
+    with zipfile.ZipFile(tmp_path / "Test" / "Test.pack", "w", zipfile.ZIP_DEFLATED) as pack:
+        pack.write(SVD_PATH, "SVD/TEST.svd")
+    index = load_index(str(tmp_path))
+    entry = index.entries[os.path.join("Test", "Test.pack") + "!SVD/TEST.svd"]
+    assert entry.size == os.path.getsize(SVD_PATH)
+    assert entry.file_size == os.path.getsize(tmp_path / "Test" / "Test.pack")
+    assert index.entries[os.path.join("Test", "TEST.svd")].sha256 == entry.sha256
+    assert not load_index(str(tmp_path)).refresh()
@@ -0,0 +1,25 @@
+# Standard libraries
+import dataclasses
+
+# Package modules
+from tal_svd import load
+from tal_svd.load import chunked_parse_supported, load_svd_file, load_device
+
+from conftest import SVD_PATH
+
+def test_load_device(config):
+    device = load_device(config, "TEST.svd")
+    assert [x.name for x in device.peripherals][:3] == ["GPIOA", "GPIOB", "GPIOC"]
+
+def test_chunked_parse_supported(monkeypatch):
+    assert chunked_parse_supported()
+    monkeypatch.setitem(load.CHUNKED_PARSE_INTERNALS, "SVDParser", ("_parse_peripheral", "_missing"))
+    assert not chunked_parse_supported()
+
+# Parallel parsing falls back to SVDParser.get_device without the cmsis_svd internals it relies on
+def test_parallel_parse_fallback(config, monkeypatch):
+    monkeypatch.setitem(load.CHUNKED_PARSE_INTERNALS, "SVDParser", ("_missing",))
+    monkeypatch.setattr(load, "available_cpus", lambda: 4)
+    monkeypatch.setattr(load, "parse_chunked", None)
+    device = load_svd_file(dataclasses.replace(config, parallel_parse = True), SVD_PATH)
+    assert len(device.peripherals) == 8
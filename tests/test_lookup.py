@@ -0,0 +1,33 @@
+# Package modules
+from tal_svd.lookup import address_index_t
+from tal_svd.decode import decoder_t
+
+def test_lookup_register_and_lane(device):
+    result = address_index_t(device).lookup(0x40000016)
+    assert (result.peripheral, result.register, result.lane) == ("GPIOA", "ODR", 2)
+
+def test_lookup_derived_peripheral(device):
+    assert address_index_t(device).lookup(0x40000810).register == "IDR"
+    assert address_index_t(device).lookup(0x40000810).peripheral == "GPIOC"
+
+def test_lookup_gap_and_outside(device):
+    index = address_index_t(device)
+    gap = index.lookup(0x40000100)
+    assert (gap.peripheral, gap.register) == ("GPIOA", None)
+    assert index.lookup(0x10000000) is None
+
+def test_lookup_batch_matches_single(device):
+    index = address_index_t(device)
+    addresses = [0x40000000, 0x40001036, 0x40003004, 0x40000100, 0x20000000]
+    assert index.lookup_all(addresses) == [index.lookup(x) for x in addresses]
+
+def test_decode_trace(device):
+    fields = decoder_t(device).decode_trace("GPIOA.MODER", [0b1110, 0b0001])
+    assert fields["MODER0"].tolist() == [2, 1]
+    assert fields["MODER1"].tolist() == [3, 0]
+
+def test_decode_dump_flags_changed_fields(device):
+    dump = (0x00C00080).to_bytes(4, "little") + (0x1FF).to_bytes(4, "little")
+    rows = decoder_t(device).decode_dump("USART1", dump, 0x40003000)
+    assert ("SR", "TXE", 1, 0, True) in rows
+    assert ("DR", "DR", 0x1FF, 0, True) in rows
@@ -0,0 +1,37 @@
+# Standard libraries
+import stat
+import os
+
+# Package modules
+from tal_svd.common import write_output
+from tal_svd.fingerprint import is_up_to_date, write_stamp, write_depfile
+
+# Replaced outputs keep their mode, new ones get the umask mode (not the private temporary file mode)
+def test_write_output_mode(tmp_path):
+    path = str(tmp_path / "out.h")
+    write_output("a\n", path)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+    os.chmod(path, 0o640)
+    write_output("b\n", path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert open(path).read() == "b\n"
+
+# A stamp covers every output: a missing or modified extra output makes the run out of date
+def test_stamp_covers_all_outputs(tmp_path):
+    paths = [str(tmp_path / "out.h"), str(tmp_path / "out.json")]
+    for path in paths:
+        write_output("x\n", path)
+    write_stamp(paths, "fp")
+    assert is_up_to_date(paths, "fp")
+    assert not is_up_to_date(paths, "other")
+    write_output("changed\n", paths[1])
+    assert not is_up_to_date(paths, "fp")
+    os.remove(paths[1])
+    assert not is_up_to_date(paths, "fp")
+
+def test_depfile_lists_all_outputs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_depfile("out.d", [str(tmp_path / "out.h"), str(tmp_path / "my out.json")], [str(tmp_path / "a.toml")])
+    assert open("out.d").read() == "out.h my\\ out.json: \\\n  a.toml\n"
@@ -0,0 +1,46 @@
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Package modules
+from tal_svd.common import SVDError
+from tal_svd.patch import parse_patch, apply_patches
+
+# Apply patch file entries to a device
+def patched(device, *entries):
+    return apply_patches(device, [parse_patch(x, f'test patch {i + 1}') for i, x in enumerate(entries)])
+
+def periph(device, name):
+    return next(x for x in device.peripherals if x.name == name)
+
+def test_delete_interrupt_with_exclude(device):
+    device = patched(device, {"action": "delete", "peripheral": "*", "exclude": ["ADC1"], "interrupt": 18})
+    assert [x.value for x in periph(device, "ADC1").interrupts] == [18]
+    assert not periph(device, "ADC2").interrupts
+
+def test_rename_and_modify_register(device):
+    device = patched(device, {"action": "rename", "peripheral": "USART1", "register": "DR", "name": "TDR"},
+                     {"action": "modify", "peripheral": "USART1", "register": "TDR", "set": {"reset_value": 5}})
+    reg = next(x for x in periph(device, "USART1").registers if x.name == "TDR")
+    assert reg.reset_value == 5
+
+def test_add_field(device):
+    device = patched(device, {"action": "add", "peripheral": "GPIOA", "register": "IDR", "field": "IDR0",
+                              "set": {"bit_offset": 0, "bit_width": 1}})
+    reg = next(x for x in periph(device, "GPIOA").registers if x.name == "IDR")
+    assert [x.name for x in reg.fields] == ["IDR0"]
+
+def test_patches_leave_the_source_device_untouched(device):
+    patched(device, {"action": "delete", "peripheral": "USART1"})
+    assert any(x.name == "USART1" for x in device.peripherals)
+
+# Resolving a patch path must not turn missing child lists into empty ones (de-enumeration compares
+# them against None)
+def test_lookup_keeps_missing_lists(device):
+    for reg in periph(device, "GPIOA").registers:
+        reg.fields = None
+    device = patched(device, {"action": "delete", "peripheral": "*", "register": "*", "field": "NOPE*"})
+    assert all(x.fields is None for x in periph(device, "GPIOA").registers)
+
+def test_invalid_patch_is_rejected():
+    with pytest.raises(SVDError):
+        parse_patch({"action": "delete", "register": "CR"}, "test patch")
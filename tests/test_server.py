@@ -0,0 +1,27 @@
+# Package modules
+from tal_svd.server import query_service_t
+
+def test_queries(write_config):
+    service = query_service_t([write_config(output_path = "out.h")])
+    assert service.handle({"op": "devices"})["devices"] == ["TEST"]
+    result = service.handle({"op": "address", "address": "0x40000014"})["results"][0]
+    assert (result["peripheral"], result["register"]) == ("GPIOA", "ODR")
+    assert service.handle({"op": "decode", "register": "TIM2.CR1", "values": [3]})["fields"] == {"UDIS": [1],
+                                                                                                "CEN": [1]}
+
+# Malformed queries get a per-query error instead of failing the batch
+def test_malformed_queries(write_config):
+    service = query_service_t([write_config(output_path = "out.h")])
+    results = service.handle([{"op": "devices"}, 5, [], {"op": "register", "name": "TIM2.NOPE"}, {"op": "irq"}])
+    assert "devices" in results[0]
+    assert all("error" in x for x in results[1:])
+
+# Integers outside the 64-bit unsigned range are reported per query
+def test_out_of_range_integers(write_config):
+    service = query_service_t([write_config(output_path = "out.h")])
+    results = service.handle([{"op": "address", "address": -1}, {"op": "address", "addresses": [2 ** 64]},
+                              {"op": "decode", "register": "TIM2.CR1", "values": ["-0x1"]},
+                              {"op": "decode", "register": "TIM2.CR1", "values": [1.5]},
+                              {"op": "address", "address": 2 ** 64 - 1}])
+    assert all("error" in x for x in results[:4])
+    assert results[4] == {"results": [None]}
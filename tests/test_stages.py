@@ -0,0 +1,30 @@
+# Standard libraries
+import dataclasses
+
+# Package modules
+from tal_svd import stages
+from tal_svd.stages import stage_cache_t, generate_staged
+from tal_svd.pipeline import generate
+
+# Count the runs of the grouping stages
+def count_runs(monkeypatch) -> dict[str, int]:
+    runs = {}
+    for name in ("de_enum_periphs", "de_enum_registers", "de_enum_fields"):
+        def counted(*args, name = name, function = getattr(stages, name)):
+            runs[name] = runs.get(name, 0) + 1
+            return function(*args)
+        monkeypatch.setattr(stages, name, counted)
+    return runs
+
+def test_staged_matches_pipeline(config, device):
+    config = dataclasses.replace(config, style = "enum")
+    assert generate_staged(config, stage_cache_t()) == generate([device], config)
+
+# A field setting change only re-runs field grouping
+def test_field_change_reruns_fields_only(config, monkeypatch):
+    runs = count_runs(monkeypatch)
+    cache = stage_cache_t()
+    config = dataclasses.replace(config, style = "enum")
+    generate_staged(config, cache)
+    generate_staged(dataclasses.replace(config, field_digit_enum = False), cache)
+    assert runs == {"de_enum_periphs": 1, "de_enum_registers": 1, "de_enum_fields": 2}
@@ -0,0 +1,26 @@
+# Requires "pytest" library -> pip install -U pytest
+import pytest
+
+# Standard libraries
+import dataclasses
+
+# Package modules
+from tal_svd.common import SVDError
+from tal_svd.templates import compile_template, load_templates
+from tal_svd.pipeline import generate
+
+def test_render_rows():
+    render = compile_template("{name}:{@rows} {value:>2}{@end}\n")
+    assert render({"name": "A"}, [{"value": 1}, {"value": 10}]) == "A:  1 10\n"
+    assert compile_template("{name}:{@rows} {value:>2}{@end}\n") is render
+
+def test_unknown_value():
+    with pytest.raises(SVDError):
+        load_templates().render("banner", indent = "")
+
+# Overridden banners apply to every style
+@pytest.mark.parametrize("style", ["macro", "enum", "array"])
+def test_banner_override(device, config, tmp_path, style):
+    (tmp_path / "banner.tpl").write_text("{indent}// {title}\n")
+    header = generate([device], dataclasses.replace(config, style = style, template_dir = str(tmp_path)))
+    assert "// USART1 " in header and "@section" not in header
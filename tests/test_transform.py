@@ -0,0 +1,29 @@
+# Package modules
+from tal_svd.transform import share_layouts, index_irqs, unique_irqs, irq_description, de_enum_isrs
+from tal_svd.pipeline import generate
+
+# Peripherals differing only in reset values share one layout, with per-instance reset values
+def test_share_layouts_ignores_reset_values(device, config):
+    derived = {x.name: x.derived_from for x in share_layouts(device, config).peripherals}
+    assert derived["GPIOB"] == "GPIOA"
+    header = generate([device], config)
+    assert "0xA8000000" in header and "0x00000280" in header
+
+# A shared IRQ is emitted once
+def test_shared_irq(device):
+    irq_index = index_irqs(device)
+    assert [x.periph for x in irq_index[18]] == ["ADC1", "ADC2"]
+    assert [x[0] for x in unique_irqs(irq_index)] == [28, 29, 18, 37]
+
+# Numbered interrupts are grouped into arrays
+def test_de_enum_isrs(device, config):
+    isr_dim, isr_dim_name, isr_dim_index = de_enum_isrs(device, config)
+    assert isr_dim == {"TIMx": 4}
+    assert (isr_dim_name, isr_dim_index) == ({28: "TIMx", 29: "TIMx"}, {28: 2, 29: 3})
+
+# Interrupts described after one of the peripherals sharing them get a neutral description
+def test_shared_irq_description(device, config):
+    assert irq_description(index_irqs(device)[18], "ADC") == "ADC interrupt"
+    assert irq_description(index_irqs(device)[28], "TIM2") == "TIM2 global interrupt"
+    header = generate([device], config)
+    assert "ADC interrupt (shared by ADC1, ADC2)" in header and "ADC1 global interrupt" not in header
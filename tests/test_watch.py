@@ -0,0 +1,12 @@
+# Package modules
+from tal_svd.watch import watcher_t
+from tal_svd.fingerprint import read_config_values, output_paths, fingerprint, is_up_to_date
+
+# Watch writes refresh the stamp, so a later generate run sees the output as up to date
+def test_watch_writes_stamp(write_config, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config_path = write_config(output_path = str(tmp_path / "out.h"), style = "enum")
+    watcher_t([config_path]).poll()
+    values = read_config_values(config_path)
+    assert (tmp_path / "out.h").is_file()
+    assert is_up_to_date(output_paths(values), fingerprint(config_path, values))